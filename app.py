@@ -1,10 +1,14 @@
 # app.py
+import os
+
 import dash
-import dash_bootstrap_components as dbc
 
 from layout import create_layout
 from theme import COLORS
 from callbacks import register_callbacks
+from diagnostics import install_admin
+from metrics import install_metrics
+from tracing import install_tracing
 
 
 app = dash.Dash(
@@ -46,10 +50,26 @@ app.index_string = f"""
 </html>
 """
 
-app.layout = create_layout()
+# Served per page load so each client gets its own client-id-store token.
+app.layout = create_layout
+# Before register_callbacks, so every callback is instrumented (see /metrics)
+# and traced (see tracing.py).
+install_metrics(app)
+install_tracing(app)
 register_callbacks(app)
+# Admin memory view, only when F1D_ADMIN_TOKEN is set.
+install_admin(app)
 
 server = app.server
 
+# With gunicorn's preload_app (see gunicorn.conf.py) this runs once in the
+# master, so every forked worker starts with these sessions already loaded.
+# Spawned helper processes (figure workers) re-import this module as
+# __mp_main__ and must not load sessions of their own.
+if os.environ.get("F1D_PRELOAD_SESSIONS") and __name__ != "__mp_main__":
+    from session_jobs import preload_sessions
+
+    preload_sessions(os.environ["F1D_PRELOAD_SESSIONS"])
+
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,115 @@
+"""
+Measures per-driver telemetry preparation and feature extraction run serially
+versus on the shared driver thread pool, as the number of drivers grows.
+
+    python benchmarks/driver_parallelism.py
+    python benchmarks/driver_parallelism.py --year 2024 --event 0 --session 5 --threads 8 --repeats 5
+
+Without --year a synthetic 20-driver session is used, so runs are offline and
+reproducible. Event is an index into the supported schedule and session a
+session number, matching the dashboard dropdown values. Preparation is timed
+uncached, as on a cold dashboard request.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark parallel per-driver preparation.")
+    parser.add_argument("--year", type=int, help="Season of a real session (default: synthetic)")
+    parser.add_argument("--event", type=int, default=0)
+    parser.add_argument("--session", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic session seed")
+    parser.add_argument("--threads", type=int, help="Driver pool size (default: F1D_DRIVER_THREADS)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[2, 4, 6, 8, 10, 12, 14, 16, 18, 20],
+        help="Driver counts to measure",
+    )
+    return parser.parse_args(argv)
+
+
+def _prepare(lap):
+    from services.lap_feature_service import telemetry_features
+    from services.telemetry_service import prepare_telemetry
+
+    tel = prepare_telemetry(lap)
+    telemetry_features(tel)
+    return tel
+
+
+def _time(fn, repeats):
+    timings = []
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def run_benchmark(session, counts, repeats=3):
+    """
+    Returns [(drivers, serial_s, parallel_s)] for each driver count the
+    session can provide.
+    """
+    from services.parallel_service import map_drivers
+    from services.telemetry_service import get_fastest_laps
+
+    laps = list(get_fastest_laps(session, list(session.drivers)).values())
+    if laps:
+        # Untimed warm-up so first-call import/caching costs skew neither side.
+        _prepare(laps[0])
+
+    rows = []
+    for count in counts:
+        if count > len(laps):
+            break
+        subset = laps[:count]
+        serial = _time(lambda: [_prepare(lap) for lap in subset], repeats)
+        parallel = _time(lambda: map_drivers(_prepare, subset), repeats)
+        rows.append((count, serial, parallel))
+    return rows
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    import services.parallel_service as parallel_service
+
+    if args.threads is not None:
+        parallel_service.DRIVER_THREADS = max(1, args.threads)
+
+    if args.year is None:
+        from synthetic_session import make_synthetic_session
+
+        session = make_synthetic_session(drivers=max(args.counts), laps=20, seed=args.seed)
+    else:
+        from data_engine import load_session
+
+        session = load_session(args.year, args.event, args.session)
+    rows = run_benchmark(session, args.counts, args.repeats)
+    if not rows:
+        print("Session has too few drivers with a timed lap.")
+        return 1
+
+    print(f"{parallel_service.DRIVER_THREADS} driver thread(s), median of {args.repeats} run(s)")
+    print(f"{'drivers':>8}{'serial s':>11}{'pool s':>9}{'speedup':>9}")
+    for count, serial, parallel in rows:
+        speedup = serial / parallel if parallel > 0 else 0.0
+        print(f"{count:>8}{serial:>11.3f}{parallel:>9.3f}{speedup:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
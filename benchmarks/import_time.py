@@ -0,0 +1,120 @@
+"""
+Measures how long it takes to import app.py and get the WSGI ``server`` ready,
+with a breakdown of where the import time goes.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 5 --top 20 --target 1.0
+
+Each run uses a fresh interpreter, so results reflect a cold worker start.
+The timed runs import app plainly; the breakdown comes from one extra run
+under ``-X importtime``, whose instrumentation adds roughly a third to the
+total. Dash imports IPython for its Jupyter support when it is installed
+(it is not in requirements.txt), which adds about 0.2s. Exits non-zero when
+the median exceeds --target.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = (
+    "import time; started = time.perf_counter(); "
+    "import app; app.server; "
+    "print('F1D_READY', time.perf_counter() - started)"
+)
+
+
+def _run_once(importtime=False):
+    command = [sys.executable, "-X", "importtime", "-c", _PROBE] if importtime else [sys.executable, "-c", _PROBE]
+    result = subprocess.run(
+        command,
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    ready = None
+    for line in result.stdout.splitlines():
+        if line.startswith("F1D_READY"):
+            ready = float(line.split()[1])
+
+    imports = []
+    for line in result.stderr.splitlines():
+        parsed = _parse_importtime_line(line)
+        if parsed is not None:
+            imports.append(parsed)
+    return ready, imports
+
+
+def _parse_importtime_line(line):
+    # "import time:  self [us] | cumulative | imported package"
+    if not line.startswith("import time:"):
+        return None
+    fields = line.split(":", 1)[1].split("|")
+    if len(fields) != 3 or not fields[0].strip().isdigit():
+        return None
+    raw_name = fields[2].rstrip()
+    depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+    return raw_name.strip(), depth, int(fields[0]), int(fields[1])
+
+
+def _print_breakdown(imports, top):
+    by_package = defaultdict(int)
+    for name, _, self_us, _ in imports:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"\nSelf time by top-level package (top {top}):")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {package:<32}{self_us / 1000:>9.1f} ms")
+
+    # -X importtime lists children before their parent, so app's direct
+    # imports are the depth-1 entries since the previous top-level import.
+    app_at = next(
+        (idx for idx, (name, depth, _, _) in enumerate(imports) if name == "app" and depth == 0),
+        None,
+    )
+    if app_at is None:
+        return
+    children = []
+    for name, depth, _, cumulative_us in reversed(imports[:app_at]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((name, cumulative_us))
+
+    print("\nCumulative time of app.py's direct imports:")
+    for name, cumulative_us in reversed(children):
+        print(f"  {name:<32}{cumulative_us / 1000:>9.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark app.py import time.")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--target", type=float, default=1.0, help="Target seconds for the median run")
+    args = parser.parse_args(argv)
+
+    timings = [_run_once()[0] for _ in range(max(1, args.runs))]
+    _, imports = _run_once(importtime=True)
+
+    median = statistics.median(timings)
+    print(
+        f"server ready in {median:.3f}s median "
+        f"(min {min(timings):.3f}s, max {max(timings):.3f}s, {len(timings)} runs)"
+    )
+    _print_breakdown(imports, args.top)
+
+    if median > args.target:
+        print(f"\nSlower than target of {args.target:.2f}s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
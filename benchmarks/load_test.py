@@ -0,0 +1,582 @@
+"""
+Replays dashboard user flows as concurrent HTTP clients against a running
+server's /_dash-update-component endpoint, and reports throughput, latency
+percentiles per callback and the server's memory growth.
+
+    F1D_SYNTHETIC=1 gunicorn app:server
+    python benchmarks/load_test.py --url http://127.0.0.1:8050 --users 16 --duration 300
+
+    python benchmarks/load_test.py --serve --users 4 --duration 60
+
+Each simulated user opens the page, picks a season, event and session, waits
+for the session to load, picks drivers, scrubs through laps and hovers the
+telemetry overlay, with --think seconds between actions, then starts over.
+Callbacks fire the way the browser fires them: whenever one of their inputs
+changes, cascading through the outputs they return.
+
+With F1D_SYNTHETIC=1 the server generates sessions (synthetic_session.py)
+instead of fetching them, so no network is needed; --serve starts such a
+server (single process, threaded Werkzeug) on a free local port for the run.
+
+Memory growth comes from the process_resident_memory_bytes gauge on /metrics,
+sampled every --sample-interval seconds. Under gunicorn each scrape reaches
+whichever worker accepts it; run with F1D_WEB_WORKERS=1 for a clean curve.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD_TEST_FORMAT_VERSION = 1
+
+UPDATE_ROUTE = "/_dash-update-component"
+
+# Callbacks by their first output, labelled with the callback names /metrics
+# uses. Callbacks missing here are labelled by that output.
+CALLBACK_LABELS = {
+    "gp-dd.options": "update_gp_dropdown",
+    "session-dd.options": "update_sessions",
+    "archive-session-title.children": "update_archive_context",
+    "session-job-store.data": "sync_session_load",
+    "drivers-dd.options": "update_drivers",
+    "lap-driver-buttons.children": "sync_lap_driver_buttons",
+    "telemetry-overlay-graph.figure": "update_shared_overlay_graph",
+    "overlay-driver-kpis.children": "update_dashboard",
+    "mini-track-map.figure": "update_mini_map",
+    "lap-input.max": "update_lap_slider",
+    "lap-input.value": "sync_lap_controls",
+    "full-session-telemetry-graph.figure": "update_full_session_graph",
+    "lap-time-evolution-graph.figure": "update_lap_time_evolution",
+}
+
+PERCENTILES = [50, 95, 99]
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Load-test the dashboard callbacks.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running server, e.g. http://127.0.0.1:8050")
+    target.add_argument("--serve", action="store_true", help="Start a synthetic-data server for the run")
+    parser.add_argument("--users", type=int, default=8, help="Concurrent simulated users")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to run")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="Seconds over which users start")
+    parser.add_argument("--think", type=float, default=0.5, help="Mean pause between user actions")
+    parser.add_argument("--scrubs", type=int, default=5, help="Laps stepped through per flow")
+    parser.add_argument("--hovers", type=int, default=8, help="Overlay hovers per flow")
+    parser.add_argument("--years", type=int, nargs="+", help="Seasons to pick from (default: all offered)")
+    parser.add_argument("--sample-interval", type=float, default=5.0, help="Seconds between memory samples")
+    parser.add_argument("--timeout", type=float, default=180.0, help="Per-request and session-load timeout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+class _FlowStopped(Exception):
+    pass
+
+
+class LoadStats:
+    """
+    Thread-safe request log: latency, status and response size per callback.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.response_bytes = defaultdict(int)
+        self.flows = 0
+        self.failed_flows = 0
+
+    def record(self, label, seconds, ok, size):
+        with self._lock:
+            self.latencies[label].append(seconds)
+            self.response_bytes[label] += size
+            if not ok:
+                self.errors[label] += 1
+
+    def flow_done(self, ok):
+        with self._lock:
+            if ok:
+                self.flows += 1
+            else:
+                self.failed_flows += 1
+
+
+class DashClient:
+    """
+    Minimal stand-in for the Dash renderer: keeps every component property,
+    fires the callbacks whose inputs changed and applies what they return,
+    cascading until nothing changes.
+    """
+
+    def __init__(self, http, base_url, dependencies, stats, timeout):
+        self.http = http
+        self.base_url = base_url
+        self.stats = stats
+        self.timeout = timeout
+        self.props = {}
+        self.callbacks = []
+        self._by_input = defaultdict(list)
+
+        for dependency in dependencies:
+            outputs = _split_outputs(dependency["output"])
+            # Pattern-matching outputs only follow button clicks, which the
+            # flows do not replay.
+            if any(_is_pattern(component_id) for component_id, _ in outputs):
+                continue
+            index = len(self.callbacks)
+            self.callbacks.append(
+                {
+                    "dependency": dependency,
+                    "label": CALLBACK_LABELS.get(".".join(outputs[0]), ".".join(outputs[0])),
+                    "outputs": outputs,
+                    "inputs": [(item["id"], item["property"]) for item in dependency["inputs"]],
+                }
+            )
+            for key in self.callbacks[index]["inputs"]:
+                self._by_input[key].append(index)
+
+    def open_page(self):
+        started = time.perf_counter()
+        response = self.http.get(self.base_url + "/_dash-layout", timeout=self.timeout)
+        self.stats.record("page_layout", time.perf_counter() - started, response.ok, len(response.content))
+        response.raise_for_status()
+        self.props = {}
+        _collect_props(response.json(), self.props)
+
+    def get(self, component_id, prop, default=None):
+        return self.props.get((component_id, prop), default)
+
+    def set(self, changes):
+        """
+        Sets component properties as a user would and runs the callbacks
+        that depend on them.
+        """
+        self.props.update(changes)
+        pending = {}
+        for key in changes:
+            for index in self._by_input.get(key, ()):
+                pending.setdefault(index, set()).add(key)
+
+        while pending:
+            # A callback whose inputs are still being produced by another
+            # pending callback waits for it, as in the browser.
+            produced = set()
+            for index in pending:
+                produced.update(self.callbacks[index]["outputs"])
+            ready = [
+                index
+                for index in pending
+                if not (set(self.callbacks[index]["inputs"]) & (produced - set(self.callbacks[index]["outputs"])))
+            ] or list(pending)
+
+            for index in ready:
+                for key in self._call(index, pending.pop(index)):
+                    # As in Dash, a callback's own outputs do not re-trigger it.
+                    for dependent in self._by_input.get(key, ()):
+                        if dependent != index:
+                            pending.setdefault(dependent, set()).add(key)
+
+    def _call(self, index, triggers):
+        callback = self.callbacks[index]
+        dependency = callback["dependency"]
+        outputs = [{"id": component_id, "property": prop} for component_id, prop in callback["outputs"]]
+        body = {
+            "output": dependency["output"],
+            "outputs": outputs if dependency["output"].startswith("..") else outputs[0],
+            "inputs": [self._value(item) for item in dependency["inputs"]],
+            "state": [self._value(item) for item in dependency["state"]],
+            "changedPropIds": [f"{component_id}.{prop}" for component_id, prop in sorted(triggers)],
+        }
+
+        started = time.perf_counter()
+        response = self.http.post(self.base_url + UPDATE_ROUTE, json=body, timeout=self.timeout)
+        elapsed = time.perf_counter() - started
+        # 204: the callback raised PreventUpdate.
+        ok = response.status_code in (200, 204)
+        self.stats.record(callback["label"], elapsed, ok, len(response.content))
+        if response.status_code != 200:
+            return set()
+
+        changed = set()
+        for component_id, values in response.json().get("response", {}).items():
+            for prop, value in values.items():
+                self.props[(component_id, prop)] = value
+                changed.add((component_id, prop))
+        return changed
+
+    def _value(self, item):
+        if _is_pattern(item["id"]):
+            return []
+        value = {"id": item["id"], "property": item["property"]}
+        if (item["id"], item["property"]) in self.props:
+            value["value"] = self.props[(item["id"], item["property"])]
+        return value
+
+
+class UserFlow:
+    """
+    One simulated user repeating the pick-session, compare-drivers,
+    scrub-laps and hover-overlay flow until the deadline.
+    """
+
+    def __init__(self, base_url, dependencies, stats, args, seed, deadline):
+        import requests
+
+        self.http = requests.Session()
+        self.client = DashClient(self.http, base_url, dependencies, stats, args.timeout)
+        self.stats = stats
+        self.args = args
+        self.rng = random.Random(seed)
+        self.deadline = deadline
+
+    def run(self):
+        while time.monotonic() < self.deadline:
+            try:
+                self.run_flow()
+                self.stats.flow_done(True)
+            except _FlowStopped:
+                return
+            except Exception:
+                self.stats.flow_done(False)
+                self._pause(1.0)
+
+    def run_flow(self):
+        client = self.client
+        client.open_page()
+
+        years = [option["value"] for option in client.get("year-dd", "options", [])]
+        if self.args.years:
+            years = [year for year in years if year in self.args.years] or list(self.args.years)
+        self._act({("year-dd", "value"): self.rng.choice(years)})
+        self._act({("gp-dd", "value"): self._pick_option("gp-dd")})
+        self._act({("session-dd", "value"): self._pick_option("session-dd")})
+        self._wait_for_session()
+
+        options = [option["value"] for option in client.get("drivers-dd", "options") or []]
+        if not options:
+            raise RuntimeError("Session loaded without drivers")
+        count = min(len(options), self.rng.choice([1, 2, 2, 2, 3]))
+        self._act({("drivers-dd", "value"): self.rng.sample(options, count)})
+
+        max_lap = int(client.get("lap-input", "max") or 1)
+        lap = int(client.get("lap-input", "value") or 1)
+        for _ in range(self.args.scrubs):
+            lap = min(max_lap, max(1, lap + self.rng.choice([-1, 1, 1, 2])))
+            self._act({("lap-input", "value"): lap}, think=0.5)
+
+        distances = _stored_distances(client.get("telemetry-store", "data"))
+        for _ in range(self.args.hovers if distances else 0):
+            hover = {"points": [{"curveNumber": 0, "x": self.rng.choice(distances)}]}
+            self._act({("telemetry-overlay-graph", "hoverData"): hover}, think=0.25)
+
+    def _act(self, changes, think=1.0):
+        self._pause(self.args.think * think * self.rng.uniform(0.5, 1.5))
+        self.client.set(changes)
+
+    def _pick_option(self, component_id):
+        options = self.client.get(component_id, "options") or []
+        if not options:
+            raise RuntimeError(f"No options offered for {component_id}")
+        return self.rng.choice(options)["value"]
+
+    def _wait_for_session(self):
+        # Stands in for the session-load-poll dcc.Interval while it is enabled.
+        client = self.client
+        interval = (client.get("session-load-poll", "interval") or 500) / 1000.0
+        started = time.monotonic()
+        while client.get("session-load-poll", "disabled") is False:
+            if time.monotonic() - started > self.args.timeout:
+                raise RuntimeError("Session load timed out")
+            self._pause(interval)
+            ticks = (client.get("session-load-poll", "n_intervals") or 0) + 1
+            client.set({("session-load-poll", "n_intervals"): ticks})
+        if client.get("session-ready-store", "data") is None:
+            raise RuntimeError("Session load failed")
+
+    def _pause(self, seconds):
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise _FlowStopped()
+        time.sleep(min(seconds, remaining))
+
+
+class MemorySampler(threading.Thread):
+    """
+    Samples the server's resident memory from /metrics until stopped.
+    """
+
+    def __init__(self, base_url, interval):
+        super().__init__(daemon=True)
+        self.base_url = base_url
+        self.interval = interval
+        self.samples = []
+        self._stop_event = threading.Event()
+
+    def run(self):
+        import requests
+
+        started = time.monotonic()
+        while True:
+            rss = _read_resident_bytes(requests, self.base_url)
+            if rss is not None:
+                self.samples.append((time.monotonic() - started, rss))
+            if self._stop_event.wait(self.interval):
+                break
+        rss = _read_resident_bytes(requests, self.base_url)
+        if rss is not None:
+            self.samples.append((time.monotonic() - started, rss))
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def run_load_test(base_url, args):
+    """
+    Runs args.users concurrent flows against base_url for args.duration
+    seconds and returns the summary written by --output.
+    """
+    import requests
+
+    dependencies = requests.get(base_url + "/_dash-dependencies", timeout=args.timeout).json()
+    stats = LoadStats()
+    sampler = MemorySampler(base_url, args.sample_interval)
+    sampler.start()
+
+    started = time.monotonic()
+    deadline = started + args.duration
+    threads = []
+    for number in range(args.users):
+        user = UserFlow(base_url, dependencies, stats, args, args.seed * 1000 + number, deadline)
+        thread = threading.Thread(target=user.run, name=f"user-{number}", daemon=True)
+        threads.append(thread)
+        thread.start()
+        if args.users > 1 and number < args.users - 1:
+            time.sleep(max(0.0, args.ramp_up) / (args.users - 1))
+
+    for thread in threads:
+        # Requests already in flight at the deadline may take up to --timeout.
+        thread.join(max(0.0, deadline - time.monotonic()) + args.timeout)
+    elapsed = time.monotonic() - started
+    sampler.stop()
+    return summarise(stats, sampler.samples, elapsed, args)
+
+
+def summarise(stats, memory_samples, elapsed, args):
+    callbacks = {}
+    all_latencies = []
+    for label, latencies in sorted(stats.latencies.items()):
+        all_latencies.extend(latencies)
+        callbacks[label] = _latency_summary(latencies, stats.errors[label], elapsed)
+        callbacks[label]["mean_kib"] = stats.response_bytes[label] / len(latencies) / 1024.0
+
+    memory = {"samples": [[round(at, 2), rss] for at, rss in memory_samples]}
+    if memory_samples:
+        first, last = memory_samples[0], memory_samples[-1]
+        span_minutes = max(last[0] - first[0], 1e-9) / 60.0
+        memory.update(
+            start_bytes=first[1],
+            end_bytes=last[1],
+            peak_bytes=max(rss for _, rss in memory_samples),
+            growth_bytes=last[1] - first[1],
+            growth_bytes_per_minute=(last[1] - first[1]) / span_minutes if len(memory_samples) > 1 else 0.0,
+        )
+
+    return {
+        "format": LOAD_TEST_FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "users": args.users,
+        "duration_seconds": elapsed,
+        "think_seconds": args.think,
+        "seed": args.seed,
+        "flows": stats.flows,
+        "failed_flows": stats.failed_flows,
+        "requests": len(all_latencies),
+        "requests_per_second": len(all_latencies) / elapsed if elapsed else 0.0,
+        "overall": _latency_summary(all_latencies, sum(stats.errors.values()), elapsed),
+        "callbacks": callbacks,
+        "memory": memory,
+    }
+
+
+def print_report(summary):
+    duration = summary["duration_seconds"]
+    print(
+        f"\n{summary['users']} users for {duration:.1f} s: {summary['requests']} requests "
+        f"({summary['requests_per_second']:.1f}/s), {summary['flows']} flows "
+        f"({summary['flows'] / duration * 60.0 if duration else 0.0:.1f}/min), "
+        f"{summary['failed_flows']} failed"
+    )
+
+    header = f"\n{'callback':<30}{'calls':>7}{'errors':>8}{'req/s':>8}"
+    header += "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES) + f"{'max ms':>10}{'KiB':>9}"
+    print(header)
+    rows = sorted(summary["callbacks"].items(), key=lambda item: -item[1]["calls"])
+    rows.append(("all", summary["overall"]))
+    for label, row in rows:
+        line = f"{label:<30}{row['calls']:>7}{row['errors']:>8}{row['per_second']:>8.2f}"
+        line += "".join(f"{row[f'p{p}'] * 1000:>10.1f}" for p in PERCENTILES)
+        line += f"{row['max'] * 1000:>10.1f}"
+        line += f"{row['mean_kib']:>9.1f}" if "mean_kib" in row else f"{'':>9}"
+        print(line)
+
+    memory = summary["memory"]
+    if not memory["samples"]:
+        print("\nNo memory samples (is /metrics enabled on the server?)")
+        return
+    print("\nServer resident memory (process_resident_memory_bytes):")
+    samples = memory["samples"]
+    step = max(1, len(samples) // 10)
+    for at, rss in samples[::step] + ([samples[-1]] if (len(samples) - 1) % step else []):
+        print(f"  {at:>8.1f} s {rss / 2**20:>10.1f} MiB")
+    print(
+        f"  growth {memory['growth_bytes'] / 2**20:+.1f} MiB "
+        f"({memory['growth_bytes_per_minute'] / 2**20:+.1f} MiB/min), "
+        f"peak {memory['peak_bytes'] / 2**20:.1f} MiB"
+    )
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    server = None
+    base_url = (args.url or "").rstrip("/")
+    if args.serve:
+        server, base_url = _start_server(args.timeout)
+        print(f"Started synthetic-data server at {base_url}")
+    try:
+        summary = run_load_test(base_url, args)
+    finally:
+        if server is not None:
+            _stop_server(server)
+
+    print_report(summary)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2, sort_keys=True)
+        print(f"\nWrote results to {args.output}")
+    return 0 if summary["overall"]["errors"] == 0 and summary["failed_flows"] == 0 else 1
+
+
+def _latency_summary(latencies, errors, elapsed):
+    ordered = sorted(latencies)
+    summary = {
+        "calls": len(ordered),
+        "errors": errors,
+        "per_second": len(ordered) / elapsed if elapsed else 0.0,
+        "max": ordered[-1] if ordered else 0.0,
+    }
+    for percentile in PERCENTILES:
+        summary[f"p{percentile}"] = _percentile(ordered, percentile)
+    return summary
+
+
+def _percentile(ordered, percentile):
+    # Nearest-rank percentile of an already sorted list.
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(percentile / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _split_outputs(output):
+    # Multi-output callbacks are encoded as "..a.prop...b.prop..".
+    parts = output[2:-2].split("...") if output.startswith("..") else [output]
+    return [tuple(part.rsplit(".", 1)) for part in parts]
+
+
+def _is_pattern(component_id):
+    return component_id.startswith("{")
+
+
+def _collect_props(node, props):
+    if isinstance(node, list):
+        for item in node:
+            _collect_props(item, props)
+        return
+    if not isinstance(node, dict) or "props" not in node:
+        return
+    node_props = node["props"]
+    component_id = node_props.get("id")
+    if isinstance(component_id, str):
+        for prop, value in node_props.items():
+            if prop != "id":
+                props[(component_id, prop)] = value
+    _collect_props(node_props.get("children"), props)
+
+
+def _stored_distances(store):
+    telemetry = (store or {}).get("telemetry") or {}
+    for records in telemetry.values():
+        distances = [row["Distance"] for row in records if row.get("Distance") is not None]
+        if distances:
+            return distances
+    return []
+
+
+def _read_resident_bytes(requests, base_url):
+    try:
+        text = requests.get(base_url + "/metrics", timeout=10).text
+    except requests.RequestException:
+        return None
+    for line in text.splitlines():
+        if line.startswith("process_resident_memory_bytes "):
+            return int(float(line.split()[1]))
+    return None
+
+
+def _stop_server(process):
+    # SIGINT lets the server exit normally, so its figure worker processes
+    # are shut down with it.
+    process.send_signal(signal.SIGINT)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _start_server(timeout):
+    import requests
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    code = (
+        "import logging; logging.getLogger('werkzeug').setLevel(logging.WARNING); "
+        f"from app import server; server.run(host='127.0.0.1', port={port}, threaded=True)"
+    )
+    env = dict(os.environ, F1D_SYNTHETIC="1")
+    process = subprocess.Popen([sys.executable, "-c", code], cwd=REPO_ROOT, env=env)
+    base_url = f"http://127.0.0.1:{port}"
+
+    started = time.monotonic()
+    while time.monotonic() - started < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            if requests.get(base_url + "/_dash-dependencies", timeout=5).ok:
+                return process, base_url
+        except requests.RequestException:
+            pass
+        time.sleep(0.25)
+    _stop_server(process)
+    raise RuntimeError("Server did not start in time")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""
+Times and memory-profiles the dashboard's hot paths on synthetic sessions, for
+each combination of driver count and session length.
+
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json --threshold 0.2
+    python benchmarks/run_benchmarks.py --drivers 2 5 --lengths sprint --only build_mini_track
+
+Timings are the median of --repeats runs. Peak memory comes from one extra
+run under tracemalloc, which only counts Python-level allocations (NumPy and
+pandas buffers included). With --compare, results slower or heavier than the
+baseline by more than --threshold are flagged and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+BENCHMARK_FORMAT_VERSION = 1
+
+DRIVER_COUNTS = [2, 5, 10, 20]
+
+# Laps per driver: a sprint distance versus a full Grand Prix distance.
+SESSION_LENGTHS = {"sprint": 19, "race": 57}
+
+HOT_PATHS = [
+    "prepare_telemetry",
+    "compute_binary_delta",
+    "resolve_fastest_laps",
+    "compute_comparison_kpi_rows",
+    "_build_race_results_table",
+    "build_shared_overlay_figure",
+    "build_binary_delta_track",
+    "build_mini_track",
+    "create_lap_time_evolution_figure",
+]
+
+# Differences below these are noise, whatever the ratio.
+MIN_SECONDS_DELTA = 0.002
+MIN_PEAK_KIB_DELTA = 64.0
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark services and figure builders.")
+    parser.add_argument("--drivers", type=int, nargs="+", default=DRIVER_COUNTS)
+    parser.add_argument(
+        "--lengths",
+        nargs="+",
+        choices=sorted(SESSION_LENGTHS),
+        default=list(SESSION_LENGTHS),
+    )
+    parser.add_argument("--only", nargs="+", choices=HOT_PATHS, help="Benchmark only these hot paths")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic session seed")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown/growth flagged as a regression (0.2 = 20%%)",
+    )
+    return parser.parse_args(argv)
+
+
+def build_fixture(drivers, laps, seed=0):
+    """
+    Builds a synthetic session and the inputs each hot path is called with,
+    mirroring what the dashboard callbacks pass.
+    """
+    import pandas as pd
+
+    from services.fastest_lap_service import resolve_fastest_laps
+    from services.lap_index_service import LapIndex
+    from services.session_telemetry_services import get_lap_time_evolution_data
+    from services.style_service import extract_driver_styles
+    from services.telemetry_service import compute_binary_delta, prepare_telemetry
+    from services.track_geometry_service import get_track_geometry
+    from synthetic_session import make_synthetic_session
+
+    session = make_synthetic_session(drivers=drivers, laps=laps, seed=seed)
+    selected = list(session.drivers)
+    fastest_laps, _, _ = resolve_fastest_laps(session, selected)
+    driver_tel = {drv: pd.DataFrame(prepare_telemetry(lap)) for drv, lap in fastest_laps.items()}
+
+    pair = list(fastest_laps)[:2]
+    pair_laps = {drv: fastest_laps[drv] for drv in pair}
+    pair_tel = {drv: driver_tel[drv] for drv in pair}
+    lap_times = [pair_laps[drv]["LapTime"].total_seconds() for drv in pair]
+    delta_tel, faster_index = compute_binary_delta(pair_tel[pair[0]], pair_tel[pair[1]], *lap_times)
+
+    evolution = []
+    for drv in pair:
+        df, fastest_idx = get_lap_time_evolution_data(session.laps.pick_drivers(drv))
+        evolution.append({"driver": drv, "df": df, "fastest_idx": fastest_idx})
+
+    reference_tel = driver_tel[pair[0]]
+    return {
+        "session": session,
+        "selected": selected,
+        "fastest_laps": fastest_laps,
+        "driver_tel": driver_tel,
+        "pair": pair,
+        "pair_laps": pair_laps,
+        "pair_tel": pair_tel,
+        "lap_times": lap_times,
+        "delta_tel": delta_tel,
+        "faster_index": faster_index,
+        "styles": extract_driver_styles(session, selected),
+        "lap_indexes": {drv: LapIndex.from_telemetry(tel) for drv, tel in driver_tel.items()},
+        "track_geometry": get_track_geometry(session),
+        "reference_distance": float(reference_tel["Distance"].max()) / 2.0,
+        "evolution": evolution,
+    }
+
+
+def hot_path_calls(fixture):
+    """
+    Returns {hot path name: zero-argument callable} for a fixture.
+    """
+    from callbacks import _build_race_results_table
+    from figures.lap_time_evolution_figure import create_lap_time_evolution_figure
+    from figures.mini_track_figure import build_mini_track
+    from figures.telemetry_figure import build_shared_overlay_figure
+    from figures.track_figure import build_binary_delta_track
+    from services.fastest_lap_service import resolve_fastest_laps
+    from services.kpi_service import compute_comparison_kpi_rows
+    from services.telemetry_service import compute_binary_delta, prepare_telemetry
+
+    f = fixture
+    pair = f["pair"]
+    return {
+        "prepare_telemetry": lambda: [prepare_telemetry(lap) for lap in f["fastest_laps"].values()],
+        "compute_binary_delta": lambda: compute_binary_delta(
+            f["pair_tel"][pair[0]], f["pair_tel"][pair[1]], *f["lap_times"]
+        ),
+        "resolve_fastest_laps": lambda: resolve_fastest_laps(f["session"], f["selected"]),
+        "compute_comparison_kpi_rows": lambda: compute_comparison_kpi_rows(
+            f["session"], f["pair_laps"], f["pair_tel"]
+        ),
+        "_build_race_results_table": lambda: _build_race_results_table(f["session"]),
+        "build_shared_overlay_figure": lambda: build_shared_overlay_figure(
+            f["driver_tel"], f["styles"], selected_order=f["selected"]
+        ),
+        "build_binary_delta_track": lambda: build_binary_delta_track(
+            f["delta_tel"],
+            pair[0],
+            pair[1],
+            f["faster_index"],
+            f["session"],
+            track_geometry=f["track_geometry"],
+        ),
+        "build_mini_track": lambda: build_mini_track(
+            f["lap_indexes"],
+            f["styles"],
+            f["reference_distance"],
+            track_geometry=f["track_geometry"],
+        ),
+        "create_lap_time_evolution_figure": lambda: create_lap_time_evolution_figure(
+            f["evolution"], f["session"]
+        ),
+    }
+
+
+def measure(fn, repeats):
+    """
+    Returns median/min wall time over repeats runs and the tracemalloc peak
+    of one further run.
+    """
+    # Untimed first call: lazy imports and first-use caches.
+    fn()
+    timings = []
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": statistics.median(timings),
+        "min_seconds": min(timings),
+        "peak_kib": peak / 1024.0,
+    }
+
+
+def run_benchmarks(drivers=DRIVER_COUNTS, lengths=SESSION_LENGTHS, only=None, repeats=5, seed=0):
+    """
+    Returns {"<length>/<drivers>/<hot path>": measurement} for the matrix.
+    """
+    results = {}
+    for length in lengths:
+        for count in drivers:
+            fixture = build_fixture(count, SESSION_LENGTHS[length], seed=seed)
+            for name, fn in hot_path_calls(fixture).items():
+                if only and name not in only:
+                    continue
+                key = f"{length}/{count}/{name}"
+                results[key] = measure(fn, repeats)
+                _print_row(key, results[key])
+    return results
+
+
+def compare_results(current, baseline, threshold):
+    """
+    Returns [(key, metric, baseline value, current value)] for every result
+    that regressed by more than threshold.
+    """
+    regressions = []
+    for key, result in current.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        for metric, floor in (("seconds", MIN_SECONDS_DELTA), ("peak_kib", MIN_PEAK_KIB_DELTA)):
+            old, new = before.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if new - old > floor and new > old * (1.0 + threshold):
+                regressions.append((key, metric, old, new))
+    return regressions
+
+
+def _print_row(key, result):
+    print(f"  {key:<58}{result['seconds'] * 1000:>10.2f} ms{result['peak_kib']:>12.0f} KiB")
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    print(f"{'benchmark':<60}{'median':>11}{'peak':>14}")
+    results = run_benchmarks(
+        drivers=args.drivers,
+        lengths=args.lengths,
+        only=args.only,
+        repeats=args.repeats,
+        seed=args.seed,
+    )
+
+    if args.output:
+        payload = {
+            "format": BENCHMARK_FORMAT_VERSION,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+        print(f"\nWrote {len(results)} result(s) to {args.output}")
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare, "r", encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    if baseline.get("format") != BENCHMARK_FORMAT_VERSION:
+        print(f"\nBaseline {args.compare} has an unsupported format")
+        return 2
+
+    regressions = compare_results(results, baseline["results"], args.threshold)
+    if not regressions:
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.compare}")
+        return 0
+
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%} against {args.compare}:")
+    for key, metric, old, new in regressions:
+        unit = "ms" if metric == "seconds" else "KiB"
+        scale = 1000.0 if metric == "seconds" else 1.0
+        print(f"  {key:<58}{metric:<10}{old * scale:>10.2f} -> {new * scale:.2f} {unit} ({new / old - 1.0:+.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
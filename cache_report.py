@@ -0,0 +1,71 @@
+# cache_report.py
+"""
+Reports CACHE_DIR disk usage per season and runs cache maintenance on demand.
+
+    python cache_report.py
+    python cache_report.py --compact --max-gb 20
+
+--compact prunes the HTTP cache, old derived versions, job statuses and
+interrupted writes; --max-gb additionally evicts the least recently used
+sessions until the cache fits. Sessions used within the eviction grace
+period (recently loaded by a running dashboard) are kept.
+"""
+import argparse
+import json
+import sys
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Report and trim the F1 dashboard disk cache.")
+    parser.add_argument("--compact", action="store_true", help="Compact the cache before reporting")
+    parser.add_argument(
+        "--max-gb",
+        type=float,
+        help="Evict least recently used sessions beyond this size (default: F1D_CACHE_MAX_BYTES)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def _print_report(report):
+    parts = ["fastf1", "snapshots", "telemetry", "derived", "total"]
+    print(f"{'season':<8}" + "".join(f"{part:>12}" for part in parts))
+    for season, usage in report["seasons"].items():
+        print(f"{season:<8}" + "".join(f"{_mb(usage.get(part, 0)):>12}" for part in parts))
+    print()
+    for name, size in report["shared"].items():
+        print(f"{name:<12}{_mb(size):>12}")
+    limit = _mb(report["max_bytes"]) if report["max_bytes"] else "unlimited"
+    print(f"{'total':<12}{_mb(report['total_bytes']):>12}   (limit {limit})")
+
+
+def _mb(value):
+    return f"{value / 1e6:.1f} MB"
+
+
+def main(argv=None):
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    from data_engine import cache_usage_report, run_cache_maintenance
+
+    if args.compact or args.max_gb is not None:
+        max_bytes = None if args.max_gb is None else int(args.max_gb * 1e9)
+        summary = run_cache_maintenance(max_bytes)
+        if summary is None:
+            print("Cache maintenance is already running in another process.", file=sys.stderr)
+        elif not args.json:
+            print(f"Freed {_mb(summary['freed_bytes'])} by compaction, evicted {len(summary['evicted'])} entries")
+            for entry in summary["evicted"]:
+                print(f"  {entry['kind']:<8} {entry['name']}  {_mb(entry['bytes'])}")
+            print()
+
+    report = cache_usage_report()
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,76 @@
-from dash import Input, Output, State, html, ctx, ALL
+from dash import Input, Output, State, html, ctx, ALL, no_update
+from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
 import traceback
 import pandas as pd
 import numpy as np
 
 from services.telemetry_service import (
-    prepare_telemetry,
+    get_prepared_telemetry,
     compute_binary_delta,
 )
 from services.fastest_lap_service import (
     resolve_fastest_laps,
     build_fastest_lap_table,
     build_fastest_lap_note,
-    format_td,
 )
+from services.time_format_service import format_td, format_timedelta_series
 from services.kpi_service import compute_comparison_kpi_rows
-from services.style_service import extract_driver_styles
+from services.style_service import driver_color, extract_driver_styles
+from services.track_geometry_service import get_track_geometry
+from services.lap_index_service import LapIndex, get_lap_index
+from services.lap_feature_service import (
+    get_lap_features,
+    telemetry_features,
+)
+from services.parallel_service import map_drivers
 from services.session_telemetry_services import (
     prepare_session_laps,
     safe_lap_selection,
     get_lap_telemetry,
     get_lap_time_evolution_data,
 )
-from figures.telemetry_figure import (
-    build_shared_overlay_figure,
-)
 from figures.track_figure import (
     build_single_driver_track,
     build_binary_delta_track,
     build_multi_driver_message,
 )
 from figures.mini_track_figure import build_mini_track
-from figures.session_telemetry_figure import (
-    create_full_session_speed_figure,
-    create_lap_delta_to_reference_figure,
-)
-from figures.lap_time_evolution_figure import create_lap_time_evolution_figure
+from figures.session_telemetry_figure import create_lap_delta_to_reference_figure
+from figures.figure_executor import build_figure, compact_frame
 from figures.comparison_insights_figure import (
     build_cumulative_delta_figure,
     build_sector_delta_figure,
     build_speed_profile_figure,
 )
 
-from data_engine import load_session, get_supported_event_schedule
+from data_engine import get_cached_session, get_supported_event_schedule
+from session_jobs import (
+    submit_session_load,
+    get_job_status,
+    get_ready_session,
+    claim_selection,
+    is_current_selection,
+)
+from tracing import current_trace, span, trace_url
 
 
 OVERLAY_GRAPH_KEYS = ["speed", "throttle", "brake", "rpm", "gear"]
 
+# Columns shipped to the figure worker for each offloaded builder.
+OVERLAY_TELEMETRY_COLUMNS = ["Distance", "Speed", "Throttle", "Brake", "RPM", "nGear"]
+LAP_DRILLDOWN_COLUMNS = ["Distance", "Speed", "Throttle", "Brake", "nGear"]
+LAP_EVOLUTION_COLUMNS = [
+    "LapNumber",
+    "LapTimeSeconds",
+    "LapTimeFormatted",
+    "IsValid",
+    "Compound",
+    "Vmax",
+    "AvgSpeed",
+    "FullThrottlePct",
+]
+
 
 def _blank_fig():
     return go.Figure()
@@ -92,35 +116,54 @@ def _render_kpi_cards(kpi_rows):
     ]
 
 
-def _overlay_kpi_cards(session, driver_tel, selected_drivers):
-    cards = []
-    for driver in selected_drivers:
-        if driver not in driver_tel:
-            continue
+def _store_records(tel):
+    # Timedelta columns go to the store as seconds: plotly's orjson encoder,
+    # used whenever orjson is installed, cannot serialise pandas Timedeltas.
+    timedelta_columns = tel.select_dtypes(include="timedelta").columns
+    if len(timedelta_columns):
+        tel = tel.assign(**{column: tel[column].dt.total_seconds() for column in timedelta_columns})
+    return tel.to_dict("records")
+
+
+def _trace_lines():
+    trace = current_trace()
+    if trace is None:
+        return []
+    return [
+        "",
+        "=== TRACE ===",
+        *trace.waterfall(),
+        f"Chrome trace: {trace_url(trace)} (once the response is sent)",
+    ]
 
-        tel = driver_tel[driver]
+
+def _overlay_features(session, driver, lap, tel):
+    features = get_lap_features(session, driver, lap["LapNumber"])
+    if features is None or not features["Samples"]:
+        features = telemetry_features(tel)
+    return features
+
+
+def _overlay_kpi_cards(session, fastest_laps, driver_tel, selected_drivers):
+    drivers = [driver for driver in selected_drivers if driver in driver_tel]
+    driver_features = map_drivers(
+        lambda driver: _overlay_features(session, driver, fastest_laps[driver], driver_tel[driver]),
+        drivers,
+    )
+
+    cards = []
+    for driver, features in zip(drivers, driver_features):
         info = session.get_driver(driver)
         abbr = info["Abbreviation"]
         color = info["TeamColor"]
         if not str(color).startswith("#"):
             color = f"#{color}"
 
-        speed = tel["Speed"].dropna()
-        throttle = tel["Throttle"].dropna()
-        brake = tel["Brake"].dropna()
-        gear = tel["nGear"].dropna()
-
-        vmax = float(speed.max()) if not speed.empty else 0.0
-        avg_speed = float(speed.mean()) if not speed.empty else 0.0
-        throttle_pct = float((throttle >= 98).mean() * 100.0) if not throttle.empty else 0.0
-
-        if not brake.empty:
-            brake_binary = (brake > 0).astype(int)
-            brake_events = int((brake_binary.diff() == 1).sum())
-        else:
-            brake_events = 0
-
-        avg_gear = float(gear.mean()) if not gear.empty else 0.0
+        vmax = float(features["Vmax"])
+        avg_speed = float(features["AvgSpeed"])
+        throttle_pct = float(features["FullThrottlePct"])
+        brake_events = int(features["BrakeEvents"])
+        avg_gear = float(features["AvgGear"])
 
         cards.append(
             html.Div(
@@ -220,10 +263,9 @@ def _build_race_results_table(session):
         if not lap_df.empty:
             lap_df["DriverNumber"] = lap_df["DriverNumber"].astype(str)
             best = lap_df.groupby("DriverNumber", as_index=False)["LapTime"].min()
-            best_lap_by_driver = {
-                str(row["DriverNumber"]): format_td(row["LapTime"])
-                for _, row in best.iterrows()
-            }
+            best_lap_by_driver = dict(
+                zip(best["DriverNumber"], format_timedelta_series(best["LapTime"]))
+            )
 
     rows = []
     for _, row in df.iterrows():
@@ -285,6 +327,60 @@ def _build_race_results_table(session):
     return columns, rows, note
 
 
+def _selection_guard(client_id, scope, *key):
+    """
+    Claims the client's selection for a scope and returns a checkpoint that
+    drops the callback's result once a newer selection arrives.
+    """
+    if not client_id:
+        return lambda: None
+
+    generation = claim_selection(client_id, scope, key)
+
+    def _ensure_current():
+        if not is_current_selection(client_id, scope, generation):
+            raise PreventUpdate
+
+    return _ensure_current
+
+
+def _session_load_status(status):
+    if not status or status.get("state") == "done":
+        return []
+
+    pct = int(round(float(status.get("progress", 0.0)) * 100))
+    label = status.get("label", "Loading session")
+    if status.get("state") == "error":
+        return [
+            html.Span(label, className="session-load-label session-load-label--error"),
+            html.Span(status.get("error") or "", className="session-load-detail"),
+        ]
+
+    return [
+        html.Span(label, className="session-load-label"),
+        html.Div(
+            html.Div(className="session-load-bar-fill", style={"width": f"{pct}%"}),
+            className="session-load-bar",
+        ),
+        html.Span(f"{pct}% | {status.get('elapsed', 0.0):.1f}s", className="session-load-detail"),
+    ]
+
+
+def _stored_lap_indexes(stored_data):
+    telemetry_data = stored_data.get("telemetry") or {}
+    lap_numbers = stored_data.get("lap_numbers") or {}
+    session_key = stored_data.get("session_key")
+    session = get_ready_session(*session_key) if session_key else None
+
+    lap_indexes = {}
+    for drv, data in telemetry_data.items():
+        if session is not None and drv in lap_numbers:
+            lap_indexes[drv] = get_lap_index(session, drv, lap_numbers[drv], telemetry=data)
+        else:
+            lap_indexes[drv] = LapIndex.from_telemetry(pd.DataFrame(data))
+    return lap_indexes
+
+
 def register_callbacks(app):
     @app.callback(
         Output("gp-dd", "options"),
@@ -324,10 +420,10 @@ def register_callbacks(app):
 
         schedule = get_supported_event_schedule(year)
         gp_idx = int(gp)
-        if gp_idx < 0 or gp_idx >= len(schedule):
+        if gp_idx not in schedule.index:
             return [], None
 
-        event_row = schedule.iloc[gp_idx]
+        event_row = schedule.loc[gp_idx]
         options = []
 
         for idx in range(1, 6):
@@ -368,13 +464,13 @@ def register_callbacks(app):
 
         schedule = get_supported_event_schedule(year)
         gp_idx = int(gp)
-        if gp_idx < 0 or gp_idx >= len(schedule):
+        if gp_idx not in schedule.index:
             return (
                 "Select an event",
                 f"Viewing: {year} / -- / --",
             )
 
-        event_row = schedule.iloc[gp_idx]
+        event_row = schedule.loc[gp_idx]
         event_name = str(event_row["EventName"])
 
         if session_type is None:
@@ -394,19 +490,68 @@ def register_callbacks(app):
             context,
         )
 
+    @app.callback(
+        Output("session-job-store", "data"),
+        Output("session-ready-store", "data"),
+        Output("session-load-poll", "disabled"),
+        Output("session-load-status", "children"),
+        Input("year-dd", "value"),
+        Input("gp-dd", "value"),
+        Input("session-dd", "value"),
+        Input("session-load-poll", "n_intervals"),
+        State("session-job-store", "data"),
+        State("session-ready-store", "data"),
+        State("client-id-store", "data"),
+    )
+    def sync_session_load(year, gp, session_type, n_intervals, job_data, ready_data, client_id):
+        if year is None or gp is None or session_type is None:
+            if client_id:
+                claim_selection(client_id, "session", None)
+            return None, None, True, []
+
+        key = [year, int(gp), int(session_type)]
+        if client_id:
+            claim_selection(client_id, "session", tuple(key))
+
+        status = None
+        if ctx.triggered_id == "session-load-poll" and job_data and job_data.get("key") == key:
+            status = get_job_status(job_data["job_id"])
+
+        if status is not None and status.get("state") == "done" and get_cached_session(*key) is None:
+            # Finished by another worker process; load this process's copy.
+            status = None
+
+        if status is None or status.get("state") == "cancelled":
+            job_data = {
+                "job_id": submit_session_load(*key, client_id=client_id),
+                "key": key,
+            }
+            status = get_job_status(job_data["job_id"])
+
+        state = (status or {}).get("state")
+        if state == "done":
+            ready = key if ready_data != key else no_update
+            return job_data, ready, True, _session_load_status(status)
+
+        cleared = None if ready_data is not None else no_update
+        return job_data, cleared, state == "error", _session_load_status(status)
+
     @app.callback(
         Output("drivers-dd", "options"),
         Output("drivers-dd", "value"),
         Input("year-dd", "value"),
         Input("gp-dd", "value"),
         Input("session-dd", "value"),
+        Input("session-ready-store", "data"),
         State("drivers-dd", "value"),
     )
-    def update_drivers(year, gp, session_type, current_drivers):
+    def update_drivers(year, gp, session_type, ready_key, current_drivers):
         if year is None or gp is None or session_type is None:
             return [], []
 
-        session = load_session(year, int(gp), int(session_type), telemetry=False)
+        session = get_ready_session(year, int(gp), int(session_type), telemetry=False)
+        if session is None:
+            return [], no_update
         options = [
             {
                 "label": f"{session.get_driver(d)['Abbreviation']} ({d})",
@@ -456,7 +601,10 @@ def register_callbacks(app):
         if selected_driver is None and selected_drivers:
             selected_driver = selected_drivers[0]
 
-        session = load_session(year, int(gp), int(session_type), telemetry=False)
+        session = get_ready_session(year, int(gp), int(session_type), telemetry=False)
+        if session is None:
+            return [], no_update
+
         children = []
         for driver in selected_drivers:
             if driver not in session.drivers:
@@ -541,8 +689,12 @@ def register_callbacks(app):
         selected_order = stored_data.get("selected_order")
         sector_distances = stored_data.get("sector_distances")
 
-        driver_tel = {drv: pd.DataFrame(data) for drv, data in telemetry_data.items()}
-        return build_shared_overlay_figure(
+        driver_tel = {
+            drv: compact_frame(pd.DataFrame(data), OVERLAY_TELEMETRY_COLUMNS)
+            for drv, data in telemetry_data.items()
+        }
+        return build_figure(
+            "shared_overlay",
             driver_tel_dict=driver_tel,
             driver_styles=driver_styles,
             selected_order=selected_order,
@@ -571,10 +723,20 @@ def register_callbacks(app):
         Input("gp-dd", "value"),
         Input("session-dd", "value"),
         Input("drivers-dd", "value"),
+        Input("session-ready-store", "data"),
+        State("client-id-store", "data"),
         prevent_initial_call=True,
     )
-    def update_dashboard(year, gp, session_type, drivers):
+    def update_dashboard(year, gp, session_type, drivers, ready_key, client_id):
         debug_lines = []
+        ensure_current = _selection_guard(
+            client_id,
+            "dashboard",
+            year,
+            gp,
+            session_type,
+            tuple(drivers) if isinstance(drivers, list) else drivers,
+        )
         try:
             debug_lines.append("=== INPUTS ===")
             debug_lines.append(f"Year: {year}")
@@ -583,7 +745,14 @@ def register_callbacks(app):
             debug_lines.append(f"Drivers: {drivers}")
             debug_lines.append("")
 
-            if year is None or gp is None or session_type is None or not drivers:
+            session = None
+            if year is not None and gp is not None and session_type is not None:
+                with span("get_ready_session"):
+                    session = get_ready_session(year, int(gp), int(session_type))
+                if session is None:
+                    debug_lines.append("Waiting for background session load")
+
+            if session is None or not drivers:
                 return (
                     [],
                     _render_kpi_cards(compute_comparison_kpi_rows(None, {}, {})),
@@ -603,7 +772,6 @@ def register_callbacks(app):
                     {},
                 )
 
-            session = load_session(year, int(gp), int(session_type))
             selected_drivers = drivers if isinstance(drivers, list) else [drivers]
 
             debug_lines.append("Session loaded successfully")
@@ -615,21 +783,40 @@ def register_callbacks(app):
                 session,
                 selected_drivers,
             )
-            driver_tel = {}
-            for drv, lap in fastest_laps.items():
-                tel = prepare_telemetry(lap)
-                driver_tel[drv] = tel
+            def _prepare_driver(item):
+                drv, lap = item
+                ensure_current()
+                with span("prepare_driver", driver=drv) as current:
+                    tel = get_prepared_telemetry(session, drv, lap)
+                    get_lap_index(session, drv, lap["LapNumber"], telemetry=tel)
+                    current.set(rows=len(tel))
+                return tel
+
+            # Per-driver preparation runs on the shared driver pool; results
+            # come back in fastest_laps order.
+            with span("telemetry", drivers=len(fastest_laps)):
+                driver_tel = dict(
+                    zip(fastest_laps, map_drivers(_prepare_driver, fastest_laps.items()))
+                )
+            for drv, tel in driver_tel.items():
                 debug_lines.append(f"{drv}: Telemetry rows = {len(tel)}")
 
+            ensure_current()
             driver_style = extract_driver_styles(session, selected_drivers)
-            store_payload = {
-                "telemetry": {
-                    drv: tel.to_dict("records")
-                    for drv, tel in driver_tel.items()
-                },
-                "styles": driver_style,
-                "selected_order": selected_drivers,
-            }
+            with span("store_payload", rows=sum(len(tel) for tel in driver_tel.values())):
+                store_payload = {
+                    "telemetry": {
+                        drv: _store_records(tel)
+                        for drv, tel in driver_tel.items()
+                    },
+                    "styles": driver_style,
+                    "selected_order": selected_drivers,
+                    "session_key": [year, int(gp), int(session_type)],
+                    "lap_numbers": {
+                        drv: int(lap["LapNumber"])
+                        for drv, lap in fastest_laps.items()
+                    },
+                }
 
             reference_driver = next((driver for driver in selected_drivers if driver in fastest_laps), None)
             sector_distances = None
@@ -651,21 +838,31 @@ def register_callbacks(app):
                             sector_distances = [max(0.0, d1), max(0.0, d2), max_d]
 
             store_payload["sector_distances"] = sector_distances
-            overlay_kpis = _overlay_kpi_cards(session, driver_tel, selected_drivers)
-
-            delta_fig = build_cumulative_delta_figure(driver_tel, session)
-            sector_fig = build_sector_delta_figure(fastest_laps, session)
-            speed_profile_fig = build_speed_profile_figure(driver_tel, session)
-            kpi_cards = _render_kpi_cards(
-                compute_comparison_kpi_rows(session, fastest_laps, driver_tel)
-            )
+            with span("track_geometry"):
+                track_geometry = get_track_geometry(session)
+            store_payload["track_geometry"] = track_geometry
+            with span("overlay_kpis"):
+                overlay_kpis = _overlay_kpi_cards(session, fastest_laps, driver_tel, selected_drivers)
+
+            with span("figure.cumulative_delta"):
+                delta_fig = build_cumulative_delta_figure(driver_tel, session)
+            with span("figure.sector_delta"):
+                sector_fig = build_sector_delta_figure(fastest_laps, session)
+            with span("figure.speed_profile"):
+                speed_profile_fig = build_speed_profile_figure(driver_tel, session)
+            with span("comparison_kpis"):
+                kpi_cards = _render_kpi_cards(
+                    compute_comparison_kpi_rows(session, fastest_laps, driver_tel)
+                )
 
+            ensure_current()
             debug_lines.append(f"Drivers plotted: {len(driver_tel)}")
             debug_lines.append("")
 
             if len(driver_tel) == 1:
                 tel = list(driver_tel.values())[0]
-                track_fig = build_single_driver_track(tel)
+                with span("figure.track", rows=len(tel)):
+                    track_fig = build_single_driver_track(tel, track_geometry=track_geometry)
             elif len(driver_tel) == 2:
                 drivers_list = list(driver_tel.keys())
                 drv1, drv2 = drivers_list[0], drivers_list[1]
@@ -681,26 +878,31 @@ def register_callbacks(app):
                     lap2_time,
                 )
 
-                track_fig = build_binary_delta_track(
-                    delta_tel,
-                    drv1,
-                    drv2,
-                    faster_index,
-                    session,
-                )
+                with span("figure.track", rows=len(delta_tel)):
+                    track_fig = build_binary_delta_track(
+                        delta_tel,
+                        drv1,
+                        drv2,
+                        faster_index,
+                        session,
+                        track_geometry=track_geometry,
+                    )
             else:
                 track_fig = build_multi_driver_message()
 
-            columns, data = build_fastest_lap_table(fastest_laps, selected_drivers)
-            fastest_style_conditional = _fastest_lap_table_styles(data, session)
-            fastest_lap_note = build_fastest_lap_note(
-                session,
-                selected_drivers,
-                fallback_drivers,
-            )
-            race_columns, race_data, race_note = _build_race_results_table(session)
-            race_style_conditional = _race_results_table_styles(race_data)
+            with span("tables") as current:
+                columns, data = build_fastest_lap_table(fastest_laps, selected_drivers)
+                fastest_style_conditional = _fastest_lap_table_styles(data, session)
+                fastest_lap_note = build_fastest_lap_note(
+                    session,
+                    selected_drivers,
+                    fallback_drivers,
+                )
+                race_columns, race_data, race_note = _build_race_results_table(session)
+                race_style_conditional = _race_results_table_styles(race_data)
+                current.set(rows=len(data) + len(race_data))
 
+            ensure_current()
             if fallback_drivers:
                 fallback_labels = ", ".join(str(drv) for drv in fallback_drivers)
                 debug_lines.append(f"Fastest lap fallback used for: {fallback_labels}")
@@ -708,6 +910,7 @@ def register_callbacks(app):
                 debug_lines.append("Fastest lap table empty")
             else:
                 debug_lines.append("Fastest lap table populated")
+            debug_lines.extend(_trace_lines())
 
             return (
                 overlay_kpis,
@@ -727,6 +930,8 @@ def register_callbacks(app):
                 "\n".join(debug_lines),
                 store_payload,
             )
+        except PreventUpdate:
+            raise
         except Exception:
             return (
                 [],
@@ -750,24 +955,30 @@ def register_callbacks(app):
     @app.callback(
         Output("mini-track-map", "figure"),
         Input("telemetry-overlay-graph", "hoverData"),
+        Input("track-delta", "clickData"),
         State("telemetry-store", "data"),
     )
-    def update_mini_map(hoverData, stored_data):
+    def update_mini_map(hoverData, clickData, stored_data):
         if not stored_data:
             return _blank_fig()
 
-        telemetry_data = stored_data["telemetry"]
         driver_styles = stored_data["styles"]
-        driver_tel = {drv: pd.DataFrame(data) for drv, data in telemetry_data.items()}
+        lap_indexes = _stored_lap_indexes(stored_data)
 
         reference_distance = None
-        if hoverData and "points" in hoverData:
+        if ctx.triggered_id == "track-delta":
+            if clickData and "points" in clickData and lap_indexes:
+                point = clickData["points"][0]
+                reference_index = next(iter(lap_indexes.values()))
+                reference_distance = reference_index.distance_at_position(point["x"], point["y"])
+        elif hoverData and "points" in hoverData:
             reference_distance = hoverData["points"][0]["x"]
 
         return build_mini_track(
-            driver_tel=driver_tel,
+            lap_indexes=lap_indexes,
             driver_styles=driver_styles,
             reference_distance=reference_distance,
+            track_geometry=stored_data.get("track_geometry"),
         )
 
     @app.callback(
@@ -783,7 +994,10 @@ def register_callbacks(app):
         if year is None or gp is None or session_name is None or lap_driver is None:
             return 1, "/ 1 laps"
 
-        session = load_session(year, int(gp), int(session_name), telemetry=False)
+        session = get_ready_session(year, int(gp), int(session_name), telemetry=False)
+        if session is None:
+            return 1, "/ 1 laps"
+
         laps = prepare_session_laps(
             session=session,
             driver_code=lap_driver,
@@ -854,6 +1068,7 @@ def register_callbacks(app):
         Input("gp-dd", "value"),
         Input("session-dd", "value"),
         Input("lap-driver-store", "data"),
+        State("client-id-store", "data"),
         prevent_initial_call=True,
     )
     def update_full_session_graph(
@@ -862,6 +1077,7 @@ def register_callbacks(app):
         gp,
         session_name,
         lap_driver,
+        client_id,
     ):
         if (
             lap_number is None
@@ -876,7 +1092,13 @@ def register_callbacks(app):
                 [html.Span("Awaiting session + driver selection.", className="lap-context-item")],
             )
         driver = lap_driver
-        session = load_session(year, int(gp), int(session_name))
+        session = get_ready_session(year, int(gp), int(session_name))
+        if session is None:
+            return (
+                _message_figure("Session is still loading.", height=760),
+                _message_figure("Session is still loading.", height=420),
+                [html.Span("Loading session data in the background.", className="lap-context-item")],
+            )
         laps = prepare_session_laps(
             session=session,
             driver_code=driver,
@@ -890,21 +1112,27 @@ def register_callbacks(app):
                 [html.Span("No valid lap data in this session.", className="lap-context-item")],
             )
 
+        ensure_current = _selection_guard(client_id, "lap", year, gp, session_name, driver, lap_number)
         selected_lap = safe_lap_selection(laps, lap_number)
         selected_lap_number = int(selected_lap["LapNumber"])
         selected_telemetry = get_lap_telemetry(selected_lap)
 
+        ensure_current()
         fastest_lap = laps.loc[laps["LapTime"].idxmin()]
         fastest_lap_number = int(fastest_lap["LapNumber"])
         fastest_telemetry = get_lap_telemetry(fastest_lap)
 
-        full_session_fig = create_full_session_speed_figure(
-            telemetry=selected_telemetry,
+        ensure_current()
+
+        driver_abbr = session.get_driver(driver)["Abbreviation"]
+        full_session_fig = build_figure(
+            "full_session_speed",
+            telemetry=compact_frame(selected_telemetry, LAP_DRILLDOWN_COLUMNS),
             driver=driver,
             lap_number=selected_lap_number,
-            reference_telemetry=fastest_telemetry,
+            reference_telemetry=compact_frame(fastest_telemetry, LAP_DRILLDOWN_COLUMNS),
             reference_lap_number=fastest_lap_number,
-            session=session,
+            color=driver_color(driver_abbr, session),
         )
 
         delta_fig = create_lap_delta_to_reference_figure(
@@ -938,7 +1166,7 @@ def register_callbacks(app):
 
         context = [
             html.Span(
-                f"Driver: {session.get_driver(driver)['Abbreviation']} ({driver})",
+                f"Driver: {driver_abbr} ({driver})",
                 className="lap-context-item",
                 style={
                     "borderColor": f"{team_color}88",
@@ -986,9 +1214,11 @@ def register_callbacks(app):
         Input("gp-dd", "value"),
         Input("session-dd", "value"),
         Input("drivers-dd", "value"),
+        Input("session-ready-store", "data"),
+        State("client-id-store", "data"),
         prevent_initial_call=True,
     )
-    def update_lap_time_evolution(year, gp, session_name, drivers):
+    def update_lap_time_evolution(year, gp, session_name, drivers, ready_key, client_id):
         if year is None or gp is None or session_name is None or not drivers:
             return _message_figure("Select up to 2 drivers for lap-time evolution.", height=420)
 
@@ -998,22 +1228,33 @@ def register_callbacks(app):
         if len(drivers) > 2:
             return _message_figure("Select up to 2 drivers for lap-time evolution comparison.", height=420)
 
-        session = load_session(year, int(gp), int(session_name), telemetry=False)
+        session = get_ready_session(year, int(gp), int(session_name), telemetry=False)
+        if session is None:
+            return _message_figure("Session is still loading.", height=420)
+
+        ensure_current = _selection_guard(client_id, "evolution", year, gp, session_name, tuple(drivers))
         payloads = []
         for driver in drivers:
             laps = session.laps.pick_drivers(driver)
             if laps.empty:
                 continue
-            df, fastest_idx = get_lap_time_evolution_data(laps)
+            df, fastest_idx = get_lap_time_evolution_data(
+                laps,
+                features=get_lap_features(session, driver),
+            )
+            abbr = session.get_driver(driver)["Abbreviation"]
             payloads.append(
                 {
                     "driver": driver,
-                    "df": df,
+                    "df": compact_frame(df, LAP_EVOLUTION_COLUMNS),
                     "fastest_idx": fastest_idx,
+                    "abbr": abbr,
+                    "color": driver_color(abbr, session),
                 }
             )
 
         if not payloads:
             return _message_figure("No lap data available for selected drivers.", height=420)
 
-        return create_lap_time_evolution_figure(payloads, session)
+        ensure_current()
+        return build_figure("lap_time_evolution", driver_payloads=payloads)
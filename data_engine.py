@@ -1,16 +1,110 @@
-import fastf1 
+import json
+import copy
 import os
-from fastf1 import Cache
+import logging
+import shutil
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, wait as futures_wait
+from contextlib import contextmanager
 import pandas as pd
 from numbers import Integral
 from threading import RLock
 
+from metrics import timed_load
+from tracing import span
+from services.time_format_service import format_timedelta_series
+from session_snapshot import (
+    read_value_file,
+    restore_session_snapshot,
+    snapshot_has_telemetry,
+    write_session_snapshot,
+    write_value_file,
+)
+from telemetry_store import LazyTelemetry, has_session_telemetry, map_session_telemetry, write_session_telemetry
+
 CACHE_DIR = 'cache'
+DERIVED_DIR = os.path.join(CACHE_DIR, "_derived")
+INDEX_DIR = os.path.join(CACHE_DIR, "_index")
+JOB_DIR = os.path.join(CACHE_DIR, "_jobs")
+SNAPSHOT_DIR = os.path.join(CACHE_DIR, "_snapshots")
+TELEMETRY_DIR = os.path.join(CACHE_DIR, "_telemetry")
+
+# Set F1D_SESSION_SNAPSHOTS=0 to always parse sessions from the FastF1 cache.
+SESSION_SNAPSHOTS_ENABLED = os.environ.get("F1D_SESSION_SNAPSHOTS", "1") != "0"
+
+# Serve car/position data from read-only memory-mapped channel files shared by
+# every worker process; set F1D_TELEMETRY_MMAP=0 to keep it on the heap.
+TELEMETRY_MMAP_ENABLED = os.environ.get("F1D_TELEMETRY_MMAP", "1") != "0"
+
+# Slim sessions downcast telemetry channels and drop columns the dashboard
+# never reads; set F1D_SLIM_SESSIONS=0 to keep FastF1's full frames.
+SLIM_SESSIONS_ENABLED = os.environ.get("F1D_SLIM_SESSIONS", "1") != "0"
+
+SLIM_DTYPES = {
+    "Speed": "float32",
+    "Throttle": "float32",
+    "RPM": "float32",
+    "Distance": "float32",
+    "X": "float32",
+    "Y": "float32",
+    "nGear": "int8",
+    "DRS": "int8",
+    "Brake": "bool",
+}
+
+# Serve generated sessions (synthetic_session.py) instead of FastF1 data, so
+# load tests and demos run without network access. Synthetic sessions are
+# never written to the snapshot, telemetry or derived caches.
+SYNTHETIC_SESSIONS_ENABLED = os.environ.get("F1D_SYNTHETIC", "0") != "0"
+SYNTHETIC_DRIVER_COUNT = int(os.environ.get("F1D_SYNTHETIC_DRIVERS", "20"))
+
+# Load laps and timing eagerly but each driver's car/position data only on
+# first access (see load_session).
+LAZY_TELEMETRY_ENABLED = os.environ.get("F1D_LAZY_TELEMETRY", "1") != "0"
+
+# Raw car/position columns dropped from slim sessions. Date, SessionTime and
+# Time stay because FastF1 slices and merges laps with them; Source is only
+# needed when FastF1 resamples, which the dashboard never asks for.
+SLIM_DROP_COLUMNS = ["Status", "Source", "Z"]
+
+# Bump when the layout of persisted derived objects changes.
+DERIVED_FORMAT_VERSION = 3
+
+# Persisted schedules older than this are refetched so new rounds show up.
+SCHEDULE_INDEX_MAX_AGE = 24 * 60 * 60
+
+# Size cap for CACHE_DIR in bytes (e.g. 20e9); beyond it the least recently
+# used session data is evicted. 0 disables eviction.
+CACHE_MAX_BYTES = int(float(os.environ.get("F1D_CACHE_MAX_BYTES", "0")))
 
-os.makedirs(CACHE_DIR, exist_ok=True)
+# Seconds between background cache maintenance runs; 0 disables them.
+CACHE_MAINTENANCE_INTERVAL = float(os.environ.get("F1D_CACHE_MAINTENANCE_INTERVAL", "900"))
 
-#enable cache
-Cache.enable_cache(CACHE_DIR)
+# Cache entries used more recently than this are never evicted: other worker
+# processes may have them loaded (each process refreshes the timestamps of
+# its loaded sessions on every maintenance run).
+CACHE_EVICTION_GRACE = max(2 * CACHE_MAINTENANCE_INTERVAL, 600.0)
+
+# FastF1 HTTP responses older than this many days are dropped on compaction.
+HTTP_CACHE_MAX_AGE_DAYS = float(os.environ.get("F1D_HTTP_CACHE_MAX_AGE_DAYS", "30"))
+
+JOB_STATUS_MAX_AGE = 7 * 24 * 60 * 60
+
+# Interrupted write-then-rename files older than this are removed.
+STALE_TMP_AGE = 60 * 60
+
+# Directory of a pre-built offline archive (see offline_archive.py). When set,
+# schedules and sessions are served from it alone: FastF1's HTTP layer and
+# its requests-cache are never used, and only archived sessions are offered.
+OFFLINE_ARCHIVE_DIR = os.environ.get("F1D_OFFLINE_ARCHIVE", "")
+
+# Archives are built elsewhere and copied in, so nothing in them is ever
+# unpickled; version 1 archives stored schedules and derived data as pickles.
+ARCHIVE_FORMAT_VERSION = 2
+ARCHIVE_MANIFEST = "manifest.json"
 
 SUPPORTED_EVENT_FORMATS = {
     "conventional",
@@ -22,19 +116,367 @@ SUPPORTED_EVENT_FORMATS = {
 
 _SESSION_CACHE = {}
 _SESSION_CACHE_LOCK = RLock()
+# Pending background cache writes: future -> "snapshot" or "telemetry".
+_PENDING_WRITES = {}
+_CACHE_ENABLED = False
+_MAINTENANCE_THREAD = None
+_ARCHIVE_SCHEDULES = {}
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+SCHEDULER_LIMITS = {
+    PRIORITY_INTERACTIVE: int(os.environ.get("F1D_INTERACTIVE_WORKERS", "2")),
+    PRIORITY_BACKGROUND: int(os.environ.get("F1D_BACKGROUND_WORKERS", "1")),
+}
+
+# Ordered load stages reported to progress callbacks.
+LOAD_STAGES = ["timing", "laps", "car_data", "position_data", "merge"]
+
+# FastF1 log message fragments mapped to load stages; checked in order.
+_STAGE_MARKERS = [
+    ("timing app data", "laps"),
+    ("processing timing data", "laps"),
+    ("timing data", "timing"),
+    ("car data", "car_data"),
+    ("position data", "position_data"),
+]
+
+
+class SessionLoadCancelled(Exception):
+    """
+    Raised inside a session load whose cancel event was set
+    """
+
+
+class _LoadProgressHandler(logging.Handler):
+    """
+    Maps FastF1 log records to load stages for the thread that emitted them.
+    Listeners only record progress: emit runs under the handler lock, so it
+    must never block or raise into FastF1.
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.listeners = {}
+
+    def emit(self, record):
+        listener = self.listeners.get(record.thread)
+        if listener is None:
+            return
+        message = record.getMessage().lower()
+        for marker, stage in _STAGE_MARKERS:
+            if marker in message:
+                try:
+                    listener(stage)
+                except Exception:
+                    self.handleError(record)
+                return
+
+
+_LOAD_PROGRESS_HANDLER = _LoadProgressHandler()
+logging.getLogger("fastf1").addHandler(_LOAD_PROGRESS_HANDLER)
+
+
+@contextmanager
+def _report_load_progress(progress, cancel_event=None, first_stage="timing"):
+    """
+    Yields report_stage(stage=None), which the load calls at its stage
+    boundaries: it pauses a preempted background load, raises
+    SessionLoadCancelled once cancel_event is set and forwards newly reached
+    stages to progress, starting at first_stage. FastF1 log records in
+    between only advance progress.
+    """
+    reached = {"index": -1}
+
+    def _advance(stage):
+        if stage is None or progress is None:
+            return
+        index = LOAD_STAGES.index(stage)
+        if index > reached["index"]:
+            reached["index"] = index
+            progress(stage)
+
+    def report_stage(stage=None):
+        _SCHEDULER.checkpoint()
+        if cancel_event is not None and cancel_event.is_set():
+            raise SessionLoadCancelled()
+        _advance(stage)
+
+    if progress is None:
+        report_stage()
+        yield report_stage
+        return
+
+    thread_id = threading.get_ident()
+    _LOAD_PROGRESS_HANDLER.listeners[thread_id] = _advance
+    try:
+        report_stage(first_stage)
+        yield report_stage
+    finally:
+        _LOAD_PROGRESS_HANDLER.listeners.pop(thread_id, None)
+
+
+class _ScheduledTask:
+    __slots__ = ("future", "fn", "args", "kwargs", "priority", "submitted")
+
+    def __init__(self, fn, args, kwargs, priority):
+        self.future = Future()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.submitted = time.perf_counter()
+
+
+class _PriorityScheduler:
+    """
+    Runs session work in two priority classes with bounded concurrency each.
+    Background tasks only start while no interactive work is queued or
+    running, and running background tasks pause at load checkpoints until
+    interactive work has drained.
+    """
+
+    def __init__(self, limits):
+        self._limits = dict(limits)
+        self._queues = {priority: deque() for priority in self._limits}
+        self._running = {priority: 0 for priority in self._limits}
+        self._paused = 0
+        self._metrics = {
+            priority: {
+                "submitted": 0,
+                "completed": 0,
+                "failed": 0,
+                "preemptions": 0,
+                "wait_seconds_total": 0.0,
+                "wait_seconds_max": 0.0,
+            }
+            for priority in self._limits
+        }
+        self._active = {}
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._started = False
+
+    def submit(self, fn, *args, priority=PRIORITY_INTERACTIVE, **kwargs):
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        task = _ScheduledTask(fn, args, kwargs, priority)
+        with self._cond:
+            self._start_workers()
+            self._queues[priority].append(task)
+            self._metrics[priority]["submitted"] += 1
+            self._cond.notify_all()
+        return task.future
+
+    def promote(self, future):
+        """
+        Moves a queued or running background task into the interactive class.
+        """
+        with self._cond:
+            for task in list(self._queues[PRIORITY_BACKGROUND]):
+                if task.future is future:
+                    self._queues[PRIORITY_BACKGROUND].remove(task)
+                    task.priority = PRIORITY_INTERACTIVE
+                    self._queues[PRIORITY_INTERACTIVE].appendleft(task)
+                    self._cond.notify_all()
+                    return True
+            for task in self._active.values():
+                if task.future is future:
+                    # Stays on its background worker slot but no longer pauses.
+                    task.priority = PRIORITY_INTERACTIVE
+                    self._cond.notify_all()
+                    return True
+        return False
+
+    def checkpoint(self):
+        """
+        Blocks the calling background task while interactive work is pending.
+        """
+        task = getattr(self._local, "task", None)
+        if task is None or task.priority != PRIORITY_BACKGROUND:
+            return
+
+        with self._cond:
+            if not self._interactive_busy():
+                return
+            self._metrics[PRIORITY_BACKGROUND]["preemptions"] += 1
+            self._paused += 1
+            try:
+                while task.priority == PRIORITY_BACKGROUND and self._interactive_busy():
+                    self._cond.wait()
+            finally:
+                self._paused -= 1
+
+    def metrics(self):
+        with self._cond:
+            snapshot = {}
+            for priority, counters in self._metrics.items():
+                snapshot[priority] = dict(
+                    counters,
+                    queued=len(self._queues[priority]),
+                    running=self._running[priority],
+                    limit=self._limits[priority],
+                )
+            snapshot[PRIORITY_BACKGROUND]["paused"] = self._paused
+            return snapshot
+
+    def reset_after_fork(self):
+        """
+        Forget worker threads and queued work inherited from the parent; the
+        child starts its own workers on its first submission.
+        """
+        self.__init__(self._limits)
+
+    def _interactive_busy(self):
+        return bool(self._queues[PRIORITY_INTERACTIVE]) or self._running[PRIORITY_INTERACTIVE] > 0
+
+    def _start_workers(self):
+        if self._started:
+            return
+        self._started = True
+        for priority, limit in self._limits.items():
+            for idx in range(max(1, limit)):
+                worker = threading.Thread(
+                    target=self._worker,
+                    args=(priority,),
+                    name=f"f1d-{priority}-{idx}",
+                    daemon=True,
+                )
+                worker.start()
+
+    def _next_task(self, priority):
+        queue = self._queues[priority]
+        if not queue or self._running[priority] >= self._limits[priority]:
+            return None
+        if priority == PRIORITY_BACKGROUND and self._interactive_busy():
+            return None
+        return queue.popleft()
+
+    def _worker(self, priority):
+        while True:
+            with self._cond:
+                task = self._next_task(priority)
+                while task is None:
+                    self._cond.wait()
+                    task = self._next_task(priority)
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+                self._running[priority] += 1
+                wait = time.perf_counter() - task.submitted
+                counters = self._metrics[task.priority]
+                counters["wait_seconds_total"] += wait
+                counters["wait_seconds_max"] = max(counters["wait_seconds_max"], wait)
+                self._active[threading.get_ident()] = task
+
+            self._local.task = task
+            try:
+                result = task.fn(*task.args, **task.kwargs)
+            except BaseException as exc:
+                task.future.set_exception(exc)
+                outcome = "failed"
+            else:
+                task.future.set_result(result)
+                outcome = "completed"
+            finally:
+                self._local.task = None
+
+            with self._cond:
+                self._running[priority] -= 1
+                self._metrics[task.priority][outcome] += 1
+                self._active.pop(threading.get_ident(), None)
+                self._cond.notify_all()
+
+
+_SCHEDULER = _PriorityScheduler(SCHEDULER_LIMITS)
+
+
+def _reinit_after_fork():
+    # Threads do not survive fork: a lock held by one of the parent's workers
+    # would stay locked forever in the child.
+    global _SESSION_CACHE_LOCK
+    _SESSION_CACHE_LOCK = RLock()
+    _PENDING_WRITES.clear()
+    _SCHEDULER.reset_after_fork()
+    global _MAINTENANCE_THREAD
+    _MAINTENANCE_THREAD = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
+
+
+def schedule_session_work(fn, *args, priority=PRIORITY_INTERACTIVE, **kwargs):
+    """
+    Run fn on the session scheduler and return a Future
+
+    :param fn: Callable to run
+    :param priority: PRIORITY_INTERACTIVE or PRIORITY_BACKGROUND
+    """
+    return _SCHEDULER.submit(fn, *args, priority=priority, **kwargs)
+
+
+def promote_session_work(future):
+    """
+    Raise a scheduled background task to interactive priority
+    """
+    return _SCHEDULER.promote(future)
+
+
+def get_scheduler_metrics():
+    """
+    Return queue depth, running count and wait-time counters per priority class
+    """
+    return _SCHEDULER.metrics()
 
 
 def get_supported_event_schedule(year: int):
-    schedule = fastf1.get_event_schedule(year, include_testing=True)
+    if SYNTHETIC_SESSIONS_ENABLED:
+        from synthetic_session import synthetic_event_schedule
+
+        return synthetic_event_schedule(int(year))
+    if OFFLINE_ARCHIVE_DIR:
+        return _archived_event_schedule(int(year))
+
+    path = _schedule_index_path(year)
+    try:
+        if time.time() - os.path.getmtime(path) < SCHEDULE_INDEX_MAX_AGE:
+            return read_value_file(path)
+    except Exception:
+        pass
+    return _fetch_supported_event_schedule(year)
+
+
+def write_schedule_index(year: int):
+    """
+    Fetch the supported schedule for a season and persist it under INDEX_DIR
+
+    :param year: Season to index
+    """
+
+    schedule = _fetch_supported_event_schedule(year)
+    _write_value(_schedule_index_path(year), schedule)
+    return schedule
+
+
+def _fetch_supported_event_schedule(year: int):
+    schedule = _ensure_cache().get_event_schedule(year, include_testing=True)
     schedule = schedule[schedule["EventFormat"].isin(SUPPORTED_EVENT_FORMATS)]
     return schedule.reset_index(drop=True)
 
 
+def _schedule_index_path(year: int):
+    return os.path.join(INDEX_DIR, f"schedule_{int(year)}.npz")
+
+
 def _resolve_event_from_index(year: int, event_index: int):
+    # Labels, not positions: the offline archive schedule keeps the supported
+    # schedule's index for the events it holds.
     schedule = get_supported_event_schedule(year)
-    if event_index < 0 or event_index >= len(schedule):
+    if event_index not in schedule.index:
         raise ValueError(f"Invalid event index: {event_index}")
-    return schedule, schedule.iloc[event_index]
+    return schedule, schedule.loc[event_index]
 
 
 def _normalize_session_key(year: int, gp, session_type):
@@ -43,7 +485,32 @@ def _normalize_session_key(year: int, gp, session_type):
     return int(year), gp_key, session_key
 
 
+def _ensure_cache():
+    """
+    Import FastF1 and enable its HTTP cache on first use, so importing this
+    module (and app.py) stays cheap
+    """
+
+    global _CACHE_ENABLED
+    if OFFLINE_ARCHIVE_DIR:
+        raise RuntimeError("FastF1 data access is disabled in offline archive mode")
+    import fastf1
+
+    if not _CACHE_ENABLED:
+        with _SESSION_CACHE_LOCK:
+            if not _CACHE_ENABLED:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                fastf1.Cache.enable_cache(CACHE_DIR)
+                _CACHE_ENABLED = True
+    start_cache_maintenance()
+    return fastf1
+
+
 def _build_session(year: int, gp, session_type):
+    if OFFLINE_ARCHIVE_DIR:
+        return _build_archived_session(year, gp, session_type)
+
+    fastf1 = _ensure_cache()
     if isinstance(gp, Integral):
         event_index = int(gp)
         schedule, event = _resolve_event_from_index(year, event_index)
@@ -52,7 +519,7 @@ def _build_session(year: int, gp, session_type):
         if event["EventFormat"] == "testing":
             # FastF1 testing sessions require test_number + session_number.
             test_number = int(
-                (schedule.iloc[: event_index + 1]["EventFormat"] == "testing").sum()
+                (schedule.loc[:event_index, "EventFormat"] == "testing").sum()
             )
             return fastf1.get_testing_session(year, test_number, session_number)
 
@@ -63,7 +530,16 @@ def _build_session(year: int, gp, session_type):
 
 
 #session loader
-def load_session(year: int, gp, session_type, telemetry=True):
+def load_session(
+    year: int,
+    gp,
+    session_type,
+    telemetry=True,
+    progress=None,
+    cancel_event=None,
+    slim=None,
+    lazy=None,
+):
     """
     Load and cache an F1 session
     
@@ -71,9 +547,30 @@ def load_session(year: int, gp, session_type, telemetry=True):
     :type year: int
     :param gp: Event name (legacy) or supported event index
     :param session_type: Session identifier by name/code (legacy) or session number
+    :param progress: Optional callable receiving each stage name from LOAD_STAGES
+    :param cancel_event: Optional threading.Event; once set the load raises
+        SessionLoadCancelled at the next stage boundary and nothing is cached
+    :param slim: Downcast and trim telemetry (see slim_telemetry); defaults
+        to SLIM_SESSIONS_ENABLED
+    :param lazy: Load each driver's car/position data on first access
+        instead of with the session; defaults to LAZY_TELEMETRY_ENABLED
+
+    Sessions are rehydrated from their on-disk snapshot when one exists;
+    otherwise they are parsed by FastF1 and a snapshot is written in the
+    background. Telemetry is memory-mapped from the shared channel store
+    when TELEMETRY_MMAP_ENABLED.
+
+    With lazy telemetry, drivers are mapped from the channel store or decoded
+    from the snapshot one at a time. Without either, FastF1 parses the
+    telemetry of all drivers at once, so that parse is deferred: run it with
+    parse_deferred_telemetry, or it runs on the first access.
     """
 
     key = _normalize_session_key(year, gp, session_type)
+    if slim is None:
+        slim = SLIM_SESSIONS_ENABLED
+    if lazy is None:
+        lazy = LAZY_TELEMETRY_ENABLED
 
     with _SESSION_CACHE_LOCK:
         cached = _SESSION_CACHE.get(key)
@@ -82,9 +579,28 @@ def load_session(year: int, gp, session_type, telemetry=True):
             if not telemetry or has_telemetry:
                 return cached
 
-    session = _build_session(year, gp, session_type)
-    session.load(telemetry=telemetry, weather=False)
+    with timed_load(), span("load_session", telemetry=bool(telemetry)) as current, \
+            _report_load_progress(progress, cancel_event) as report_stage:
+        if SYNTHETIC_SESSIONS_ENABLED:
+            session = _build_synthetic_session(key)
+            report_stage()
+            if telemetry and slim:
+                _slim_session(session)
+            source = "synthetic"
+        else:
+            session = _build_session(year, gp, session_type)
+            restored = _populate_session(session, key, telemetry, slim, lazy, report_stage)
+            if OFFLINE_ARCHIVE_DIR:
+                source = "archive"
+            else:
+                source = "snapshot" if restored else "fastf1"
+        # A deferred parse reports the telemetry stages itself.
+        report_stage("laps" if hasattr(session, "_f1d_deferred_parse") else "merge")
+        current.set(source=source, laps=len(session.laps))
     setattr(session, "_f1d_has_telemetry", bool(telemetry))
+    setattr(session, "_f1d_key", key)
+    setattr(session, "_f1d_slim", bool(telemetry and slim))
+    setattr(session, "_f1d_lazy_telemetry", isinstance(getattr(session, "_car_data", None), LazyTelemetry))
 
     with _SESSION_CACHE_LOCK:
         existing = _SESSION_CACHE.get(key)
@@ -94,9 +610,1005 @@ def load_session(year: int, gp, session_type, telemetry=True):
                 return existing
 
         _SESSION_CACHE[key] = session
+
+    if source != "synthetic":
+        # Keeps the session's cache files at the young end of the LRU order
+        # for other processes' budget enforcement.
+        _touch_cache_entries(session, key)
+    if SESSION_SNAPSHOTS_ENABLED and source == "fastf1":
+        _schedule_snapshot_write(session, _snapshot_path(key))
+    return session
+
+
+def _build_synthetic_session(key):
+    from synthetic_session import SYNTHETIC_SESSIONS, SYNTHETIC_SESSION_LAPS, make_synthetic_session
+
+    year, gp, session_type = key
+    if isinstance(gp, int):
+        _resolve_event_from_index(year, gp)
+    if isinstance(session_type, int):
+        if session_type < 1 or session_type > len(SYNTHETIC_SESSIONS):
+            raise ValueError(f"Invalid session number: {session_type}")
+        session_type = SYNTHETIC_SESSIONS[session_type - 1]
+
+    # Stable per key, so every worker generates the same session.
+    seed = zlib.crc32(repr(key).encode("utf-8"))
+    return make_synthetic_session(
+        drivers=SYNTHETIC_DRIVER_COUNT,
+        laps=SYNTHETIC_SESSION_LAPS.get(session_type, 20),
+        seed=seed,
+        session_name=session_type,
+        year=year,
+    )
+
+
+def _populate_session(session, key, telemetry, slim, lazy=False, report_stage=None):
+    """
+    Fill an unloaded session from snapshot + telemetry store, falling back to
+    a FastF1 parse. Returns True if the session came from its snapshot.
+    report_stage, when given, is called between the steps of the load.
+    """
+
+    if report_stage is None:
+        report_stage = _ignore_stage
+    if OFFLINE_ARCHIVE_DIR:
+        return _populate_archived_session(session, key, telemetry, slim, lazy, report_stage)
+
+    telemetry_dir = _telemetry_path(key, slim)
+    mapped = telemetry and TELEMETRY_MMAP_ENABLED and has_session_telemetry(telemetry_dir)
+
+    with span("restore_snapshot") as current:
+        restored = SESSION_SNAPSHOTS_ENABLED and restore_session_snapshot(
+            session,
+            _snapshot_path(key),
+            telemetry=telemetry and not mapped,
+            lazy=lazy,
+        )
+        if restored and mapped:
+            mapped = map_session_telemetry(session, telemetry_dir, lazy=lazy)
+            if not mapped:
+                restored = False
+        current.set(restored=bool(restored), mapped=bool(mapped))
+    report_stage()
+    deferred = False
+    if not restored:
+        with span("fastf1_parse"):
+            deferred = telemetry and lazy
+            session.load(telemetry=telemetry and not deferred, weather=False)
+        report_stage()
+        if deferred:
+            _defer_fastf1_telemetry(session, key, slim)
+
+    if telemetry and slim:
+        with span("slim_session"):
+            _slim_session(session)
+        report_stage()
+    if telemetry and TELEMETRY_MMAP_ENABLED and not mapped and not deferred:
+        with span("write_telemetry_store"):
+            write_session_telemetry(session, telemetry_dir)
+            map_session_telemetry(session, telemetry_dir)
+    return restored
+
+
+def _ignore_stage(stage=None):
+    return None
+
+
+def archived_seasons():
+    """
+    Return the seasons held by the offline archive, oldest first
+    """
+
+    return sorted(int(year) for year in _archive_manifest().get("sessions", {}))
+
+
+def export_session_to_archive(year: int, gp, session_type, archive_dir):
+    """
+    Copy a session's snapshot, telemetry store and persisted derived data
+    from CACHE_DIR into an offline archive. Returns the bytes copied
+
+    :param archive_dir: Archive root; created when missing
+    :raises FileNotFoundError: When the session has no snapshot yet, or no
+        telemetry in either its channel store or its snapshot (load it with
+        load_session and wait_for_session_writes first)
+    """
+
+    key = _normalize_session_key(year, gp, session_type)
+    snapshot = _snapshot_path(key)
+    if not os.path.isfile(snapshot):
+        raise FileNotFoundError(f"No snapshot for session {key}")
+    # The offline box cannot parse telemetry: an entry without it is unusable.
+    if not any(has_session_telemetry(_telemetry_path(key, slim)) for slim in (True, False)) \
+            and not snapshot_has_telemetry(snapshot):
+        raise FileNotFoundError(f"No telemetry store or snapshot telemetry for session {key}")
+
+    sources = [snapshot]
+    for variant in ("slim", "full"):
+        sources.append(os.path.join(DERIVED_DIR, f"v{DERIVED_FORMAT_VERSION}", variant, _storage_key(key)))
+        sources.append(os.path.join(TELEMETRY_DIR, variant, _storage_key(key)))
+    copied = 0
+    for source in sources:
+        if not os.path.exists(source):
+            continue
+        target = os.path.join(archive_dir, os.path.relpath(source, CACHE_DIR))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.isdir(source):
+            shutil.copytree(source, target, dirs_exist_ok=True)
+        else:
+            shutil.copy2(source, target)
+        copied += _tree_size(source)
+    return copied
+
+
+def write_archive_manifest(archive_dir, sessions):
+    """
+    Record archived sessions in the archive's manifest, merged with the ones
+    already listed, and copy each season's schedule index into the archive
+
+    :param sessions: Iterable of (year, event_index, session_number)
+    """
+
+    import fastf1
+
+    path = os.path.join(archive_dir, ARCHIVE_MANIFEST)
+    manifest = {"format": ARCHIVE_FORMAT_VERSION, "sessions": {}}
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            existing = json.load(handle)
+        if existing.get("format") == ARCHIVE_FORMAT_VERSION:
+            manifest = existing
+    except (OSError, ValueError):
+        pass
+
+    for year, event_index, session_number in sessions:
+        events = manifest["sessions"].setdefault(str(int(year)), {})
+        numbers = set(events.get(str(int(event_index)), []))
+        numbers.add(int(session_number))
+        events[str(int(event_index))] = sorted(numbers)
+
+    for year in manifest["sessions"]:
+        index_path = _schedule_index_path(int(year))
+        if os.path.isfile(index_path):
+            target = os.path.join(archive_dir, os.path.relpath(index_path, CACHE_DIR))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(index_path, target)
+
+    # Snapshots only restore under the FastF1 version that wrote them.
+    manifest["fastf1"] = fastf1.__version__
+    manifest["created"] = pd.Timestamp.now(tz="UTC").isoformat()
+    os.makedirs(archive_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return manifest
+
+
+def _archive_path(path):
+    # The archive mirrors CACHE_DIR's layout for the parts it holds.
+    return os.path.join(OFFLINE_ARCHIVE_DIR, os.path.relpath(path, CACHE_DIR))
+
+
+def _archive_manifest():
+    path = os.path.join(OFFLINE_ARCHIVE_DIR, ARCHIVE_MANIFEST)
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError) as exc:
+        logging.getLogger(__name__).warning("No usable offline archive manifest at %s: %s", path, exc)
+        return {}
+    if manifest.get("format") != ARCHIVE_FORMAT_VERSION:
+        logging.getLogger(__name__).warning("Unsupported offline archive format in %s", path)
+        return {}
+    return manifest
+
+
+def _archived_event_schedule(year: int):
+    """
+    The supported schedule restricted to archived events, keeping their
+    schedule index so session keys match the online ones, with sessions
+    that are not archived blanked out
+    """
+
+    with _SESSION_CACHE_LOCK:
+        if year in _ARCHIVE_SCHEDULES:
+            return _ARCHIVE_SCHEDULES[year]
+
+    archived = _archive_manifest().get("sessions", {}).get(str(year), {})
+    schedule = _read_value(_archive_path(_schedule_index_path(year)))
+    if schedule is None:
+        if archived:
+            logging.getLogger(__name__).warning("No usable schedule index for %s in the offline archive", year)
+        schedule = pd.DataFrame(columns=["EventName", "EventFormat", "Location"])
+    else:
+        schedule = schedule[schedule.index.isin([int(index) for index in archived])].copy()
+        for event_index in schedule.index:
+            sessions = set(archived.get(str(event_index), []))
+            for number in range(1, 6):
+                column = f"Session{number}"
+                if column in schedule.columns and number not in sessions:
+                    schedule.loc[event_index, column] = None
+
+    with _SESSION_CACHE_LOCK:
+        return _ARCHIVE_SCHEDULES.setdefault(year, schedule)
+
+
+def _build_archived_session(year: int, gp, session_type):
+    from fastf1.core import Session
+    from fastf1.events import Event
+
+    if not isinstance(gp, Integral) or not isinstance(session_type, Integral):
+        raise ValueError("Offline archive sessions are addressed by event index and session number")
+    _, event = _resolve_event_from_index(year, int(gp))
+    session_name = event.get(f"Session{int(session_type)}")
+    if session_name is None or pd.isna(session_name):
+        raise ValueError(f"Session {session_type} of event {gp} is not in the offline archive")
+
+    if not isinstance(event, Event):
+        event = Event(event)
+    start_cache_maintenance()
+    # Built from the archived schedule row: fastf1.get_session would fetch
+    # the season schedule through FastF1's HTTP layer first.
+    return Session(event, str(session_name), f1_api_support=True)
+
+
+def _populate_archived_session(session, key, telemetry, slim, lazy=False, report_stage=None):
+    """
+    Fill an unloaded session from the offline archive's snapshot and
+    telemetry store. Raises FileNotFoundError when they are missing, as
+    there is nothing to fall back to.
+    """
+
+    telemetry_dir = None
+    if telemetry:
+        # Either variant will do: full telemetry is slimmed in memory below.
+        for candidate in (_telemetry_path(key, slim), _telemetry_path(key, not slim)):
+            if has_session_telemetry(_archive_path(candidate)):
+                telemetry_dir = _archive_path(candidate)
+                break
+
+    with span("restore_archive") as current:
+        restored = restore_session_snapshot(
+            session,
+            _archive_path(_snapshot_path(key)),
+            telemetry=telemetry and telemetry_dir is None,
+            lazy=lazy,
+        )
+        if restored and telemetry_dir is not None:
+            restored = map_session_telemetry(session, telemetry_dir, lazy=lazy)
+        current.set(restored=bool(restored), mapped=telemetry_dir is not None)
+    if not restored:
+        raise FileNotFoundError(f"Session {key} is not in the offline archive {OFFLINE_ARCHIVE_DIR}")
+    if report_stage is not None:
+        report_stage()
+
+    if telemetry and slim:
+        with span("slim_session"):
+            _slim_session(session)
+    return True
+
+
+def _defer_fastf1_telemetry(session, key, slim):
+    """
+    Give a session loaded without telemetry lazy car/position data that
+    FastF1 parses later. FastF1 decodes the telemetry streams of all drivers
+    in one pass, so one parse fills every driver. Session load jobs run it
+    right after the load through parse_deferred_telemetry; otherwise the
+    first access does. The result is then written to the channel store in
+    the background, making later loads of the session lazy per driver.
+    """
+
+    lock = threading.RLock()
+    drivers = list(session.drivers)
+
+    def _parse():
+        with lock:
+            if getattr(session, "_f1d_telemetry_parsed", False):
+                return
+            # FastF1 rebuilds _car_data/_pos_data and adds LapStartDate to
+            # the laps while parsing; a copy of the session and its laps keeps
+            # concurrent readers off both until the results are swapped in.
+            parsed = copy.copy(session)
+            parsed._laps = session._laps.copy()
+            with span("fastf1_parse_telemetry", drivers=len(drivers)):
+                parsed._load_telemetry()
+            session._laps = parsed._laps
+            session._t0_date = getattr(parsed, "_t0_date", None)
+            for source in ("car", "pos"):
+                target = getattr(session, f"_{source}_data")
+                for drv, frame in getattr(parsed, f"_{source}_data", {}).items():
+                    frame.session = session
+                    target.put(drv, frame)
+            setattr(session, "_f1d_telemetry_parsed", True)
+        if TELEMETRY_MMAP_ENABLED:
+            # Tracked like snapshot writes: with the store enabled the
+            # snapshot leaves telemetry out, so this is its only copy.
+            _track_session_write(
+                schedule_session_work(
+                    write_session_telemetry,
+                    session,
+                    _telemetry_path(key, slim),
+                    priority=PRIORITY_BACKGROUND,
+                ),
+                "telemetry",
+            )
+
+    def _load(driver):
+        _parse()
+        return None
+
+    session._car_data = LazyTelemetry(drivers, _load, lock)
+    session._pos_data = LazyTelemetry(drivers, _load, lock)
+    setattr(session, "_f1d_deferred_parse", _parse)
+
+
+def parse_deferred_telemetry(session, progress=None, cancel_event=None):
+    """
+    Run the FastF1 telemetry parse that a lazy load deferred, on the calling
+    thread. Does nothing for sessions without a pending parse
+
+    :param progress: Optional callable receiving the telemetry stages of LOAD_STAGES
+    :param cancel_event: Optional threading.Event; once set the parse raises
+        SessionLoadCancelled before it starts
+    """
+
+    parse = getattr(session, "_f1d_deferred_parse", None)
+    if parse is None or getattr(session, "_f1d_telemetry_parsed", False):
         return session
+    with _report_load_progress(progress, cancel_event, first_stage="car_data") as report_stage:
+        parse()
+        report_stage("merge")
+    return session
+
+
+def wait_for_session_writes(timeout=None, kinds=("snapshot", "telemetry")):
+    """
+    Block until the snapshot and telemetry store writes scheduled so far
+    have finished
+
+    :param timeout: Optional limit in seconds
+    :param kinds: Only wait for these kinds of write
+    """
+
+    with _SESSION_CACHE_LOCK:
+        pending = [future for future, kind in _PENDING_WRITES.items() if kind in kinds]
+    futures_wait(pending, timeout=timeout)
+
+
+def _schedule_snapshot_write(session, path):
+    # Mapped telemetry already lives in the channel store; keep it out of the snapshot.
+    _track_session_write(
+        schedule_session_work(
+            write_session_snapshot,
+            session,
+            path,
+            telemetry=not TELEMETRY_MMAP_ENABLED,
+            priority=PRIORITY_BACKGROUND,
+        ),
+        "snapshot",
+    )
+
+
+def _track_session_write(future, kind):
+    with _SESSION_CACHE_LOCK:
+        _PENDING_WRITES[future] = kind
+    future.add_done_callback(_session_write_done)
+
+
+def _session_write_done(future):
+    with _SESSION_CACHE_LOCK:
+        _PENDING_WRITES.pop(future, None)
+    if not future.cancelled() and future.exception() is not None:
+        logging.getLogger(__name__).warning("Session cache write failed: %s", future.exception())
+
+
+def _snapshot_path(key):
+    return os.path.join(SNAPSHOT_DIR, f"{_storage_key(key)}.npz")
+
+
+def _telemetry_path(key, slim):
+    return os.path.join(TELEMETRY_DIR, "slim" if slim else "full", _storage_key(key))
+
+
+def slim_telemetry(frame, columns=None, dtypes=None):
+    """
+    Return a telemetry frame downcast to compact dtypes
+
+    :param frame: Telemetry or DataFrame; it is not modified
+    :param columns: Optional columns to keep; otherwise SLIM_DROP_COLUMNS are dropped
+    :param dtypes: Column -> dtype overrides on top of SLIM_DTYPES
+    """
+
+    if columns is not None:
+        frame = frame[[column for column in columns if column in frame.columns]]
+    else:
+        dropped = [column for column in SLIM_DROP_COLUMNS if column in frame.columns]
+        if dropped:
+            frame = frame.drop(columns=dropped)
+
+    target = dict(SLIM_DTYPES, **(dtypes or {}))
+    casts = {}
+    for column, dtype in target.items():
+        if column not in frame.columns or frame[column].dtype == dtype:
+            continue
+        # Integer/bool casts would fail (or silently fill) on missing values.
+        if pd.api.types.pandas_dtype(dtype).kind in "iub" and frame[column].isna().any():
+            continue
+        casts[column] = dtype
+    return frame.astype(casts) if casts else frame
+
+
+def session_memory_usage(session):
+    """
+    Return the in-memory size in bytes of a session's laps, results and telemetry
+    """
+
+    frames = [getattr(session, "_laps", None), getattr(session, "_results", None)]
+    for attr in ("_car_data", "_pos_data"):
+        # Drivers loaded so far only: values() would load lazy telemetry.
+        frames.extend(dict.values(getattr(session, attr, {})))
+    return int(sum(frame.memory_usage(deep=True).sum() for frame in frames if frame is not None))
+
+
+def _slim_session(session):
+    before = session_memory_usage(session)
+    for attr in ("_car_data", "_pos_data"):
+        data = getattr(session, attr, None)
+        if isinstance(data, LazyTelemetry):
+            data.add_transform(slim_telemetry)
+        elif data:
+            setattr(session, attr, {driver: slim_telemetry(frame) for driver, frame in data.items()})
+    after = session_memory_usage(session)
+
+    setattr(session, "_f1d_memory", {"before": before, "after": after})
+    logging.getLogger(__name__).info(
+        "Slimmed %s: %.1f MB -> %.1f MB",
+        session,
+        before / 1e6,
+        after / 1e6,
+    )
+
+
+def has_persisted_session(year: int, gp, session_type, telemetry=True):
+    """
+    Return True when load_session can restore the session from disk, without
+    a FastF1 parse: its snapshot, plus the channel store or snapshot
+    telemetry when telemetry is requested
+
+    :param telemetry: Also require persisted car/position data
+    """
+
+    if SYNTHETIC_SESSIONS_ENABLED:
+        return False
+    key = _normalize_session_key(year, gp, session_type)
+    if OFFLINE_ARCHIVE_DIR:
+        snapshot = _archive_path(_snapshot_path(key))
+        stores = [_archive_path(_telemetry_path(key, slim)) for slim in (True, False)]
+    elif SESSION_SNAPSHOTS_ENABLED:
+        snapshot = _snapshot_path(key)
+        stores = [_telemetry_path(key, SLIM_SESSIONS_ENABLED)] if TELEMETRY_MMAP_ENABLED else []
+    else:
+        return False
+
+    if not os.path.isfile(snapshot):
+        return False
+    if not telemetry:
+        return True
+    return any(has_session_telemetry(store) for store in stores) or snapshot_has_telemetry(snapshot)
+
+
+def get_cached_session(year: int, gp, session_type, telemetry=True):
+    """
+    Return an already loaded session without triggering a load
+
+    :param year: Year of the session
+    :param gp: Event name (legacy) or supported event index
+    :param session_type: Session identifier by name/code (legacy) or session number
+    :param telemetry: Only return the session if it was loaded with telemetry
+    """
+
+    key = _normalize_session_key(year, gp, session_type)
+    with _SESSION_CACHE_LOCK:
+        cached = _SESSION_CACHE.get(key)
+    if cached is None:
+        return None
+    if telemetry and not getattr(cached, "_f1d_has_telemetry", False):
+        return None
+    return cached
+
+
+def cached_sessions():
+    """
+    Return [(key, session)] for every session held in memory
+    """
+
+    with _SESSION_CACHE_LOCK:
+        return list(_SESSION_CACHE.items())
+
+
+def session_derived_items(session):
+    """
+    Return a snapshot of the (name, value) pairs in a session's derived cache
+    """
+
+    with _SESSION_CACHE_LOCK:
+        return list((getattr(session, "_f1d_derived", None) or {}).items())
+
+
+def evict_session(year: int, gp, session_type):
+    """
+    Drop a session from the in-memory cache and return it, or None if it was
+    not loaded. Files on disk are kept, so the next request reloads it quickly
+
+    :param year: Year of the session
+    :param gp: Event name (legacy) or supported event index
+    :param session_type: Session identifier by name/code (legacy) or session number
+    """
+
+    key = _normalize_session_key(year, gp, session_type)
+    with _SESSION_CACHE_LOCK:
+        return _SESSION_CACHE.pop(key, None)
+
+
+def get_session_derived(session, name, builder, persist=False):
+    """
+    Return a derived object cached alongside the session, building it on first use
+
+    :param session: Session Object
+    :param name: Cache key for the derived object
+    :param builder: Callable taking the session and returning the derived object
+    :param persist: Also read/write the object under DERIVED_DIR so it
+        survives restarts and can be prepared by the warm-up CLI; it must
+        then be a DataFrame or JSON value (see write_value_file)
+    """
+
+    with _SESSION_CACHE_LOCK:
+        derived = getattr(session, "_f1d_derived", None)
+        if derived is None:
+            derived = {}
+            setattr(session, "_f1d_derived", derived)
+            setattr(session, "_f1d_derived_locks", {})
+        if name in derived:
+            return derived[name]
+        # Per-name lock: concurrent callers (e.g. per-driver threads) wait
+        # for one build instead of each building the same object.
+        build_lock = session._f1d_derived_locks.setdefault(name, threading.Lock())
+
+    with build_lock:
+        with _SESSION_CACHE_LOCK:
+            if name in derived:
+                return derived[name]
+
+        label = name[0] if isinstance(name, tuple) else name
+        with span(f"derived.{label}") as current:
+            path = _derived_path(session, name) if persist else None
+            value = _read_value(path) if path else None
+            source = "disk"
+            if value is None and path and OFFLINE_ARCHIVE_DIR:
+                value = _read_value(_archive_path(path))
+                source = "archive"
+            if value is None:
+                value = builder(session)
+                source = "built"
+                if path:
+                    _write_value(path, value)
+            current.set(source=source)
+            if isinstance(value, pd.DataFrame):
+                current.set(rows=len(value))
+
+        with _SESSION_CACHE_LOCK:
+            return derived.setdefault(name, value)
+
+
+def session_storage_key(session):
+    """
+    Return a filesystem-safe key for a session loaded through load_session,
+    or None for sessions created elsewhere
+    """
+
+    key = getattr(session, "_f1d_key", None)
+    if key is None or getattr(session, "_f1d_synthetic", False):
+        return None
+    return _storage_key(key)
+
+
+def _storage_key(key):
+    return "-".join(
+        "".join(ch if ch.isalnum() else "_" for ch in str(part))
+        for part in key
+    )
+
+
+def _derived_path(session, name):
+    storage_key = session_storage_key(session)
+    if storage_key is None:
+        return None
+    parts = name if isinstance(name, tuple) else (name,)
+    filename = "-".join(str(part) for part in parts) + ".npz"
+    # Slim and full sessions derive different data from the same session key.
+    variant = "slim" if getattr(session, "_f1d_slim", False) else "full"
+    return os.path.join(DERIVED_DIR, f"v{DERIVED_FORMAT_VERSION}", variant, storage_key, filename)
+
+
+def _read_value(path):
+    try:
+        return read_value_file(path)
+    except Exception:
+        return None
+
+
+def _write_value(path, value):
+    # write_value_file writes then renames, so concurrent readers (other
+    # workers, the warm-up CLI) never see a partial file.
+    try:
+        write_value_file(path, value)
+    except Exception as exc:
+        logging.getLogger(__name__).warning("Could not persist %s: %s", path, exc)
+
+
+def start_cache_maintenance(interval=None):
+    """
+    Start the background thread that queues run_cache_maintenance on the
+    background scheduler every interval seconds (default
+    CACHE_MAINTENANCE_INTERVAL). Runs once per process; a no-op when the
+    interval is 0
+    """
+
+    global _MAINTENANCE_THREAD
+    interval = CACHE_MAINTENANCE_INTERVAL if interval is None else interval
+    if interval <= 0:
+        return
+    with _SESSION_CACHE_LOCK:
+        if _MAINTENANCE_THREAD is not None:
+            return
+
+        def _loop():
+            while True:
+                time.sleep(interval)
+                schedule_session_work(run_cache_maintenance, priority=PRIORITY_BACKGROUND)
+
+        _MAINTENANCE_THREAD = threading.Thread(target=_loop, name="f1d-cache-maintenance", daemon=True)
+        _MAINTENANCE_THREAD.start()
+
+
+def run_cache_maintenance(max_bytes=None):
+    """
+    Refresh the timestamps of this process's loaded sessions, then compact
+    the cache and enforce its size budget. Only one process maintains the
+    cache at a time; returns None when another one holds the lock
+
+    :param max_bytes: Size cap; defaults to CACHE_MAX_BYTES
+    """
+
+    for key, session in cached_sessions():
+        _touch_cache_entries(session, key)
+
+    with _maintenance_lock() as acquired:
+        if not acquired:
+            return None
+        summary = compact_cache()
+        summary["evicted"] = enforce_cache_budget(max_bytes)
+        return summary
+
+
+def compact_cache():
+    """
+    Drop FastF1 HTTP responses older than HTTP_CACHE_MAX_AGE_DAYS and vacuum
+    the HTTP cache, remove derived data of old format versions, old job
+    statuses, interrupted temporary files and empty directories. Returns
+    the freed bytes and removed paths
+    """
+
+    removed = []
+    freed = _prune_http_cache()
+    now = time.time()
+
+    if os.path.isdir(DERIVED_DIR):
+        for name in os.listdir(DERIVED_DIR):
+            if name != f"v{DERIVED_FORMAT_VERSION}":
+                freed += _remove_path(os.path.join(DERIVED_DIR, name), removed)
+
+    for path in _walk_files(JOB_DIR):
+        if now - _last_used(path) > JOB_STATUS_MAX_AGE:
+            freed += _remove_path(path, removed)
+
+    for root in (SNAPSHOT_DIR, TELEMETRY_DIR, DERIVED_DIR, INDEX_DIR):
+        for dirpath, dirnames, filenames in os.walk(root):
+            for name in list(dirnames) + filenames:
+                path = os.path.join(dirpath, name)
+                if name.endswith(".tmp") and now - _last_used(path) > STALE_TMP_AGE:
+                    freed += _remove_path(path, removed)
+                    if name in dirnames:
+                        dirnames.remove(name)
+
+    _remove_empty_dirs(CACHE_DIR)
+    return {"freed_bytes": freed, "removed": removed}
+
+
+def enforce_cache_budget(max_bytes=None):
+    """
+    Evict the least recently used cache entries until CACHE_DIR fits in
+    max_bytes. Entries of sessions loaded in this process, or used within
+    CACHE_EVICTION_GRACE, are never evicted. Returns the evicted entries
+
+    :param max_bytes: Size cap; defaults to CACHE_MAX_BYTES, 0 disables eviction
+    """
+
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else int(max_bytes)
+    if max_bytes <= 0:
+        return []
+
+    total = _tree_size(CACHE_DIR)
+    if total <= max_bytes:
+        return []
+
+    protected = _loaded_cache_paths()
+    now = time.time()
+    evicted = []
+    for entry in sorted(_cache_entries(), key=lambda item: item["last_used"]):
+        if total <= max_bytes:
+            break
+        if now - entry["last_used"] < CACHE_EVICTION_GRACE:
+            break
+        if any(os.path.abspath(path) in protected for path in entry["paths"]):
+            continue
+        freed = sum(_remove_path(path) for path in entry["paths"])
+        total -= freed
+        evicted.append(
+            {"kind": entry["kind"], "season": entry["season"], "name": entry["name"], "bytes": freed}
+        )
+        logging.getLogger(__name__).info(
+            "Evicted %s cache entry %s (%.1f MB)", entry["kind"], entry["name"], freed / 1e6
+        )
+
+    _remove_empty_dirs(CACHE_DIR)
+    return evicted
+
+
+def cache_usage_report():
+    """
+    Return disk usage of CACHE_DIR in bytes per season, split into FastF1
+    data, snapshots, telemetry stores and derived data, plus the shared
+    HTTP cache, indexes and job statuses
+    """
+
+    seasons = {}
+    for entry in _cache_entries():
+        for path in entry["paths"]:
+            part = _cache_part(path)
+            usage = seasons.setdefault(entry["season"], {})
+            usage[part] = usage.get(part, 0) + _tree_size(path)
+    for usage in seasons.values():
+        usage["total"] = sum(usage.values())
+
+    shared = {
+        "http_cache": sum(
+            _tree_size(os.path.join(CACHE_DIR, name))
+            for name in (os.listdir(CACHE_DIR) if os.path.isdir(CACHE_DIR) else [])
+            if name.startswith("fastf1_http_cache")
+        ),
+        "index": _tree_size(INDEX_DIR),
+        "jobs": _tree_size(JOB_DIR),
+    }
+    return {
+        "seasons": dict(sorted(seasons.items())),
+        "shared": shared,
+        "total_bytes": _tree_size(CACHE_DIR),
+        "max_bytes": CACHE_MAX_BYTES,
+    }
+
+
+def _cache_entries():
+    """
+    One entry per evictable unit: each FastF1 session folder
+    (CACHE_DIR/<season>/<event>/<session>) and, per storage key, the
+    session's snapshot, telemetry stores and derived data together
+    """
+
+    entries = []
+    if os.path.isdir(CACHE_DIR):
+        for season in sorted(os.listdir(CACHE_DIR)):
+            season_dir = os.path.join(CACHE_DIR, season)
+            if not season.isdigit() or not os.path.isdir(season_dir):
+                continue
+            for event in os.listdir(season_dir):
+                event_dir = os.path.join(season_dir, event)
+                if not os.path.isdir(event_dir):
+                    continue
+                for name in os.listdir(event_dir):
+                    path = os.path.join(event_dir, name)
+                    if os.path.isdir(path):
+                        entries.append({"kind": "fastf1", "season": season, "name": f"{event}/{name}", "paths": [path]})
+
+    by_key = {}
+    for path in _walk_children(SNAPSHOT_DIR):
+        if path.endswith(".npz"):
+            by_key.setdefault(os.path.basename(path)[:-4], []).append(path)
+    for variant in ("slim", "full"):
+        for path in _walk_children(os.path.join(TELEMETRY_DIR, variant)):
+            if not path.endswith(".tmp"):
+                by_key.setdefault(os.path.basename(path), []).append(path)
+    for variant in ("slim", "full"):
+        for path in _walk_children(os.path.join(DERIVED_DIR, f"v{DERIVED_FORMAT_VERSION}", variant)):
+            by_key.setdefault(os.path.basename(path), []).append(path)
+    for storage_key, paths in by_key.items():
+        entries.append({"kind": "session", "season": storage_key.split("-")[0], "name": storage_key, "paths": paths})
+
+    for entry in entries:
+        entry["last_used"] = max(_last_used(path) for path in entry["paths"])
+    return entries
+
+
+def _cache_part(path):
+    for root, part in (
+        (SNAPSHOT_DIR, "snapshots"),
+        (TELEMETRY_DIR, "telemetry"),
+        (DERIVED_DIR, "derived"),
+    ):
+        if os.path.abspath(path).startswith(os.path.abspath(root) + os.sep):
+            return part
+    return "fastf1"
+
+
+def _session_cache_paths(session, key):
+    paths = []
+    api_path = getattr(session, "api_path", None)
+    if api_path:
+        # FastF1 keeps a session's parsed data under CACHE_DIR + api_path
+        # minus its "/static/" prefix.
+        paths.append(os.path.join(CACHE_DIR, api_path[len("/static/"):].strip("/")))
+    if session_storage_key(session) is not None:
+        storage_key = _storage_key(key)
+        paths.append(_snapshot_path(key))
+        for variant in ("slim", "full"):
+            paths.append(os.path.join(TELEMETRY_DIR, variant, storage_key))
+            paths.append(os.path.join(DERIVED_DIR, f"v{DERIVED_FORMAT_VERSION}", variant, storage_key))
+    return paths
+
+
+def _loaded_cache_paths():
+    return {
+        os.path.abspath(path)
+        for key, session in cached_sessions()
+        for path in _session_cache_paths(session, key)
+    }
+
+
+def _touch_cache_entries(session, key):
+    for path in _session_cache_paths(session, key):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+@contextmanager
+def _maintenance_lock():
+    try:
+        import fcntl
+    except ImportError:
+        yield True
+        return
+
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    with open(os.path.join(INDEX_DIR, ".maintenance.lock"), "a") as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _prune_http_cache():
+    path = os.path.join(CACHE_DIR, "fastf1_http_cache.sqlite")
+    if OFFLINE_ARCHIVE_DIR or HTTP_CACHE_MAX_AGE_DAYS <= 0 or not os.path.isfile(path):
+        return 0
+
+    from datetime import timedelta
+
+    from requests_cache.backends.sqlite import SQLiteCache
+
+    before = os.path.getsize(path)
+    try:
+        cache = SQLiteCache(path)
+        cache.delete(older_than=timedelta(days=HTTP_CACHE_MAX_AGE_DAYS))
+        cache.responses.vacuum()
+        cache.close()
+    except Exception as exc:
+        # Typically "database is locked" while another process writes to it.
+        logging.getLogger(__name__).warning("Could not compact the HTTP cache: %s", exc)
+        return 0
+    return max(0, before - os.path.getsize(path))
+
+
+def _walk_children(directory):
+    if not os.path.isdir(directory):
+        return []
+    return [os.path.join(directory, name) for name in os.listdir(directory)]
+
+
+def _walk_files(directory):
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            yield os.path.join(dirpath, name)
+
+
+def _last_used(path):
+    # Access time alone is unreliable (relatime/noatime mounts), so the
+    # latest of access and modification time over the whole tree counts.
+    # Directories count by mtime only: walking them updates their atime.
+    try:
+        latest = os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+    for item in _walk_files(path) if os.path.isdir(path) else [path]:
+        try:
+            info = os.stat(item)
+        except OSError:
+            continue
+        latest = max(latest, info.st_atime, info.st_mtime)
+    return latest
+
+
+def _tree_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for item in _walk_files(path):
+        try:
+            total += os.path.getsize(item)
+        except OSError:
+            pass
+    return total
+
+
+def _remove_path(path, removed=None):
+    size = _tree_size(path)
+    try:
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    except OSError as exc:
+        logging.getLogger(__name__).warning("Could not remove %s: %s", path, exc)
+        return 0
+    if removed is not None:
+        removed.append(path)
+    return size
+
+
+def _remove_empty_dirs(root):
+    for dirpath, _, _ in sorted(os.walk(root), key=lambda item: -len(item[0])):
+        if dirpath == root or dirpath in (SNAPSHOT_DIR, TELEMETRY_DIR, DERIVED_DIR, INDEX_DIR, JOB_DIR):
+            continue
+        try:
+            os.rmdir(dirpath)
+        except OSError:
+            pass
+
 
 #Telemetry extraction
+def lap_telemetry(lap, frequency=None):
+    """
+    Return a lap's merged car and position telemetry as Lap.get_telemetry
+    does, minus the DriverAhead / DistanceToDriverAhead channels: those read
+    every other driver's telemetry, which defeats lazy loading, and the
+    dashboard does not use them
+
+    :param lap: FastF1 Lap
+    :param frequency: Optional resampling frequency for merge_channels
+    """
+
+    pos_data = lap.get_pos_data(pad=1, pad_side="both")
+    car_data = lap.get_car_data(pad=1, pad_side="both").add_distance().add_relative_distance()
+    merged = pos_data.merge_channels(car_data, frequency=frequency)
+    return merged.slice_by_lap(lap, interpolate_edges=True)
+
+
 def get_driver_telemetry(session, driver: str):
     """
     Returns Telemetry data for the selected driver's fastest lap
@@ -109,7 +1621,7 @@ def get_driver_telemetry(session, driver: str):
     lap = session.laps.pick_driver(driver).pick_fastest()
     if lap is None or lap.empty:
         return pd.DataFrame(columns=["Distance", "Speed", "Throttle", "Brake", "nGear", "X", "Y"])
-    tel1 = lap.get_telemetry()
+    tel1 = lap_telemetry(lap)
 
     tel = tel1.add_distance()
 
@@ -137,13 +1649,16 @@ def fastest_lap_table(session, drivers):
 
         rows.append({
             "Driver": drv,
-            "LapTime": format_timedelta(lap["LapTime"]),
-            "Sector1": format_timedelta(lap["Sector1Time"]),
-            "Sector2": format_timedelta(lap["Sector2Time"]),
-            "Sector3": format_timedelta(lap["Sector3Time"]),
+            "LapTime": lap["LapTime"],
+            "Sector1": lap["Sector1Time"],
+            "Sector2": lap["Sector2Time"],
+            "Sector3": lap["Sector3Time"],
         })
 
-    return pd.DataFrame(rows)
+    table = pd.DataFrame(rows, columns=["Driver", "LapTime", "Sector1", "Sector2", "Sector3"])
+    for column in ["LapTime", "Sector1", "Sector2", "Sector3"]:
+        table[column] = format_timedelta_series(table[column], na_rep="-")
+    return table
 
 #track map data
 def get_track_coords(session, driver):
@@ -156,19 +1671,5 @@ def get_track_coords(session, driver):
     lap = session.laps.pick_driver(driver).pick_fastest()
     if lap is None or lap.empty:
         return pd.DataFrame(columns=["X", "Y"])
-    tel1 = lap.get_telemetry()
+    tel1 = lap_telemetry(lap)
     return tel1[['X', 'Y']]
-
-#re-format time data
-def format_timedelta(td):
-    """
-    Helper function for formatting time data
-    
-    :param td: Time data
-    """
-    if pd.isna(td):
-        return "-"
-    total_seconds = td.total_seconds()
-    mins = int(total_seconds // 60)
-    secs = total_seconds % 60
-    return f"{mins}:{secs:06.3f}"
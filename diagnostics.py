@@ -0,0 +1,348 @@
+# diagnostics.py
+"""
+Memory diagnostics for loaded sessions, and an admin page to act on them.
+
+session_memory_report() sizes every session held by data_engine, split into
+laps, results, car_data, pos_data and derived caches, next to the process's
+resident memory. Telemetry memory-mapped from the shared channel store is
+counted apart from heap memory: its pages are file-backed and shared by all
+workers, so evicting a session does not give them back.
+
+install_admin(app) serves the report on /_f1d/admin/memory (HTML, with a
+button to evict each session) and /_f1d/admin/memory.json. The routes exist
+only when F1D_ADMIN_TOKEN is set, and every request must carry that token as
+a ?token= parameter, a form field or an "Authorization: Bearer" header.
+/_f1d/admin/disk.json serves the per-season disk cache usage report.
+"""
+import gc
+import hmac
+import html
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from data_engine import cache_usage_report, cached_sessions, evict_session, session_derived_items
+
+
+ADMIN_TOKEN = os.environ.get("F1D_ADMIN_TOKEN", "")
+
+ADMIN_ROUTE = "/_f1d/admin/memory"
+
+DISK_ROUTE = "/_f1d/admin/disk.json"
+
+SESSION_PARTS = ("laps", "results", "car_data", "pos_data", "derived")
+
+# /proc/self/status fields reported with the process memory, in kB there.
+_PROCESS_FIELDS = {
+    "VmRSS": "rss_bytes",
+    "RssAnon": "anon_bytes",
+    "RssFile": "file_bytes",
+    "RssShmem": "shmem_bytes",
+    "VmHWM": "peak_rss_bytes",
+}
+
+
+class MemorySize:
+    """
+    Heap bytes plus bytes of memory-mapped buffers.
+    """
+
+    __slots__ = ("heap", "mapped")
+
+    def __init__(self, heap=0, mapped=0):
+        self.heap = heap
+        self.mapped = mapped
+
+    def add(self, other):
+        self.heap += other.heap
+        self.mapped += other.mapped
+        return self
+
+    def as_dict(self):
+        return {"heap_bytes": int(self.heap), "mapped_bytes": int(self.mapped)}
+
+
+def deep_sizeof(value, seen=None):
+    """
+    Returns the MemorySize of value and everything it references. Buffers
+    shared by several frames or arrays are counted once per seen set, and
+    FastF1 sessions referenced from frames are not followed.
+    """
+    if seen is None:
+        seen = set()
+    return _sizeof(value, seen)
+
+
+def session_memory_breakdown(session, seen=None):
+    """
+    Returns {part: MemorySize} for SESSION_PARTS of one session.
+    """
+    if seen is None:
+        seen = set()
+    return {
+        "laps": _sizeof(getattr(session, "_laps", None), seen),
+        "results": _sizeof(getattr(session, "_results", None), seen),
+        "car_data": _sizeof(getattr(session, "_car_data", None), seen),
+        "pos_data": _sizeof(getattr(session, "_pos_data", None), seen),
+        "derived": _sizeof(dict(session_derived_items(session)), seen),
+    }
+
+
+def session_memory_report():
+    """
+    Returns the memory breakdown of every cached session, largest heap
+    first, together with process memory figures.
+    """
+    sessions = []
+    # Shared across sessions: buffers two sessions share are counted once.
+    seen = set()
+    for key, session in cached_sessions():
+        parts = session_memory_breakdown(session, seen)
+        total = MemorySize()
+        for size in parts.values():
+            total.add(size)
+        sessions.append(
+            {
+                "key": list(key),
+                "label": _session_label(session),
+                "parts": {part: size.as_dict() for part, size in parts.items()},
+                "derived_entries": len(session_derived_items(session)),
+                **total.as_dict(),
+            }
+        )
+    sessions.sort(key=lambda entry: entry["heap_bytes"], reverse=True)
+
+    return {
+        "sessions": sessions,
+        "sessions_heap_bytes": sum(entry["heap_bytes"] for entry in sessions),
+        "sessions_mapped_bytes": sum(entry["mapped_bytes"] for entry in sessions),
+        "process": process_memory(),
+    }
+
+
+def process_memory():
+    """
+    Returns resident memory figures of this process in bytes (Linux only;
+    empty elsewhere).
+    """
+    values = {}
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as handle:
+            for line in handle:
+                name, _, rest = line.partition(":")
+                if name in _PROCESS_FIELDS:
+                    values[_PROCESS_FIELDS[name]] = int(rest.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        return {}
+    return values
+
+
+def evict(key):
+    """
+    Evicts one cached session by its cache key and collects the garbage it
+    leaves. Returns True if the session was loaded.
+    """
+    evicted = evict_session(*key) is not None
+    if evicted:
+        # Laps and telemetry reference their session: free the cycle now.
+        gc.collect()
+    return evicted
+
+
+def install_admin(app):
+    """
+    Adds the admin memory routes to app's Flask server when F1D_ADMIN_TOKEN
+    is set.
+    """
+    if not ADMIN_TOKEN:
+        return app
+    server = app.server
+    server.add_url_rule(ADMIN_ROUTE, "f1d_admin_memory", _memory_view)
+    server.add_url_rule(f"{ADMIN_ROUTE}.json", "f1d_admin_memory_json", _memory_json_view)
+    server.add_url_rule(f"{ADMIN_ROUTE}/evict", "f1d_admin_evict", _evict_view, methods=["POST"])
+    server.add_url_rule(DISK_ROUTE, "f1d_admin_disk", _disk_json_view)
+    return app
+
+
+def _sizeof(value, seen):
+    if value is None:
+        return MemorySize()
+    if isinstance(value, pd.DataFrame):
+        return _frame_size(value, seen)
+    if isinstance(value, pd.Series):
+        return _frame_size(value.to_frame(), seen)
+    if isinstance(value, pd.Index):
+        return MemorySize(heap=int(value.memory_usage(deep=True)))
+    if isinstance(value, np.ndarray):
+        return _array_size(value, seen)
+    if isinstance(value, (str, bytes, int, float, bool)):
+        return MemorySize(heap=sys.getsizeof(value))
+    if _is_session(value) or id(value) in seen:
+        return MemorySize()
+    seen.add(id(value))
+
+    size = MemorySize(heap=sys.getsizeof(value))
+    if isinstance(value, dict):
+        # dict.items: lazy telemetry counts the drivers loaded so far only.
+        for key, item in dict.items(value):
+            size.add(_sizeof(key, seen)).add(_sizeof(item, seen))
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size.add(_sizeof(item, seen))
+    else:
+        for item in _attributes(value):
+            size.add(_sizeof(item, seen))
+    return size
+
+
+def _frame_size(frame, seen):
+    size = MemorySize(heap=int(frame.index.memory_usage(deep=True)))
+    for position in range(frame.shape[1]):
+        column = frame.iloc[:, position]
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind != "O":
+            size.add(_array_size(column.to_numpy(copy=False), seen))
+        else:
+            size.heap += int(column.memory_usage(deep=True, index=False))
+    return size
+
+
+def _array_size(values, seen):
+    if values.dtype.kind == "O":
+        return MemorySize(heap=int(pd.Series(values, copy=False).memory_usage(deep=True, index=False)))
+    # Count the buffer a view points into, once: a consolidated pandas block
+    # or a memory-mapped channel file.
+    root = values
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if id(root) in seen:
+        return MemorySize()
+    seen.add(id(root))
+    if isinstance(root, np.memmap):
+        return MemorySize(mapped=root.nbytes)
+    return MemorySize(heap=root.nbytes)
+
+
+def _attributes(value):
+    items = list(getattr(value, "__dict__", {}).values())
+    for slot in getattr(type(value), "__slots__", ()):
+        if hasattr(value, slot):
+            items.append(getattr(value, slot))
+    return items
+
+
+def _is_session(value):
+    core = sys.modules.get("fastf1.core")
+    return core is not None and isinstance(value, core.Session)
+
+
+def _session_label(session):
+    try:
+        return f"{session.event.year} {session.event['EventName']} - {session.name}"
+    except Exception:
+        return str(session)
+
+
+def _authorised():
+    from flask import request
+
+    header = request.headers.get("Authorization", "")
+    supplied = (
+        request.args.get("token")
+        or request.form.get("token")
+        or (header[7:] if header.startswith("Bearer ") else "")
+    )
+    return bool(supplied) and hmac.compare_digest(supplied.encode("utf-8"), ADMIN_TOKEN.encode("utf-8"))
+
+
+def _memory_json_view():
+    from flask import abort, jsonify
+
+    if not _authorised():
+        abort(403)
+    return jsonify(session_memory_report())
+
+
+def _disk_json_view():
+    from flask import abort, jsonify
+
+    if not _authorised():
+        abort(403)
+    return jsonify(cache_usage_report())
+
+
+def _evict_view():
+    from flask import abort, redirect, request, url_for
+
+    if not _authorised():
+        abort(403)
+    key = [request.form.get(part, "") for part in ("year", "gp", "session_type")]
+    # Cache keys hold ints for dropdown selections, strings for legacy names.
+    key = [int(part) if part.lstrip("-").isdigit() else part for part in key]
+    evicted = evict(key)
+    return redirect(url_for("f1d_admin_memory", token=request.form.get("token"), evicted=int(evicted)))
+
+
+def _memory_view():
+    from flask import abort, request
+
+    if not _authorised():
+        abort(403)
+    report = session_memory_report()
+    token = html.escape(request.args.get("token", ""), quote=True)
+
+    header = "".join(f"<th>{part}</th>" for part in SESSION_PARTS)
+    rows = []
+    for entry in report["sessions"]:
+        cells = "".join(
+            f"<td>{_mib(entry['parts'][part]['heap_bytes'])}"
+            + (f" <small>+{_mib(entry['parts'][part]['mapped_bytes'])} mapped</small>" if entry["parts"][part]["mapped_bytes"] else "")
+            + "</td>"
+            for part in SESSION_PARTS
+        )
+        fields = "".join(
+            f'<input type="hidden" name="{name}" value="{html.escape(str(value), quote=True)}">'
+            for name, value in zip(("year", "gp", "session_type"), entry["key"])
+        )
+        rows.append(
+            f"<tr><td>{html.escape(entry['label'])}<br><small>{html.escape(str(entry['key']))}</small></td>"
+            f"{cells}<td><b>{_mib(entry['heap_bytes'])}</b></td><td>{_mib(entry['mapped_bytes'])}</td>"
+            f"<td>{entry['derived_entries']}</td>"
+            f'<td><form method="post" action="{ADMIN_ROUTE}/evict">{fields}'
+            f'<input type="hidden" name="token" value="{token}"><button>Evict</button></form></td></tr>'
+        )
+
+    process = report["process"]
+    process_text = ", ".join(
+        f"{label} {_mib(process[field])}"
+        for field, label in (
+            ("rss_bytes", "RSS"),
+            ("anon_bytes", "anonymous"),
+            ("file_bytes", "file-backed"),
+            ("shmem_bytes", "shared"),
+            ("peak_rss_bytes", "peak RSS"),
+        )
+        if field in process
+    ) or "unavailable"
+    notice = ""
+    if request.args.get("evicted") is not None:
+        notice = "<p><i>Session evicted.</i></p>" if request.args.get("evicted") == "1" else "<p><i>Session was not loaded.</i></p>"
+
+    return (
+        "<!DOCTYPE html><html><head><title>Session memory</title><style>"
+        "body{font-family:sans-serif;margin:24px}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}td:first-child{text-align:left}"
+        "</style></head><body>"
+        f"<h1>Session memory (pid {os.getpid()})</h1>{notice}"
+        f"<p>Process: {process_text}</p>"
+        f"<p>{len(report['sessions'])} cached session(s): {_mib(report['sessions_heap_bytes'])} heap, "
+        f"{_mib(report['sessions_mapped_bytes'])} memory-mapped.</p>"
+        f"<table><tr><th>session</th>{header}<th>heap</th><th>mapped</th><th>derived entries</th><th></th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+
+
+def _mib(value):
+    return f"{value / 2**20:.1f} MiB"
@@ -1,6 +1,6 @@
 import numpy as np
 import plotly.graph_objects as go
-from fastf1.plotting import get_driver_style
+from services.style_service import driver_color
 import pandas as pd
 
 from theme import COLORS, apply_standard_hover_layout
@@ -30,8 +30,7 @@ def _message_figure(message):
 def _driver_meta(session, driver):
     driver_info = session.get_driver(driver)
     abbr = driver_info["Abbreviation"]
-    style = get_driver_style(abbr, style=["color"], session=session)
-    return abbr, style["color"]
+    return abbr, driver_color(abbr, session)
 
 
 def _safe_seconds(value):
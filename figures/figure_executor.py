@@ -0,0 +1,169 @@
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from tracing import span
+
+
+# Worker processes for heavy figure builders. 0 builds figures inline in the
+# calling thread (useful for debugging and single-core hosts).
+FIGURE_WORKERS = max(0, int(os.environ.get("F1D_FIGURE_WORKERS", "2")))
+
+# Builders that may be offloaded, by name. Workers resolve them by import
+# path, so only these names and their compact inputs cross the process
+# boundary.
+FIGURE_BUILDERS = {
+    "shared_overlay": ("figures.telemetry_figure", "build_shared_overlay_figure"),
+    "full_session_speed": ("figures.session_telemetry_figure", "create_full_session_speed_figure"),
+    "lap_time_evolution": ("figures.lap_time_evolution_figure", "create_lap_time_evolution_figure"),
+}
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+class CompactFrame:
+    """
+    Column arrays (and index) of a DataFrame, rebuilt into a DataFrame on the
+    worker side. Pickles as a handful of NumPy buffers instead of a pandas
+    object graph.
+    """
+
+    __slots__ = ("columns", "index")
+
+    def __init__(self, columns, index=None):
+        self.columns = columns
+        self.index = index
+
+    def to_frame(self):
+        return pd.DataFrame(self.columns, index=self.index, copy=False)
+
+
+def compact_frame(frame, columns=None):
+    """
+    Packs the given columns (default: all) of a DataFrame for build_figure.
+    Columns missing from the frame are skipped.
+    """
+    if columns is None:
+        columns = list(frame.columns)
+    arrays = {
+        column: frame[column].to_numpy()
+        for column in columns
+        if column in frame.columns
+    }
+    index = None
+    if not frame.index.equals(pd.RangeIndex(len(frame))):
+        index = frame.index.to_numpy()
+    return CompactFrame(arrays, index=index)
+
+
+def build_figure(builder, **kwargs):
+    """
+    Runs a builder from FIGURE_BUILDERS with the given keyword arguments and
+    returns the figure as a plain dict ready for a dcc.Graph. CompactFrame
+    values (also inside dicts and lists) arrive at the builder as DataFrames.
+
+    The builder runs in a spawned worker process so its pure-Python trace
+    construction does not hold this process's GIL; it falls back to running
+    inline when FIGURE_WORKERS is 0 or the pool has died.
+    """
+    if builder not in FIGURE_BUILDERS:
+        raise KeyError(f"Unknown figure builder: {builder}")
+
+    with span(f"figure.{builder}") as current:
+        pool = _get_pool()
+        figure_json = None
+        if pool is not None:
+            try:
+                figure_json = pool.submit(_build_figure_json, builder, kwargs).result()
+            except BrokenProcessPool:
+                logging.getLogger(__name__).warning(
+                    "Figure worker pool died; building %s inline", builder
+                )
+                _discard_pool(pool)
+        current.set(worker=figure_json is not None)
+        if figure_json is None:
+            figure_json = _build_figure_json(builder, kwargs)
+        current.set(bytes=len(figure_json))
+        with span("decode_figure_json"):
+            return json.loads(figure_json)
+
+
+def shutdown_figure_executor():
+    """
+    Stops the worker processes. The next build_figure call starts new ones.
+    """
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_pool():
+    global _POOL
+    if FIGURE_WORKERS <= 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            # Spawn, not fork: the dashboard process holds threads, locks and
+            # mapped sessions that a forked child must not inherit.
+            _POOL = ProcessPoolExecutor(
+                max_workers=FIGURE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return _POOL
+
+
+def _discard_pool(pool):
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _reinit_after_fork():
+    # A pool inherited through fork (gunicorn workers) belongs to the parent.
+    global _POOL, _POOL_LOCK
+    _POOL = None
+    _POOL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
+
+
+def _warm_worker():
+    # Pay plotly's import cost once per worker rather than on the first figure.
+    import plotly.graph_objects  # noqa: F401
+    import plotly.subplots  # noqa: F401
+
+    for module_name, _ in FIGURE_BUILDERS.values():
+        importlib.import_module(module_name)
+
+
+def _build_figure_json(builder, kwargs):
+    module_name, function_name = FIGURE_BUILDERS[builder]
+    function = getattr(importlib.import_module(module_name), function_name)
+    fig = function(**_expand(kwargs))
+    return fig.to_json()
+
+
+def _expand(value):
+    if isinstance(value, CompactFrame):
+        return value.to_frame()
+    if isinstance(value, dict):
+        return {key: _expand(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_expand(item) for item in value]
+    return value
+
@@ -1,5 +1,5 @@
 import plotly.graph_objects as go
-from fastf1.plotting import get_driver_style
+from services.style_service import driver_color
 import numpy as np
 
 from theme import COLORS, apply_standard_hover_layout
@@ -33,7 +33,7 @@ def _message_figure(message):
     return fig
 
 
-def create_lap_time_evolution_figure(driver_payloads, session):
+def create_lap_time_evolution_figure(driver_payloads, session=None):
     if not driver_payloads:
         return _message_figure("No lap data available for the selected driver(s).")
 
@@ -51,9 +51,12 @@ def create_lap_time_evolution_figure(driver_payloads, session):
         if df.empty:
             continue
 
-        info = session.get_driver(driver)
-        abbr = info["Abbreviation"]
-        color = get_driver_style(abbr, style=["color"], session=session)["color"]
+        # Payloads may carry precomputed abbr/color so the session need not
+        # be available (e.g. when built in a figure worker process).
+        abbr = payload.get("abbr")
+        if abbr is None:
+            abbr = session.get_driver(driver)["Abbreviation"]
+        color = payload.get("color") or driver_color(abbr, session)
 
         plot_df = df.sort_values("LapNumber").copy()
         valid_df = plot_df[plot_df["IsValid"]].copy()
@@ -63,6 +66,26 @@ def create_lap_time_evolution_figure(driver_payloads, session):
             continue
         all_valid_times.extend(valid_df["LapTimeSeconds"].tolist())
 
+        hover_lines = [
+            f"{abbr} ({driver})",
+            "Lap %{x}",
+            "Lap Time: %{text}",
+            "Compound: %{customdata[0]}",
+        ]
+        custom_columns = [valid_df["Compound"].fillna("-").to_numpy(dtype=object)]
+        if "Vmax" in valid_df.columns:
+            hover_lines.extend(
+                [
+                    "Vmax: %{customdata[1]:.1f} km/h",
+                    "Avg Speed: %{customdata[2]:.1f} km/h",
+                    "Full Throttle: %{customdata[3]:.1f}%",
+                ]
+            )
+            custom_columns.extend(
+                valid_df[column].to_numpy(dtype=object)
+                for column in ["Vmax", "AvgSpeed", "FullThrottlePct"]
+            )
+
         fig.add_trace(
             go.Scatter(
                 x=valid_df["LapNumber"],
@@ -71,14 +94,9 @@ def create_lap_time_evolution_figure(driver_payloads, session):
                 name=f"{abbr} ({driver})",
                 marker=dict(color=color, size=6),
                 line=dict(color=color, width=2.0),
-                hovertemplate=(
-                    f"{abbr} ({driver})<br>"
-                    "Lap %{x}<br>"
-                    "Lap Time: %{text}<br>"
-                    "Compound: %{customdata}<extra></extra>"
-                ),
+                hovertemplate="<br>".join(hover_lines) + "<extra></extra>",
                 text=valid_df["LapTimeFormatted"],
-                customdata=valid_df["Compound"].fillna("-"),
+                customdata=np.column_stack(custom_columns),
             )
         )
 
@@ -1,21 +1,37 @@
 import plotly.graph_objects as go
+from services.track_geometry_service import padded_axis_ranges
 from theme import COLORS, apply_standard_hover_layout
 
 
-def build_mini_track(driver_tel, driver_styles, reference_distance):
+def build_mini_track(lap_indexes, driver_styles, reference_distance, track_geometry=None):
     fig = go.Figure()
 
-    if not driver_tel:
+    lap_indexes = {drv: index for drv, index in (lap_indexes or {}).items() if len(index)}
+    if not lap_indexes:
         fig.update_layout(xaxis=dict(visible=False), yaxis=dict(visible=False))
         return fig
 
-    first_driver = list(driver_tel.keys())[0]
-    tel = driver_tel[first_driver]
+    if track_geometry:
+        outline_x = track_geometry["x"]
+        outline_y = track_geometry["y"]
+        x_range = track_geometry["x_range"]
+        y_range = track_geometry["y_range"]
+    else:
+        first_driver = list(lap_indexes.keys())[0]
+        lap_index = lap_indexes[first_driver]
+        outline_x = lap_index.x
+        outline_y = lap_index.y
+        x_range, y_range = padded_axis_ranges(
+            float(lap_index.x.min()),
+            float(lap_index.x.max()),
+            float(lap_index.y.min()),
+            float(lap_index.y.max()),
+        )
 
     fig.add_trace(
         go.Scatter(
-            x=tel["X"],
-            y=tel["Y"],
+            x=outline_x,
+            y=outline_y,
             mode="lines",
             line=dict(color="#888", width=2),
             name="Track",
@@ -23,20 +39,17 @@ def build_mini_track(driver_tel, driver_styles, reference_distance):
         )
     )
 
-    for drv, drv_tel in driver_tel.items():
+    for drv, lap_index in lap_indexes.items():
         style = driver_styles.get(drv, {})
         marker_color = style.get("color", COLORS["telemetry_2"])
         marker_name = style.get("label", str(drv))
 
-        if reference_distance is not None:
-            idx = (drv_tel["Distance"] - reference_distance).abs().idxmin()
-        else:
-            idx = drv_tel["Distance"].idxmin()
+        marker_x, marker_y = lap_index.position_at_distance(reference_distance)
 
         fig.add_trace(
             go.Scatter(
-                x=[drv_tel.loc[idx, "X"]],
-                y=[drv_tel.loc[idx, "Y"]],
+                x=[marker_x],
+                y=[marker_y],
                 mode="markers",
                 marker=dict(
                     size=10,
@@ -47,19 +60,6 @@ def build_mini_track(driver_tel, driver_styles, reference_distance):
                 hoverinfo="skip",
             )
         )
-    
-    x_min = float(tel["X"].min())
-    x_max = float(tel["X"].max())
-    y_min = float(tel["Y"].min())
-    y_max = float(tel["Y"].max())
-
-    span_x = max(x_max - x_min, 1.0)
-    span_y = max(y_max - y_min, 1.0)
-    base_span = max(span_x, span_y)
-    pad = base_span * 0.08
-    half = (base_span / 2.0) + pad
-    cx = (x_min + x_max) / 2.0
-    cy = (y_min + y_max) / 2.0
 
     fig = apply_standard_hover_layout(fig)
 
@@ -75,12 +75,12 @@ def build_mini_track(driver_tel, driver_styles, reference_distance):
         margin=dict(l=8, r=8, t=38, b=8),
         xaxis=dict(
             visible=False,
-            range=[cx - half, cx + half],
+            range=x_range,
             fixedrange=True,
         ),
         yaxis=dict(
             visible=False,
-            range=[cy - half, cy + half],
+            range=y_range,
             scaleanchor="x",
             scaleratio=1,
             gridcolor=COLORS["grid"],
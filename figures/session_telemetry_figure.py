@@ -1,7 +1,6 @@
 import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from fastf1.plotting import get_driver_style
+from services.style_service import driver_color
 
 from theme import COLORS, apply_standard_hover_layout
 
@@ -32,8 +31,7 @@ def _driver_color(session, driver, fallback):
         return fallback
     driver_info = session.get_driver(driver)
     abbr = driver_info["Abbreviation"]
-    style = get_driver_style(abbr, style=["color"], session=session)
-    return style.get("color", fallback)
+    return driver_color(abbr, session) or fallback
 
 
 def create_full_session_speed_figure(
@@ -43,7 +41,10 @@ def create_full_session_speed_figure(
     reference_telemetry=None,
     reference_lap_number=None,
     session=None,
+    color=None,
 ):
+    from plotly.subplots import make_subplots
+
     fig = make_subplots(
         rows=4,
         cols=1,
@@ -52,7 +53,8 @@ def create_full_session_speed_figure(
         row_heights=[0.42, 0.22, 0.2, 0.16],
     )
 
-    selected_color = _driver_color(session, driver, COLORS["telemetry_1"])
+    # color lets callers that build off-process skip passing the session.
+    selected_color = color or _driver_color(session, driver, COLORS["telemetry_1"])
     reference_color = COLORS["telemetry_3"]
 
     fig.add_trace(
@@ -3,7 +3,6 @@ from collections import defaultdict
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 from theme import COLORS, apply_standard_hover_layout
 
@@ -206,6 +205,9 @@ def build_shared_overlay_figure(
     total_weight = float(sum(row_weights)) or 1.0
     row_heights = [weight / total_weight for weight in row_weights]
 
+    # plotly.subplots is slow to import; defer it until a figure is built.
+    from plotly.subplots import make_subplots
+
     fig = make_subplots(
         rows=len(active_graphs),
         cols=1,
@@ -1,5 +1,5 @@
 import plotly.graph_objects as go
-from fastf1.plotting import get_driver_style
+from services.style_service import driver_color
 
 from theme import COLORS
 
@@ -14,37 +14,54 @@ def adjust_color_brightness(hex_color, factor=0.8):
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
-def build_single_driver_track(tel):
+def _outline_xy(track_geometry, tel):
+    if track_geometry:
+        return track_geometry["x"], track_geometry["y"]
+    return tel["X"], tel["Y"]
+
+
+def _outline_axes(track_geometry):
+    xaxis = dict(visible=False)
+    yaxis = dict(visible=False, scaleanchor="x", scaleratio=1)
+    if track_geometry:
+        xaxis["range"] = track_geometry["x_range"]
+        yaxis["range"] = track_geometry["y_range"]
+    return xaxis, yaxis
+
+
+def build_single_driver_track(tel, track_geometry=None):
     fig = go.Figure()
 
+    outline_x, outline_y = _outline_xy(track_geometry, tel)
     fig.add_trace(
         go.Scatter(
-            x=tel["X"],
-            y=tel["Y"],
+            x=outline_x,
+            y=outline_y,
             mode="lines",
             line=dict(color="rgba(255,255,255,0.3)", width=6),
             showlegend=False
         )
     )
 
+    xaxis, yaxis = _outline_axes(track_geometry)
     fig.update_layout(
         title=dict(text="Track Layout", x=0.5, xanchor="center"),
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False, scaleanchor="x", scaleratio=1),
+        xaxis=xaxis,
+        yaxis=yaxis,
         margin=dict(l=12, r=12, t=66, b=18),
     )
 
     return fig
 
 
-def build_binary_delta_track(delta_tel, driver1, driver2, faster_index, session):
+def build_binary_delta_track(delta_tel, driver1, driver2, faster_index, session, track_geometry=None):
     fig = go.Figure()
 
     driver1_abbr = session.get_driver(driver1)['Abbreviation']
     driver2_abbr = session.get_driver(driver2)['Abbreviation']
 
-    color1 = get_driver_style(driver1_abbr, style=['color'], session=session)['color']
-    color2 = get_driver_style(driver2_abbr, style=['color'], session=session)['color']
+    color1 = driver_color(driver1_abbr, session)
+    color2 = driver_color(driver2_abbr, session)
 
     # Handle teammates
     if color1 == color2:
@@ -63,10 +80,11 @@ def build_binary_delta_track(delta_tel, driver1, driver2, faster_index, session)
         slower_color = color1
 
     # Base outline
+    outline_x, outline_y = _outline_xy(track_geometry, delta_tel)
     fig.add_trace(
         go.Scatter(
-            x=delta_tel["X"],
-            y=delta_tel["Y"],
+            x=outline_x,
+            y=outline_y,
             mode="lines",
             line=dict(color="rgba(255,255,255,0.08)", width=10),
             showlegend=False,
@@ -115,6 +133,7 @@ def build_binary_delta_track(delta_tel, driver1, driver2, faster_index, session)
         )
     )
 
+    xaxis, yaxis = _outline_axes(track_geometry)
     fig.update_layout(
         title=dict(
             text=f"{faster_driver} vs {slower_driver} | Faster by track segment",
@@ -123,8 +142,8 @@ def build_binary_delta_track(delta_tel, driver1, driver2, faster_index, session)
             y=0.96,
             yanchor="top",
         ),
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False, scaleanchor="x", scaleratio=1),
+        xaxis=xaxis,
+        yaxis=yaxis,
         margin=dict(l=12, r=12, t=72, b=18),
     )
 
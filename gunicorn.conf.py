@@ -0,0 +1,28 @@
+# gunicorn.conf.py
+#
+#   F1D_PRELOAD_SESSIONS=2024:0:5,2024:1:5 gunicorn app:server
+#
+# The app is imported once in the master (preload_app), so sessions listed in
+# F1D_PRELOAD_SESSIONS are loaded before forking and shared copy-on-write.
+import gc
+import os
+
+
+bind = os.environ.get("F1D_BIND", "0.0.0.0:8050")
+workers = int(os.environ.get("F1D_WEB_WORKERS", "4"))
+threads = int(os.environ.get("F1D_WEB_THREADS", "4"))
+timeout = int(os.environ.get("F1D_WEB_TIMEOUT", "180"))
+preload_app = True
+
+# This file is read before the app is preloaded: keep the collector from
+# touching (and so copying) the pages of everything the master loads.
+gc.disable()
+
+
+def when_ready(server):
+    # Runs in the master before the first fork.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
@@ -1,7 +1,9 @@
+import uuid
 from datetime import datetime
 
 from dash import dash_table, dcc, html
 
+from data_engine import OFFLINE_ARCHIVE_DIR, archived_seasons
 from theme import COLORS
 
 GRAPH_CONFIG = {
@@ -46,9 +48,13 @@ def metric_card(title, value="--", detail="Waiting for driver selection"):
 def create_layout():
     current_year = datetime.now().year
 
+    years = range(2019, current_year + 1)
+    if OFFLINE_ARCHIVE_DIR:
+        years = archived_seasons()
+        current_year = years[-1] if years else None
     year_options = [
         {"label": str(year), "value": year}
-        for year in range(2019, current_year + 1)
+        for year in years
     ]
 
     return html.Div(
@@ -106,6 +112,8 @@ def create_layout():
                                 id="archive-view-context",
                                 className="archive-view-context",
                             ),
+                            html.Div(id="session-load-status", className="session-load-status"),
+                            dcc.Interval(id="session-load-poll", interval=500, disabled=True),
                             html.Div(
                                 [
                                     control_field(
@@ -469,6 +477,9 @@ def create_layout():
                             html.Pre(id="debug-output", className="debug-output"),
                             dcc.Store(id="telemetry-store"),
                             dcc.Store(id="lap-driver-store"),
+                            dcc.Store(id="client-id-store", data=uuid.uuid4().hex),
+                            dcc.Store(id="session-job-store"),
+                            dcc.Store(id="session-ready-store"),
                             dcc.Store(
                                 id="overlay-toggle-store",
                                 data=["speed", "throttle", "brake", "rpm", "gear"],
@@ -0,0 +1,337 @@
+# metrics.py
+"""
+Callback latency and payload-size metrics, served in the Prometheus text
+format on /metrics.
+
+install_metrics(app) must run before register_callbacks(app): it wraps every
+callback registered through app.callback afterwards. Metrics live in process
+memory, so under gunicorn each worker reports its own numbers.
+"""
+import bisect
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+METRICS_ENABLED = os.environ.get("F1D_METRICS", "1") != "0"
+
+DURATION_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+BYTES_BUCKETS = [1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216]
+
+# Per-request state of the callback being run, read by timed sections and by
+# the after_request hook that measures payload sizes.
+_CURRENT_CALLBACK = contextvars.ContextVar("f1d_current_callback", default=None)
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram with optional labels, rendered in the
+    Prometheus text exposition format.
+    """
+
+    def __init__(self, name, help_text, buckets, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = list(buckets)
+        self.labels = tuple(labels)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bisect.bisect_left(self.buckets, value)] += 1
+            series[1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        for label_values, (counts, total) in series:
+            base = _label_text(self.labels, label_values)
+            cumulative = 0
+            for bound, count in zip(self.buckets + ["+Inf"], counts):
+                cumulative += count
+                le = _label_text(self.labels + ("le",), label_values + (_number_text(bound),))
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{base} {_number_text(total)}")
+            lines.append(f"{self.name}_count{base} {cumulative}")
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class Counter:
+    """
+    Monotonic counter with optional labels.
+    """
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            lines.append(f"{self.name}{_label_text(self.labels, label_values)} {_number_text(value)}")
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+CALLBACK_SECONDS = Histogram(
+    "f1d_callback_duration_seconds",
+    "Wall time spent inside each Dash callback.",
+    DURATION_BUCKETS,
+    labels=("callback",),
+)
+CALLBACK_LOAD_SECONDS = Histogram(
+    "f1d_callback_load_session_seconds",
+    "Time each callback spent blocked in load_session.",
+    DURATION_BUCKETS,
+    labels=("callback",),
+)
+CALLBACK_OUTPUT_BYTES = Histogram(
+    "f1d_callback_output_bytes",
+    "Size of each callback's serialised response.",
+    BYTES_BUCKETS,
+    labels=("callback",),
+)
+CALLBACK_STORE_BYTES = Histogram(
+    "f1d_callback_input_store_bytes",
+    "Serialised size of the dcc.Store data sent as callback inputs and state.",
+    BYTES_BUCKETS,
+    labels=("callback",),
+)
+CALLBACK_CALLS = Counter(
+    "f1d_callback_calls_total",
+    "Callback invocations by outcome (ok, prevented, error).",
+    labels=("callback", "outcome"),
+)
+LOAD_SESSION_SECONDS = Histogram(
+    "f1d_load_session_seconds",
+    "Duration of every load_session call that was not served from memory.",
+    DURATION_BUCKETS,
+)
+
+_METRICS = [
+    CALLBACK_SECONDS,
+    CALLBACK_LOAD_SECONDS,
+    CALLBACK_OUTPUT_BYTES,
+    CALLBACK_STORE_BYTES,
+    CALLBACK_CALLS,
+    LOAD_SESSION_SECONDS,
+]
+
+
+def install_metrics(app):
+    """
+    Wraps callbacks registered on app from now on with instrumentation and
+    adds the /metrics route to its Flask server. No-op when F1D_METRICS=0.
+    """
+    if not METRICS_ENABLED:
+        return app
+
+    register = app.callback
+
+    def callback(*args, **kwargs):
+        decorator = register(*args, **kwargs)
+
+        def wrap(fn):
+            return decorator(instrument_callback(fn))
+
+        return wrap
+
+    app.callback = callback
+    app.server.after_request(_record_payload_sizes)
+    app.server.add_url_rule("/metrics", "f1d_metrics", _metrics_view)
+    return app
+
+
+def instrument_callback(fn, name=None):
+    """
+    Returns fn wrapped to record its wall time, load_session time and outcome.
+    """
+    from dash.exceptions import PreventUpdate
+
+    name = name or fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        state = {"callback": name, "load_seconds": 0.0}
+        token = _CURRENT_CALLBACK.set(state)
+        _remember_callback(state)
+        outcome = "error"
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+            outcome = "ok"
+            return result
+        except PreventUpdate:
+            outcome = "prevented"
+            raise
+        finally:
+            CALLBACK_SECONDS.observe(time.perf_counter() - started, name)
+            CALLBACK_LOAD_SECONDS.observe(state["load_seconds"], name)
+            CALLBACK_CALLS.inc(name, outcome)
+            _CURRENT_CALLBACK.reset(token)
+
+    return wrapper
+
+
+@contextmanager
+def timed_load():
+    """
+    Times a session load: always into f1d_load_session_seconds, and into the
+    calling callback's load time when it runs on the callback's thread.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        LOAD_SESSION_SECONDS.observe(elapsed)
+        state = _CURRENT_CALLBACK.get()
+        if state is not None:
+            state["load_seconds"] += elapsed
+
+
+def render_metrics():
+    """
+    Returns every metric, plus scheduler and process gauges, as Prometheus
+    exposition text.
+    """
+    lines = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    lines.extend(_scheduler_lines())
+    lines.extend(_process_lines())
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics():
+    for metric in _METRICS:
+        metric.reset()
+
+
+def _remember_callback(state):
+    from flask import g, has_request_context
+
+    if has_request_context():
+        g.f1d_callback = state
+
+
+def _record_payload_sizes(response):
+    from flask import g, request
+
+    state = g.pop("f1d_callback", None)
+    if state is None or response.direct_passthrough:
+        return response
+
+    name = state["callback"]
+    CALLBACK_OUTPUT_BYTES.observe(len(response.get_data()), name)
+
+    body = request.get_json(silent=True) or {}
+    store_bytes = 0
+    for entry in _flatten(body.get("inputs", [])) + _flatten(body.get("state", [])):
+        if entry.get("property") == "data" and entry.get("value") is not None:
+            store_bytes += len(json.dumps(entry["value"], separators=(",", ":")))
+    CALLBACK_STORE_BYTES.observe(store_bytes, name)
+    return response
+
+
+def _flatten(entries):
+    # Pattern-matching (ALL) inputs arrive as nested lists.
+    flat = []
+    for entry in entries:
+        if isinstance(entry, list):
+            flat.extend(_flatten(entry))
+        elif isinstance(entry, dict):
+            flat.append(entry)
+    return flat
+
+
+def _metrics_view():
+    from flask import Response
+
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+
+def _scheduler_lines():
+    from data_engine import get_scheduler_metrics
+
+    counters = {"submitted", "completed", "failed", "preemptions", "wait_seconds_total"}
+    by_key = {}
+    for priority, values in get_scheduler_metrics().items():
+        for key, value in values.items():
+            by_key.setdefault(key, []).append((priority, value))
+
+    lines = []
+    for key in sorted(by_key):
+        if key in counters:
+            name = f"f1d_scheduler_{key}" if key.endswith("_total") else f"f1d_scheduler_{key}_total"
+            kind = "counter"
+        else:
+            name = f"f1d_scheduler_{key}"
+            kind = "gauge"
+        lines.append(f"# TYPE {name} {kind}")
+        for priority, value in by_key[key]:
+            lines.append(f"{name}{_label_text(('priority',), (priority,))} {_number_text(float(value))}")
+    return lines
+
+
+def _process_lines():
+    rss = _resident_bytes()
+    if rss is None:
+        return []
+    return [
+        "# HELP process_resident_memory_bytes Resident memory size in bytes.",
+        "# TYPE process_resident_memory_bytes gauge",
+        f"process_resident_memory_bytes {rss}",
+    ]
+
+
+def _resident_bytes():
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _label_text(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number_text(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,112 @@
+# offline_archive.py
+"""
+Builds the offline archive served when F1D_OFFLINE_ARCHIVE is set, for
+analysis machines without network access.
+
+    python offline_archive.py --years 2024 --output /data/f1-archive
+    python offline_archive.py --years 2025 --events 0 3 --sessions 4 5 --output /data/f1-archive
+
+Runs online: each selected session is loaded and warmed like warmup.py does,
+then its snapshot, telemetry store and derived data are copied into the
+archive together with the season schedule. Re-running against an existing
+archive adds to it. The offline machine needs the same FastF1 version.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from warmup import _plan_sessions, _warm_session
+
+
+def _archive_session(year, event_index, session_number, output):
+    # Runs in a worker process. _warm_session returns once the snapshot,
+    # channel store and derived data are on disk, so the export sees them.
+    from data_engine import export_session_to_archive
+
+    _warm_session(year, event_index, session_number, True)
+    return export_session_to_archive(year, event_index, session_number, output)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Build an offline F1 dashboard archive.")
+    parser.add_argument("--years", type=int, nargs="+", required=True)
+    parser.add_argument("--output", required=True, help="Archive directory")
+    parser.add_argument(
+        "--events",
+        type=int,
+        nargs="+",
+        help="Supported-schedule event indices (default: every event)",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        nargs="+",
+        help="Session numbers 1-5 (default: every session of the event)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("F1D_WARMUP_WORKERS", "2")),
+        help="Number of worker processes",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    from data_engine import OFFLINE_ARCHIVE_DIR, write_archive_manifest
+
+    if OFFLINE_ARCHIVE_DIR:
+        print("Unset F1D_OFFLINE_ARCHIVE: archives are built from FastF1 data.", file=sys.stderr)
+        return 2
+
+    plan = _plan_sessions(args.years, args.events, args.sessions)
+    if not plan:
+        print("Nothing to archive for the given selection.")
+        return 0
+
+    workers = max(1, args.workers)
+    print(f"Archiving {len(plan)} session(s) with {workers} worker(s) into {args.output}")
+
+    archived = []
+    copied = 0
+    failed = 0
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_archive_session, year, event_index, session_number, args.output): (
+                year,
+                event_index,
+                session_number,
+                f"{year} {event_name} - {session_name}",
+            )
+            for year, event_index, session_number, event_name, session_name in plan
+        }
+        for future in as_completed(futures):
+            year, event_index, session_number, label = futures[future]
+            try:
+                size = future.result()
+            except Exception as exc:
+                failed += 1
+                print(f"  FAILED {label}: {exc}")
+                continue
+            archived.append((year, event_index, session_number))
+            copied += size
+            print(f"  {label}: {size / 1e6:.1f} MB")
+
+    if archived:
+        write_archive_manifest(args.output, archived)
+    print()
+    print(
+        f"Archived {len(archived)} session(s), {failed} failed, {copied / 1e6:.1f} MB "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
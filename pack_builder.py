@@ -0,0 +1,105 @@
+# pack_builder.py
+"""
+Exports seasons into compressed session packs (see session_pack.py), one
+worker process per event at a time.
+
+    python pack_builder.py --years 2024 --output packs
+    python pack_builder.py --years 2025 --events 0 3 --sessions 4 5 --output packs --workers 4
+
+Each season is written to <output>/<year>/. Re-running adds or replaces the
+selected events and keeps the others.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Build compressed per-season session packs.")
+    parser.add_argument("--years", type=int, nargs="+", required=True)
+    parser.add_argument("--output", required=True, help="Directory receiving one pack per season")
+    parser.add_argument(
+        "--events",
+        type=int,
+        nargs="+",
+        help="Supported-schedule event indices (default: every event)",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        nargs="+",
+        help="Session numbers 1-5 (default: every session of the event)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("F1D_WARMUP_WORKERS", "2")),
+        help="Number of worker processes",
+    )
+    return parser.parse_args(argv)
+
+
+def _build_event(year, event_index, directory, sessions):
+    # Runs in a worker process.
+    from session_pack import write_event_pack
+
+    started = time.perf_counter()
+    entry = write_event_pack(year, event_index, directory, sessions)
+    entry["seconds"] = time.perf_counter() - started
+    return entry
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    from data_engine import get_supported_event_schedule
+    from session_pack import write_season_index
+
+    workers = max(1, args.workers)
+    failed = 0
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for year in args.years:
+            directory = os.path.join(args.output, str(year))
+            schedule = get_supported_event_schedule(year)
+            events = [index for index in schedule.index if args.events is None or index in args.events]
+            print(f"Packing {len(events)} event(s) of {year} with {workers} worker(s) into {directory}")
+
+            futures = {
+                pool.submit(_build_event, year, int(index), directory, args.sessions): int(index)
+                for index in events
+            }
+            packed = {}
+            for future in as_completed(futures):
+                index = futures[future]
+                label = f"{year} {schedule.loc[index, 'EventName']}"
+                try:
+                    entry = future.result()
+                except Exception as exc:
+                    failed += 1
+                    print(f"  FAILED {label}: {exc}")
+                    continue
+
+                failed += len(entry["failed"])
+                for number, error in entry.pop("failed").items():
+                    print(f"  FAILED {label} session {number}: {error}")
+                seconds = entry.pop("seconds")
+                packed[index] = entry
+                print(
+                    f"  {label}: {len(entry['sessions'])} session(s), "
+                    f"{entry['bytes'] / 1e6:.1f} MB in {seconds:.1f}s"
+                )
+
+            if packed:
+                write_season_index(year, directory, schedule, packed)
+
+    print()
+    print(f"Done in {time.perf_counter() - started:.1f}s, {failed} failure(s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
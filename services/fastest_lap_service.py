@@ -1,6 +1,6 @@
-import pandas as pd
-
 from services.telemetry_service import get_fastest_laps
+from services.time_format_service import format_td
+from tracing import traced
 
 
 def normalize_selected_drivers(drivers):
@@ -11,6 +11,7 @@ def normalize_selected_drivers(drivers):
     return [drivers]
 
 
+@traced()
 def resolve_fastest_laps(session, drivers):
     selected_drivers = normalize_selected_drivers(drivers)
     official_fastest_laps = get_fastest_laps(session, selected_drivers)
@@ -85,11 +86,3 @@ def build_fastest_lap_note(session, selected_drivers, fallback_drivers):
 
     return " ".join(note_parts)
 
-
-def format_td(td):
-    if pd.isna(td):
-        return "--"
-    total_seconds = td.total_seconds()
-    mins = int(total_seconds // 60)
-    secs = total_seconds % 60
-    return f"{mins}:{secs:06.3f}"
@@ -0,0 +1,218 @@
+import numpy as np
+import pandas as pd
+
+from data_engine import get_session_derived, session_derived_items
+from telemetry_store import channel_view
+
+
+FULL_THROTTLE_THRESHOLD = 98
+
+FEATURE_COLUMNS = [
+    "Vmax",
+    "AvgSpeed",
+    "FullThrottlePct",
+    "BrakeEvents",
+    "AvgGear",
+    "Samples",
+]
+
+LAP_COLUMNS = [
+    "LapTime",
+    "Sector1Time",
+    "Sector2Time",
+    "Sector3Time",
+    "Compound",
+    "Stint",
+]
+
+
+def get_lap_feature_table(session):
+    """
+    Returns the cached per-lap feature table for every driver in the session,
+    or None when the session was loaded without telemetry.
+    """
+    if not getattr(session, "_f1d_has_telemetry", False):
+        return None
+    return get_session_derived(session, "lap_features", build_lap_feature_table, persist=True)
+
+
+def get_lap_features(session, driver, lap_number=None):
+    """
+    Returns the feature rows for a driver, or a single lap's row when
+    lap_number is given. Returns None when unavailable.
+    """
+    driver_rows = _driver_feature_rows(session, driver)
+    if driver_rows is None:
+        return None
+
+    if lap_number is None:
+        return driver_rows
+
+    lap_rows = driver_rows[driver_rows["LapNumber"] == int(lap_number)]
+    if lap_rows.empty:
+        return None
+    return lap_rows.iloc[0]
+
+
+def _driver_feature_rows(session, driver):
+    if not getattr(session, "_f1d_has_telemetry", False):
+        return None
+    if getattr(session, "_f1d_lazy_telemetry", False) and not any(
+        name == "lap_features" for name, _ in session_derived_items(session)
+    ):
+        # The full table would load every driver's telemetry.
+        return get_session_derived(
+            session,
+            ("lap_features", str(driver)),
+            lambda session: build_driver_lap_features(session, driver),
+            persist=True,
+        )
+    table = get_lap_feature_table(session)
+    return table[table["DriverNumber"] == str(driver)]
+
+
+def build_driver_lap_features(session, driver):
+    """
+    Builds the feature rows of a single driver, loading only that driver's
+    car data.
+    """
+    laps = session.laps
+    driver_laps = laps[laps["DriverNumber"] == str(driver)]
+    if driver_laps.empty:
+        return pd.DataFrame(columns=["DriverNumber", "LapNumber"] + LAP_COLUMNS + FEATURE_COLUMNS)
+    return _driver_lap_features(session, str(driver), driver_laps)
+
+
+def build_lap_feature_table(session):
+    """
+    Builds lap time, sectors, compound, stint and telemetry statistics for
+    every lap of every driver in one batched pass over each driver's car data.
+    """
+    laps = session.laps
+    frames = []
+    for driver in session.drivers:
+        driver_laps = laps[laps["DriverNumber"] == driver]
+        if driver_laps.empty:
+            continue
+        frames.append(_driver_lap_features(session, driver, driver_laps))
+
+    if not frames:
+        return pd.DataFrame(columns=["DriverNumber", "LapNumber"] + LAP_COLUMNS + FEATURE_COLUMNS)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def telemetry_features(tel):
+    """
+    Computes the lap statistics for a single telemetry frame.
+    """
+    speed = tel["Speed"].dropna()
+    throttle = tel["Throttle"].dropna()
+    brake = tel["Brake"].dropna()
+    gear = tel["nGear"].dropna()
+
+    if not brake.empty:
+        brake_binary = (brake > 0).astype(int)
+        brake_events = int((brake_binary.diff() == 1).sum())
+    else:
+        brake_events = 0
+
+    return {
+        "Vmax": float(speed.max()) if not speed.empty else 0.0,
+        "AvgSpeed": float(speed.mean()) if not speed.empty else 0.0,
+        "FullThrottlePct": (
+            float((throttle >= FULL_THROTTLE_THRESHOLD).mean() * 100.0)
+            if not throttle.empty else 0.0
+        ),
+        "BrakeEvents": brake_events,
+        "AvgGear": float(gear.mean()) if not gear.empty else 0.0,
+        "Samples": int(len(tel)),
+    }
+
+
+def _driver_lap_features(session, driver, driver_laps):
+    driver_laps = driver_laps.sort_values("LapNumber")
+    table = pd.DataFrame(
+        {
+            "DriverNumber": str(driver),
+            "LapNumber": driver_laps["LapNumber"].astype(int).to_numpy(),
+        }
+    )
+    for column in LAP_COLUMNS:
+        values = driver_laps[column] if column in driver_laps.columns else pd.Series(np.nan, index=driver_laps.index)
+        if pd.api.types.is_timedelta64_dtype(values):
+            values = values.dt.total_seconds()
+        table[column] = values.to_numpy()
+
+    car_data = session.car_data.get(driver)
+    if car_data is None or car_data.empty:
+        for column in FEATURE_COLUMNS:
+            table[column] = np.nan
+        return table
+
+    lap_count = len(table)
+    starts = _to_ns(driver_laps["LapStartTime"])
+    ends = _to_ns(driver_laps["Time"])
+    sample_time = _to_ns(car_data["SessionTime"])
+
+    # Laps are sequential, so each sample belongs to the last lap started
+    # before it, provided that lap had not finished yet.
+    timed = ~np.isnan(starts) & ~np.isnan(ends)
+    lap_order = np.flatnonzero(timed)
+    lap_order = lap_order[np.argsort(starts[lap_order], kind="stable")]
+    lap_pos = np.searchsorted(starts[lap_order], sample_time, side="right") - 1
+    in_lap = (lap_pos >= 0) & ~np.isnan(sample_time)
+    lap_pos = np.where(in_lap, lap_pos, 0)
+    if lap_order.size:
+        in_lap &= sample_time <= ends[lap_order][lap_pos]
+        lap_id = np.where(in_lap, lap_order[lap_pos], -1)
+    else:
+        lap_id = np.full(sample_time.shape, -1)
+
+    # Views straight onto the (possibly memory-mapped) channels, in their
+    # stored dtypes: bincount accumulates in float64 either way, so casting
+    # slim float32/int8 channels up front would only copy them.
+    speed = channel_view(car_data, "Speed")
+    throttle = channel_view(car_data, "Throttle")
+    brake_on = channel_view(car_data, "Brake") > 0
+    gear = channel_view(car_data, "nGear")
+
+    assigned = lap_id >= 0
+    samples = np.bincount(lap_id[assigned], minlength=lap_count)
+
+    speed_ok = assigned & np.isfinite(speed)
+    speed_count = np.bincount(lap_id[speed_ok], minlength=lap_count)
+    speed_sum = np.bincount(lap_id[speed_ok], weights=speed[speed_ok], minlength=lap_count)
+    vmax = np.full(lap_count, -np.inf)
+    np.maximum.at(vmax, lap_id[speed_ok], speed[speed_ok])
+
+    throttle_ok = assigned & np.isfinite(throttle)
+    throttle_count = np.bincount(lap_id[throttle_ok], minlength=lap_count)
+    full_throttle = np.bincount(
+        lap_id[throttle_ok],
+        weights=(throttle[throttle_ok] >= FULL_THROTTLE_THRESHOLD).astype(float),
+        minlength=lap_count,
+    )
+
+    gear_ok = assigned & np.isfinite(gear)
+    gear_count = np.bincount(lap_id[gear_ok], minlength=lap_count)
+    gear_sum = np.bincount(lap_id[gear_ok], weights=gear[gear_ok], minlength=lap_count)
+
+    rising = brake_on[1:] & ~brake_on[:-1] & (lap_id[1:] == lap_id[:-1]) & assigned[1:]
+    brake_events = np.bincount(lap_id[1:][rising], minlength=lap_count)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        table["Vmax"] = np.where(speed_count > 0, vmax, np.nan)
+        table["AvgSpeed"] = speed_sum / speed_count
+        table["FullThrottlePct"] = full_throttle / throttle_count * 100.0
+        table["BrakeEvents"] = brake_events
+        table["AvgGear"] = gear_sum / gear_count
+    table["Samples"] = samples
+    return table
+
+
+def _to_ns(values):
+    ns = pd.to_timedelta(values).to_numpy(dtype="timedelta64[ns]")
+    result = ns.view(np.int64).astype(float)
+    result[np.isnat(ns)] = np.nan
+    return result
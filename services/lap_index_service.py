@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+from data_engine import get_session_derived, lap_telemetry
+
+
+class LapIndex:
+    """
+    Nearest-sample lookups over one lap's telemetry: a sorted distance array
+    for distance -> position and a lazily built X/Y KD-tree for
+    position -> distance. Both queries are O(log n).
+    """
+
+    def __init__(self, distance, x, y):
+        distance = np.asarray(distance, dtype=float)
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        valid = np.isfinite(distance) & np.isfinite(x) & np.isfinite(y)
+        distance, x, y = distance[valid], x[valid], y[valid]
+
+        if distance.size > 1 and np.any(np.diff(distance) < 0):
+            order = np.argsort(distance, kind="stable")
+            distance, x, y = distance[order], x[order], y[order]
+
+        self.distance = distance
+        self.x = x
+        self.y = y
+        self._tree = None
+
+    @classmethod
+    def from_telemetry(cls, tel):
+        return cls(tel["Distance"].to_numpy(), tel["X"].to_numpy(), tel["Y"].to_numpy())
+
+    def __len__(self):
+        return int(self.distance.size)
+
+    def nearest_sample(self, distance):
+        """
+        Returns the sample index closest to the given distance(s).
+        """
+        if self.distance.size < 2:
+            return np.zeros(np.shape(distance), dtype=int) if np.ndim(distance) else 0
+
+        pos = np.clip(np.searchsorted(self.distance, distance), 1, self.distance.size - 1)
+        left = self.distance[pos - 1]
+        right = self.distance[pos]
+        idx = np.where(np.abs(distance - left) <= np.abs(right - distance), pos - 1, pos)
+        return idx if np.ndim(idx) else int(idx)
+
+    def position_at_distance(self, distance):
+        """
+        Returns the (x, y) of the sample closest to the given distance.
+        """
+        if not len(self):
+            return None
+        if distance is None:
+            idx = 0
+        else:
+            idx = self.nearest_sample(float(distance))
+        return float(self.x[idx]), float(self.y[idx])
+
+    def distance_at_position(self, x, y):
+        """
+        Returns the lap distance of the sample closest to the given (x, y).
+        """
+        if not len(self):
+            return None
+        _, idx = self._kdtree().query([float(x), float(y)])
+        return float(self.distance[idx])
+
+    def _kdtree(self):
+        if self._tree is None:
+            from scipy.spatial import cKDTree
+
+            self._tree = cKDTree(np.column_stack((self.x, self.y)))
+        return self._tree
+
+
+def get_lap_index(session, driver, lap_number, telemetry=None):
+    """
+    Returns the cached index for a driver's lap. When telemetry (a DataFrame
+    or stored records) is given it is used to build the index, otherwise the
+    lap telemetry is fetched.
+    """
+
+    def _build_samples(_session):
+        tel = telemetry
+        if isinstance(tel, list):
+            tel = pd.DataFrame(tel)
+        if tel is None:
+            laps = session.laps.pick_drivers(driver)
+            lap = laps[laps["LapNumber"] == lap_number].iloc[0]
+            tel = lap_telemetry(lap).add_distance()
+        return pd.DataFrame(tel)[["Distance", "X", "Y"]].reset_index(drop=True)
+
+    # The samples are persisted as a frame; the index (and its KD-tree) is
+    # rebuilt from them in memory.
+    samples = get_session_derived(
+        session,
+        ("lap_index_samples", str(driver), int(lap_number)),
+        _build_samples,
+        persist=True,
+    )
+    return get_session_derived(
+        session,
+        ("lap_index", str(driver), int(lap_number)),
+        lambda _session: LapIndex.from_telemetry(samples),
+    )
@@ -0,0 +1,71 @@
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Threads shared by all callbacks for per-driver work. Most of that work is
+# pandas/NumPy code that releases the GIL, so a few threads go a long way;
+# 1 runs everything serially in the calling thread.
+DRIVER_THREADS = max(1, int(os.environ.get("F1D_DRIVER_THREADS", str(min(4, os.cpu_count() or 1)))))
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+
+def map_drivers(fn, items):
+    """
+    Returns [fn(item) for item in items], with the calls spread over the
+    shared driver thread pool. Results keep the input order, each call runs
+    in a copy of the caller's contextvars context, and the first exception
+    (in input order) is re-raised once the remaining calls are cancelled.
+
+    :param fn: Callable taking one item
+    :param items: Iterable of per-driver inputs
+    """
+
+    items = list(items)
+    # Calls made from a pool thread run inline: waiting on the same bounded
+    # pool from inside it could deadlock.
+    if len(items) < 2 or DRIVER_THREADS < 2 or getattr(_LOCAL, "in_pool", False):
+        return [fn(item) for item in items]
+
+    pool = _get_pool()
+    futures = [
+        pool.submit(contextvars.copy_context().run, _run_in_pool, fn, item)
+        for item in items
+    ]
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+
+def _run_in_pool(fn, item):
+    _LOCAL.in_pool = True
+    try:
+        return fn(item)
+    finally:
+        _LOCAL.in_pool = False
+
+
+def _get_pool():
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(max_workers=DRIVER_THREADS, thread_name_prefix="f1d-driver")
+        return _POOL
+
+
+def _reinit_after_fork():
+    # Pool threads do not survive fork; start a fresh pool on first use.
+    global _POOL, _POOL_LOCK
+    _POOL = None
+    _POOL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
@@ -1,4 +1,5 @@
-import pandas as pd
+from data_engine import lap_telemetry
+from services.time_format_service import format_timedelta_series
 
 
 def prepare_session_laps(session, driver_code, segment="ALL", valid_only=True, longest_stint=False):
@@ -73,7 +74,7 @@ def get_lap_telemetry(lap):
     """
     Returns telemetry for a lap with distance added.
     """
-    telemetry = lap.get_telemetry().add_distance()
+    telemetry = lap_telemetry(lap).add_distance()
     return telemetry
 
 def safe_lap_selection(laps_df, lap_number):
@@ -85,23 +86,24 @@ def safe_lap_selection(laps_df, lap_number):
 
     return laps_df[laps_df['LapNumber'] == lap_number].iloc[0]
 
-def get_lap_time_evolution_data(laps_df):
+def get_lap_time_evolution_data(laps_df, features=None):
     """
     Returns processed dataframe for lap time evolution graph.
+    Per-lap telemetry features are joined on LapNumber when provided.
     """
 
     df = laps_df.copy()
 
+    if features is not None and not features.empty:
+        feature_cols = ["LapNumber", "Vmax", "AvgSpeed", "FullThrottlePct"]
+        df = df.merge(features[feature_cols], on="LapNumber", how="left")
+        df.index = laps_df.index
+
     # convert lap time to seconds
     df['LapTimeSeconds'] = df['LapTime'].dt.total_seconds()
 
     # format lap times in mm:ss.SSS
-    df['LapTimeFormatted'] = df['LapTime'].apply(
-        lambda x: f"{int(x.total_seconds()//60)}:"
-                  f"{int(x.total_seconds()%60):02d}."
-                  f"{int(x.microseconds/1000):03d}"
-        if pd.notna(x) else None
-    )
+    df['LapTimeFormatted'] = format_timedelta_series(df['LapTime'], na_rep=None)
 
     # Add the valid flag
     df['IsValid'] = (
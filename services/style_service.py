@@ -1,5 +1,31 @@
 # style service
 
+def driver_color(identifier, session):
+    """
+    Returns the FastF1 plotting colour for a driver abbreviation
+    """
+    if getattr(session, "_f1d_synthetic", False):
+        # Synthetic sessions have no timing-feed driver list to look up.
+        return _results_team_color(identifier, session)
+
+    # fastf1.plotting pulls in matplotlib, so it is imported on first use.
+    from fastf1.plotting import get_driver_style
+
+    return get_driver_style(identifier, style=["color"], session=session)["color"]
+
+
+def _results_team_color(identifier, session):
+    results = session.results
+    match = results[
+        (results["Abbreviation"] == identifier)
+        | (results["DriverNumber"] == str(identifier))
+    ]
+    if match.empty:
+        return None
+    color = str(match["TeamColor"].iloc[0])
+    return color if color.startswith("#") else f"#{color}"
+
+
 def extract_driver_styles(session, drivers):
     styles = {}
 
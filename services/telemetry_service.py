@@ -1,6 +1,13 @@
 import pandas as pd
 import numpy as np
 
+from data_engine import get_session_derived, lap_telemetry, slim_telemetry
+from tracing import span
+
+
+# Lap telemetry columns read by the dashboard; slim sessions keep only these.
+LAP_TELEMETRY_COLUMNS = ["Time", "Distance", "Speed", "Throttle", "Brake", "nGear", "RPM", "X", "Y"]
+
 def get_fastest_laps(session, drivers, only_by_time=False):
     """
     Return dict: {driver: fastest_lap}
@@ -36,18 +43,49 @@ def prepare_telemetry(lap):
     :param lap: Lap Data
     """
 
-    tel = lap.get_telemetry().add_distance()
+    with span("prepare_telemetry") as current:
+        tel = lap_telemetry(lap).add_distance()
 
-    # scale the brake value
-    tel['Brake'] = tel['Brake'].astype(int) * 100
+        # scale the brake value
+        tel['Brake'] = tel['Brake'].astype(int) * 100
+        current.set(rows=len(tel))
 
     return tel
 
+def get_prepared_telemetry(session, driver, lap):
+    """
+    Returns prepare_telemetry(lap) cached with the session and persisted
+    alongside its other derived data
+
+    :param session: Session object
+    :param driver: Driver the lap belongs to
+    :param lap: Lap Data
+    """
+
+    def _build(_session):
+        # Plain frame: FastF1 Telemetry keeps a reference to the whole session.
+        tel = pd.DataFrame(prepare_telemetry(lap))
+        if getattr(session, "_f1d_slim", False):
+            # Brake is already scaled to 0/100 here.
+            tel = slim_telemetry(tel, LAP_TELEMETRY_COLUMNS, dtypes={"Brake": "int8"})
+        return tel
+
+    return get_session_derived(
+        session,
+        ("lap_telemetry", str(driver), int(lap["LapNumber"])),
+        _build,
+        persist=True,
+    )
+
 def compute_binary_delta(lap1_tel, lap2_tel, lap1_time, lap2_time):
     """
     Computes time delta between two telemetry laps by auto selecting faster lap as reference
     """
 
+    with span("compute_binary_delta", rows=len(lap1_tel) + len(lap2_tel)):
+        return _compute_binary_delta(lap1_tel, lap2_tel, lap1_time, lap2_time)
+
+def _compute_binary_delta(lap1_tel, lap2_tel, lap1_time, lap2_time):
     # Determine faster driver
     if lap1_time <= lap2_time:
         ref_tel = lap1_tel.copy()
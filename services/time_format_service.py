@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+
+# Zero-padded lookup tables so whole columns are formatted by indexing
+# rather than per-row string formatting.
+_SECONDS_TEXT = np.array([f"{value:02d}" for value in range(60)])
+_MILLIS_TEXT = np.array([f".{value:03d}" for value in range(1000)])
+
+
+def format_timedelta_series(values, na_rep="--"):
+    """
+    Formats a timedelta column as m:ss.SSS using integer arithmetic on the
+    underlying nanoseconds. Missing values become na_rep.
+    """
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values)
+    td = pd.to_timedelta(values)
+    if td.empty:
+        return pd.Series([], index=td.index, dtype=object)
+
+    missing = td.isna().to_numpy()
+    ns = td.to_numpy(dtype="timedelta64[ns]").view(np.int64)
+    ns = np.where(missing, 0, ns)
+
+    ms = (np.abs(ns) + 500_000) // 1_000_000
+    minute_values, minute_codes = np.unique(ms // 60_000, return_inverse=True)
+    minutes = np.array([f"{value}:" for value in minute_values])[minute_codes]
+
+    formatted = np.char.add(minutes, _SECONDS_TEXT[(ms // 1_000) % 60])
+    formatted = np.char.add(formatted, _MILLIS_TEXT[ms % 1_000])
+    formatted = np.where(ns < 0, np.char.add("-", formatted), formatted)
+
+    result = pd.Series(formatted.astype(object), index=td.index)
+    result[missing] = na_rep
+    return result
+
+
+def format_td(td, na_rep="--"):
+    """
+    Scalar counterpart of format_timedelta_series.
+    """
+    if pd.isna(td):
+        return na_rep
+    ns = pd.Timedelta(td).value
+    ms = (abs(ns) + 500_000) // 1_000_000
+    sign = "-" if ns < 0 else ""
+    return f"{sign}{ms // 60_000}:{(ms // 1_000) % 60:02d}.{ms % 1_000:03d}"
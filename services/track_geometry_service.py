@@ -0,0 +1,112 @@
+import numpy as np
+
+from data_engine import get_session_derived
+
+
+# Position data is in 1/10 m; 8 units keeps corners intact while dropping
+# most of the ~4 Hz samples on straights.
+SIMPLIFY_TOLERANCE = 8.0
+AXIS_PAD_RATIO = 0.08
+
+
+def get_track_geometry(session):
+    """
+    Returns the cached track geometry for the session's event, building it
+    from the best lap's position data on first use.
+    """
+    return get_session_derived(session, "track_geometry", _build_session_track_geometry, persist=True)
+
+
+def _build_session_track_geometry(session):
+    laps = session.laps
+    if laps is None or laps.empty:
+        return None
+
+    lap = laps.pick_fastest()
+    if lap is None or lap.empty:
+        lap = laps.pick_fastest(only_by_time=True)
+    if lap is None or lap.empty:
+        return None
+
+    pos = lap.get_pos_data()
+    return build_track_geometry(pos["X"], pos["Y"])
+
+
+def build_track_geometry(x, y, tolerance=SIMPLIFY_TOLERANCE):
+    """
+    Builds a JSON-ready track outline: simplified polyline, cumulative
+    distance along it, bounds and padded square axis ranges.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x = x[finite]
+    y = y[finite]
+    if x.size < 2:
+        return None
+
+    keep = _simplify_polyline(x, y, tolerance)
+    x = x[keep]
+    y = y[keep]
+
+    step = np.hypot(np.diff(x), np.diff(y))
+    distance = np.concatenate(([0.0], np.cumsum(step)))
+
+    x_min, x_max = float(x.min()), float(x.max())
+    y_min, y_max = float(y.min()), float(y.max())
+    x_range, y_range = padded_axis_ranges(x_min, x_max, y_min, y_max)
+
+    return {
+        "x": np.round(x, 1).tolist(),
+        "y": np.round(y, 1).tolist(),
+        "distance": np.round(distance, 1).tolist(),
+        "bounds": [x_min, x_max, y_min, y_max],
+        "x_range": x_range,
+        "y_range": y_range,
+    }
+
+
+def padded_axis_ranges(x_min, x_max, y_min, y_max, pad_ratio=AXIS_PAD_RATIO):
+    """
+    Returns square x/y axis ranges centred on the bounds with a relative pad.
+    """
+    span_x = max(x_max - x_min, 1.0)
+    span_y = max(y_max - y_min, 1.0)
+    base_span = max(span_x, span_y)
+    half = (base_span / 2.0) + base_span * pad_ratio
+    cx = (x_min + x_max) / 2.0
+    cy = (y_min + y_max) / 2.0
+    return [cx - half, cx + half], [cy - half, cy + half]
+
+
+def _simplify_polyline(x, y, tolerance):
+    """
+    Ramer-Douglas-Peucker simplification; returns a boolean keep mask.
+    """
+    keep = np.zeros(x.size, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, x.size - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        seg_x = x[end] - x[start]
+        seg_y = y[end] - y[start]
+        seg_len = np.hypot(seg_x, seg_y)
+        px = x[start + 1:end] - x[start]
+        py = y[start + 1:end] - y[start]
+        if seg_len == 0:
+            dist = np.hypot(px, py)
+        else:
+            dist = np.abs(seg_x * py - seg_y * px) / seg_len
+
+        split = int(np.argmax(dist))
+        if dist[split] > tolerance:
+            split += start + 1
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return keep
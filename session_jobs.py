@@ -0,0 +1,316 @@
+import gc
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from data_engine import (
+    JOB_DIR,
+    LOAD_STAGES,
+    PRIORITY_INTERACTIVE,
+    SessionLoadCancelled,
+    get_cached_session,
+    has_persisted_session,
+    load_session,
+    parse_deferred_telemetry,
+    promote_session_work,
+    schedule_session_work,
+    wait_for_session_writes,
+)
+from services.lap_feature_service import get_lap_feature_table
+from services.track_geometry_service import get_track_geometry
+
+
+MAX_TRACKED_SELECTIONS = 4096
+
+JOB_STAGE_LABELS = {
+    "queued": "Queued for loading",
+    "timing": "Loading timing data",
+    "laps": "Processing laps",
+    "car_data": "Loading car data",
+    "position_data": "Loading position data",
+    "merge": "Merging telemetry",
+    "done": "Session ready",
+    "error": "Session load failed",
+    "cancelled": "Load cancelled",
+}
+
+# Identifies this server run in job statuses. With gunicorn's preload_app
+# every worker forks from the master after this import and shares it, while
+# a restart gets a new one: statuses of an earlier run describe sessions no
+# process holds any more and are ignored.
+_RUN_ID = uuid.uuid4().hex
+
+_JOBS = {}
+_JOBS_LOCK = threading.Lock()
+
+# job_id -> set of client ids still waiting on the job; None pins the job
+# (submitted without a client) so it is never cancelled.
+_JOB_WAITERS = {}
+_JOB_CANCEL_EVENTS = {}
+
+# (client_id, scope) -> (generation, selection key)
+_CLIENT_SELECTIONS = OrderedDict()
+
+
+def session_job_id(year, gp, session_type, telemetry=True):
+    suffix = "tel" if telemetry else "timing"
+    return f"{int(year)}-{gp}-{session_type}-{suffix}"
+
+
+def submit_session_load(
+    year,
+    gp,
+    session_type,
+    telemetry=True,
+    client_id=None,
+    priority=PRIORITY_INTERACTIVE,
+):
+    """
+    Queues a session load on the data_engine scheduler and returns its job
+    id. Requests for a session that is already loading share the running job,
+    promoting it when an interactive request joins background warming; warm
+    sessions are reported as done immediately. Jobs submitted for a client
+    are cancelled once no client is waiting on them any more.
+    """
+    job_id = session_job_id(year, gp, session_type, telemetry)
+
+    if get_cached_session(year, gp, session_type, telemetry=telemetry) is not None:
+        _write_status(job_id, state="done", stage="done")
+        return job_id
+
+    with _JOBS_LOCK:
+        future = _JOBS.get(job_id)
+        if future is not None and not future.done():
+            _add_waiter(job_id, client_id)
+            # Revive a job that was cancelled but has not aborted yet.
+            _JOB_CANCEL_EVENTS[job_id].clear()
+            if priority == PRIORITY_INTERACTIVE:
+                promote_session_work(future)
+            return job_id
+
+        cancel_event = threading.Event()
+        _JOB_CANCEL_EVENTS[job_id] = cancel_event
+        _JOB_WAITERS[job_id] = set()
+        _add_waiter(job_id, client_id)
+
+        _write_status(job_id, state="queued", stage="queued")
+        _JOBS[job_id] = schedule_session_work(
+            _run_session_job,
+            job_id,
+            year,
+            gp,
+            session_type,
+            telemetry,
+            cancel_event,
+            priority=priority,
+        )
+    return job_id
+
+
+def claim_selection(client_id, scope, key):
+    """
+    Records a client's latest selection for a scope and returns its
+    generation. A new session selection releases the client's interest in
+    any in-flight loads, cancelling those nobody else is waiting on.
+    """
+    selection_key = (client_id, scope)
+    with _JOBS_LOCK:
+        generation, current_key = _CLIENT_SELECTIONS.get(selection_key, (0, None))
+        if current_key != key:
+            generation += 1
+            _CLIENT_SELECTIONS[selection_key] = (generation, key)
+            if scope == "session":
+                _release_client_jobs(client_id)
+        else:
+            # First claim of an empty selection (page load).
+            _CLIENT_SELECTIONS.setdefault(selection_key, (generation, key))
+        _CLIENT_SELECTIONS.move_to_end(selection_key)
+        while len(_CLIENT_SELECTIONS) > MAX_TRACKED_SELECTIONS:
+            _CLIENT_SELECTIONS.popitem(last=False)
+        return generation
+
+
+def is_current_selection(client_id, scope, generation):
+    """
+    Returns False once a newer selection was claimed for the client and scope.
+    """
+    with _JOBS_LOCK:
+        current = _CLIENT_SELECTIONS.get((client_id, scope))
+    return current is None or current[0] == generation
+
+
+def _add_waiter(job_id, client_id):
+    waiters = _JOB_WAITERS.get(job_id)
+    if client_id is None:
+        _JOB_WAITERS[job_id] = None
+    elif waiters is not None:
+        waiters.add(client_id)
+
+
+def _release_client_jobs(client_id):
+    for job_id, waiters in _JOB_WAITERS.items():
+        if not waiters or client_id not in waiters:
+            continue
+        waiters.discard(client_id)
+        if waiters:
+            continue
+
+        future = _JOBS.get(job_id)
+        if future is None or future.done():
+            continue
+        if future.cancel():
+            _write_status(job_id, state="cancelled", stage="cancelled")
+        else:
+            _JOB_CANCEL_EVENTS[job_id].set()
+
+
+def get_job_status(job_id):
+    """
+    Returns the last status recorded for a job in this server run, or None
+    if unknown.
+    """
+    try:
+        with open(_status_path(job_id), "r", encoding="utf-8") as handle:
+            status = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    return status if status.get("run") == _RUN_ID else None
+
+
+def get_ready_session(year, gp, session_type, telemetry=True):
+    """
+    Returns the session once it is loaded, or None while it is still loading.
+    Sessions are cached per worker process while job statuses are shared, so
+    a worker that finds the job done without the session in its own cache
+    loads it here, but only from the snapshot and telemetry store the job
+    left behind. Anything slower is left to the load job that
+    sync_session_load submits in this process.
+    """
+    session = get_cached_session(year, gp, session_type, telemetry=telemetry)
+    if session is not None:
+        return session
+
+    status = get_job_status(session_job_id(year, gp, session_type))
+    if status is None or status.get("state") != "done":
+        return None
+    if not has_persisted_session(year, gp, session_type, telemetry=telemetry):
+        return None
+    try:
+        return load_session(year, gp, session_type, telemetry=telemetry)
+    except Exception as exc:
+        logging.getLogger(__name__).warning("Loading finished session %s failed: %s", (year, gp, session_type), exc)
+        return None
+
+
+def _run_session_job(job_id, year, gp, session_type, telemetry, cancel_event):
+    started = time.time()
+
+    def _progress(stage):
+        _write_status(job_id, state="running", stage=stage, started=started)
+
+    try:
+        session = load_session(
+            year,
+            gp,
+            session_type,
+            telemetry=telemetry,
+            progress=_progress,
+            cancel_event=cancel_event,
+        )
+        if telemetry:
+            # Timing data is usable meanwhile; telemetry readers wait on the parse.
+            parse_deferred_telemetry(session, progress=_progress, cancel_event=cancel_event)
+        if telemetry and not cancel_event.is_set():
+            _build_derived(session)
+    except SessionLoadCancelled:
+        _write_status(job_id, state="cancelled", stage="cancelled", started=started)
+        return
+    except Exception as exc:
+        _write_status(job_id, state="error", stage="error", started=started, error=str(exc))
+        raise
+
+    _write_status(job_id, state="done", stage="done", started=started)
+
+
+def preload_sessions(spec):
+    """
+    Loads the sessions listed in spec, comma separated "year:event:session"
+    entries using the dashboard's dropdown values (e.g. "2024:0:5,2024:3:5"),
+    together with their derived data. Afterwards the collector is frozen so
+    workers forked from this process share the loaded objects copy-on-write
+    instead of dirtying their pages during garbage collection.
+    Returns the job ids of the sessions that were loaded.
+    """
+    logger = logging.getLogger(__name__)
+    loaded = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            year, gp, session_type = (int(value) for value in entry.split(":"))
+        except ValueError:
+            logger.warning("Ignoring malformed preload entry %r", entry)
+            continue
+
+        job_id = session_job_id(year, gp, session_type)
+        started = time.time()
+        try:
+            session = load_session(year, gp, session_type)
+            parse_deferred_telemetry(session)
+            _build_derived(session)
+        except Exception as exc:
+            logger.warning("Preloading %s failed: %s", job_id, exc)
+            continue
+        _write_status(job_id, state="done", stage="done", started=started)
+        loaded.append(job_id)
+
+    wait_for_session_writes()
+    gc.collect()
+    gc.freeze()
+    logger.info("Preloaded %d session(s); froze %d objects", len(loaded), gc.get_freeze_count())
+    return loaded
+
+
+def _build_derived(session):
+    get_track_geometry(session)
+    # With lazy telemetry, features are built per driver as drivers are
+    # selected; the full table would load every driver.
+    if not getattr(session, "_f1d_lazy_telemetry", False):
+        get_lap_feature_table(session)
+
+
+def _stage_progress(stage):
+    if stage == "done":
+        return 1.0
+    if stage in LOAD_STAGES:
+        return LOAD_STAGES.index(stage) / len(LOAD_STAGES)
+    return 0.0
+
+
+def _status_path(job_id):
+    return os.path.join(JOB_DIR, f"{job_id}.json")
+
+
+def _write_status(job_id, state, stage, started=None, error=None):
+    now = time.time()
+    status = {
+        "job_id": job_id,
+        "run": _RUN_ID,
+        "state": state,
+        "stage": stage,
+        "label": JOB_STAGE_LABELS.get(stage, stage),
+        "progress": _stage_progress(stage),
+        "elapsed": round(now - started, 2) if started else 0.0,
+        "updated": now,
+        "error": error,
+    }
+
+    os.makedirs(JOB_DIR, exist_ok=True)
+    path = _status_path(job_id)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(status, handle)
+    os.replace(tmp_path, path)
+    return status
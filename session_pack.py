@@ -0,0 +1,351 @@
+# session_pack.py
+"""
+Compressed, versioned per-season session packs.
+
+A season pack is a directory holding season.f1pack (the supported schedule
+and a listing of packed events) and one event_<index>.f1pack per event with
+the laps, results and per-lap car/position telemetry of its sessions. Every
+table is stored column-wise; telemetry is cut into one zlib-compressed chunk
+per (session, driver, source, lap), so reading a lap decompresses that lap
+only:
+
+    pack = SeasonPack("packs/2024")
+    laps = pack.laps(3, 5)
+    car = pack.lap_telemetry(3, 5, "44", 12)
+
+Each file ends with a compressed JSON index of chunk offsets and frame
+layouts; packs of another PACK_FORMAT_VERSION are refused.
+"""
+import json
+import os
+import struct
+import threading
+import zlib
+from mmap import ACCESS_READ, mmap
+
+import numpy as np
+import pandas as pd
+
+from session_snapshot import _decode_frame, _encode_frame, _json_default, _json_object
+
+
+# Bump when the pack layout changes; readers refuse other versions.
+PACK_FORMAT_VERSION = 2
+
+PACK_MAGIC = b"F1DPACK\x00"
+
+SEASON_FILE = "season.f1pack"
+
+PACK_COMPRESSION_LEVEL = int(os.environ.get("F1D_PACK_COMPRESSION_LEVEL", "6"))
+
+_SOURCES = ("car", "pos")
+
+# Index offset and length, followed by the magic again.
+_FOOTER = struct.Struct("<QQ8s")
+
+
+class PackWriter:
+    """
+    Appends compressed chunks to a pack file. The file is written under a
+    temporary name and renamed into place on close().
+    """
+
+    def __init__(self, path, **info):
+        self.path = path
+        self._tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._handle = open(self._tmp_path, "wb")
+        self._handle.write(PACK_MAGIC)
+        self.index = {"format": PACK_FORMAT_VERSION, "chunks": {}, "frames": {}, **info}
+
+    def add_arrays(self, name, arrays):
+        offset = self._handle.tell()
+        data = zlib.compress(_pack_arrays(arrays), PACK_COMPRESSION_LEVEL)
+        self._handle.write(data)
+        self.index["chunks"][name] = [offset, len(data)]
+
+    def add_frame(self, name, frame):
+        arrays = {}
+        self.index["frames"][name] = _encode_frame(frame, name, arrays)
+        self.add_arrays(name, arrays)
+
+    def close(self):
+        offset = self._handle.tell()
+        data = zlib.compress(json.dumps(self.index, default=_json_default).encode("utf-8"), PACK_COMPRESSION_LEVEL)
+        self._handle.write(data)
+        self._handle.write(_FOOTER.pack(offset, len(data), PACK_MAGIC))
+        self._handle.close()
+        os.replace(self._tmp_path, self.path)
+        return self.path
+
+    def abort(self):
+        self._handle.close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+class PackFile:
+    """
+    Read-only random access to the chunks of one pack file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as handle:
+            self._data = mmap(handle.fileno(), 0, access=ACCESS_READ)
+        if len(self._data) < len(PACK_MAGIC) + _FOOTER.size or self._data[: len(PACK_MAGIC)] != PACK_MAGIC:
+            raise ValueError(f"{path} is not a session pack")
+        offset, length, magic = _FOOTER.unpack(self._data[-_FOOTER.size:])
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{path} is truncated")
+        self.index = json.loads(zlib.decompress(self._data[offset : offset + length]), object_hook=_json_object)
+        if self.index.get("format") != PACK_FORMAT_VERSION:
+            raise ValueError(f"{path} has pack format {self.index.get('format')}, expected {PACK_FORMAT_VERSION}")
+
+    def __contains__(self, name):
+        return name in self.index["chunks"]
+
+    def read_arrays(self, name):
+        offset, length = self.index["chunks"][name]
+        return _unpack_arrays(zlib.decompress(self._data[offset : offset + length]))
+
+    def read_frame(self, name):
+        return _decode_frame(self.index["frames"][name], self.read_arrays(name))
+
+    def close(self):
+        self._data.close()
+
+
+class SeasonPack:
+    """
+    Reader for a season pack directory. Event files are opened on first use.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._season = PackFile(os.path.join(directory, SEASON_FILE))
+        self._events = {}
+        self._lock = threading.Lock()
+
+    @property
+    def year(self):
+        return self._season.index["year"]
+
+    def schedule(self):
+        return self._season.read_frame("schedule")
+
+    def events(self):
+        """
+        Returns {event index: {"name", "file", "sessions"}} of packed events.
+        """
+        return {int(index): entry for index, entry in self._season.index["events"].items()}
+
+    def sessions(self, event_index):
+        """
+        Returns {session number: session info} for one packed event.
+        """
+        return {int(number): info for number, info in self._event(event_index).index["sessions"].items()}
+
+    def laps(self, event_index, session_number):
+        return self._event(event_index).read_frame(f"{int(session_number)}/laps")
+
+    def results(self, event_index, session_number):
+        return self._event(event_index).read_frame(f"{int(session_number)}/results")
+
+    def lap_numbers(self, event_index, session_number, driver):
+        info = self.sessions(event_index).get(int(session_number), {})
+        return info.get("lap_numbers", {}).get(str(driver), [])
+
+    def lap_telemetry(self, event_index, session_number, driver, lap_number, source="car"):
+        """
+        Returns the car (or "pos") samples of one lap, padded by one sample
+        on each side, without decompressing anything else.
+        """
+        pack = self._event(event_index)
+        prefix = f"{int(session_number)}/{source}/{driver}"
+        name = f"{prefix}/{int(lap_number)}"
+        if name not in pack:
+            raise KeyError(f"No {source} telemetry for driver {driver} lap {lap_number}")
+        arrays = pack.read_arrays(name)
+        if f"{prefix}/shared" in pack:
+            arrays.update(pack.read_arrays(f"{prefix}/shared"))
+        return _decode_frame(pack.index["frames"][prefix], arrays)
+
+    def _event(self, event_index):
+        with self._lock:
+            pack = self._events.get(int(event_index))
+            if pack is None:
+                entry = self._season.index["events"].get(str(int(event_index)))
+                if entry is None:
+                    raise KeyError(f"Event {event_index} is not in the {self.year} pack")
+                pack = PackFile(os.path.join(self.directory, entry["file"]))
+                self._events[int(event_index)] = pack
+            return pack
+
+
+def event_pack_name(event_index):
+    return f"event_{int(event_index):02d}.f1pack"
+
+
+def write_event_pack(year, event_index, directory, sessions=None):
+    """
+    Loads every (or each listed) session of one event through
+    data_engine.load_session and writes them to the event's pack file.
+    Returns the event's entry for the season index. Sessions that fail to
+    load are listed under "failed" and left out.
+    """
+    import fastf1
+
+    from data_engine import evict_session, get_supported_event_schedule, load_session
+
+    event = get_supported_event_schedule(year).loc[int(event_index)]
+    path = os.path.join(directory, event_pack_name(event_index))
+    writer = PackWriter(
+        path,
+        year=int(year),
+        event_index=int(event_index),
+        event_name=str(event["EventName"]),
+        fastf1=fastf1.__version__,
+        sessions={},
+    )
+    failed = {}
+    try:
+        for number in range(1, 6):
+            name = event.get(f"Session{number}")
+            if name is None or pd.isna(name) or (sessions is not None and number not in sessions):
+                continue
+            try:
+                session = load_session(year, int(event_index), number, telemetry=True)
+            except Exception as exc:
+                failed[str(number)] = str(exc)
+                continue
+            writer.index["sessions"][str(number)] = _write_session(writer, str(number), session)
+            # One session in memory at a time per worker.
+            evict_session(year, int(event_index), number)
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+
+    return {
+        "name": str(event["EventName"]),
+        "file": os.path.basename(path),
+        "sessions": {number: info["name"] for number, info in writer.index["sessions"].items()},
+        "failed": failed,
+        "bytes": os.path.getsize(path),
+    }
+
+
+def write_season_index(year, directory, schedule, events):
+    """
+    Writes season.f1pack with the schedule and the event entries returned by
+    write_event_pack, merged with the events of an existing season file.
+    """
+    import fastf1
+
+    path = os.path.join(directory, SEASON_FILE)
+    merged = {}
+    if os.path.exists(path):
+        try:
+            previous = PackFile(path)
+            merged.update(previous.index["events"])
+            previous.close()
+        except (OSError, ValueError):
+            pass
+    merged.update({str(int(index)): entry for index, entry in events.items()})
+
+    writer = PackWriter(
+        path,
+        year=int(year),
+        fastf1=fastf1.__version__,
+        created=pd.Timestamp.now(tz="UTC").isoformat(),
+        events=merged,
+    )
+    try:
+        writer.add_frame("schedule", pd.DataFrame(schedule))
+        return writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+
+
+def _write_session(writer, prefix, session):
+    laps = session.laps
+    writer.add_frame(f"{prefix}/laps", pd.DataFrame(laps))
+    writer.add_frame(f"{prefix}/results", pd.DataFrame(session.results))
+
+    lap_numbers = {}
+    for source in _SOURCES:
+        for driver, frame in getattr(session, f"{source}_data").items():
+            driver_laps = laps[laps["DriverNumber"] == driver]
+            numbers = _write_driver_laps(writer, f"{prefix}/{source}/{driver}", pd.DataFrame(frame), driver_laps)
+            if source == "car":
+                lap_numbers[str(driver)] = numbers
+
+    t0_date = getattr(session, "_t0_date", None)
+    start_time = getattr(session, "_session_start_time", None)
+    return {
+        "name": str(session.name),
+        "drivers": [str(driver) for driver in session.drivers],
+        "lap_numbers": lap_numbers,
+        "t0_date": None if t0_date is None or pd.isna(t0_date) else pd.Timestamp(t0_date).isoformat(),
+        "session_start_time": None if start_time is None or pd.isna(start_time) else int(pd.Timedelta(start_time).value),
+        "total_laps": getattr(session, "_total_laps", None),
+    }
+
+
+def _write_driver_laps(writer, prefix, frame, driver_laps):
+    arrays = {}
+    writer.index["frames"][prefix] = _encode_frame(frame, prefix, arrays)
+    # Label categories are shared by all laps; everything else has one
+    # value per sample and is cut per lap.
+    shared = {key: values for key, values in arrays.items() if key.endswith("/categories")}
+    if shared:
+        writer.add_arrays(f"{prefix}/shared", shared)
+
+    sample_time = frame["SessionTime"].to_numpy().view(np.int64)
+    numbers = []
+    for _, lap in driver_laps.iterrows():
+        start, end = lap["LapStartTime"], lap["Time"]
+        if pd.isna(lap["LapNumber"]) or pd.isna(start) or pd.isna(end):
+            continue
+        # One sample of padding each side, as Lap.get_car_data(pad=1) uses.
+        first = max(0, int(np.searchsorted(sample_time, pd.Timedelta(start).value, "left")) - 1)
+        last = min(len(frame), int(np.searchsorted(sample_time, pd.Timedelta(end).value, "right")) + 1)
+        number = int(lap["LapNumber"])
+        writer.add_arrays(
+            f"{prefix}/{number}",
+            {key: values[first:last] for key, values in arrays.items() if key not in shared},
+        )
+        numbers.append(number)
+    return numbers
+
+
+def _pack_arrays(arrays):
+    # Object columns arrive label-encoded from _encode_frame, so every chunk
+    # is raw fixed-width data and reading a pack never unpickles anything.
+    header = []
+    parts = []
+    for key, values in arrays.items():
+        values = np.asarray(values)
+        if values.dtype.kind == "O":
+            raise TypeError(f"Cannot pack object array {key}")
+        data = np.ascontiguousarray(values).tobytes()
+        header.append({"key": key, "dtype": values.dtype.str, "shape": list(values.shape), "length": len(data)})
+        parts.append(data)
+    encoded = json.dumps(header).encode("utf-8")
+    return b"".join([struct.pack("<I", len(encoded)), encoded, *parts])
+
+
+def _unpack_arrays(data):
+    (size,) = struct.unpack_from("<I", data)
+    header = json.loads(data[4 : 4 + size])
+    arrays = {}
+    offset = 4 + size
+    for entry in header:
+        chunk = data[offset : offset + entry["length"]]
+        offset += entry["length"]
+        arrays[entry["key"]] = np.frombuffer(chunk, dtype=entry["dtype"]).reshape(entry["shape"])
+    return arrays
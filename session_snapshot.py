@@ -0,0 +1,317 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from telemetry_store import LazyTelemetry
+
+
+# Bump when the snapshot layout changes; older snapshots are ignored.
+SNAPSHOT_FORMAT_VERSION = 2
+
+# Small session-level frames stored alongside laps and results when loaded.
+_AUX_FRAMES = {
+    "session_status": "_session_status",
+    "track_status": "_track_status",
+    "race_control_messages": "_race_control_messages",
+}
+
+_logger = logging.getLogger(__name__)
+
+
+def write_session_snapshot(session, path, telemetry=True):
+    """
+    Writes a loaded session's laps, results, driver info and (unless
+    telemetry is False) per-driver car/position data to a single uncompressed
+    .npz file, one array per column. Returns the path, or None when the
+    session is not fully loaded.
+    """
+    if not hasattr(session, "_laps") or not hasattr(session, "_results"):
+        return None
+
+    import fastf1
+
+    arrays = {}
+    frames = {
+        "laps": _encode_frame(session._laps, "laps", arrays),
+        "results": _encode_frame(session._results, "results", arrays),
+    }
+    for name, attr in _AUX_FRAMES.items():
+        frame = getattr(session, attr, None)
+        if isinstance(frame, pd.DataFrame):
+            frames[name] = _encode_frame(frame, name, arrays)
+
+    has_telemetry = telemetry and hasattr(session, "_car_data") and hasattr(session, "_pos_data")
+    telemetry = {"car": {}, "pos": {}}
+    if has_telemetry:
+        for source, data in (("car", session._car_data), ("pos", session._pos_data)):
+            for driver, frame in data.items():
+                telemetry[source][str(driver)] = _encode_frame(frame, f"{source}/{driver}", arrays)
+
+    meta = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "fastf1": fastf1.__version__,
+        "has_telemetry": has_telemetry,
+        "t0_date": _timestamp_text(getattr(session, "_t0_date", None)),
+        "session_start_time": _timedelta_ns(getattr(session, "_session_start_time", None)),
+        "total_laps": getattr(session, "_total_laps", None),
+        "session_info": getattr(session, "_session_info", None),
+        "frames": frames,
+        "telemetry": telemetry,
+    }
+    arrays["__meta__"] = np.array(json.dumps(meta, default=_json_default))
+    return _write_npz(path, arrays)
+
+
+def write_value_file(path, value):
+    """
+    Writes a DataFrame, or a JSON value (dicts, lists, numbers, strings,
+    timestamps, None), to an .npz file with the snapshot column encoding, so
+    reading it back never unpickles anything. Raises TypeError for other
+    values.
+    """
+    arrays = {}
+    meta = {"format": SNAPSHOT_FORMAT_VERSION}
+    if isinstance(value, pd.DataFrame):
+        meta["frame"] = _encode_frame(value, "frame", arrays)
+    else:
+        meta["value"] = value
+    arrays["__meta__"] = np.array(json.dumps(meta, default=_json_default))
+    return _write_npz(path, arrays)
+
+
+def read_value_file(path):
+    """
+    Reads a value written by write_value_file; DataFrames come back as plain
+    DataFrames. Raises ValueError for files of another format.
+    """
+    with np.load(path) as data:
+        meta = json.loads(str(data["__meta__"]), object_hook=_json_object)
+        if meta.get("format") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"{path} has format {meta.get('format')}, expected {SNAPSHOT_FORMAT_VERSION}")
+        if "frame" in meta:
+            return _decode_frame(meta["frame"], data)
+    return meta.get("value")
+
+
+def _write_npz(path, arrays):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as handle:
+            np.savez(handle, **arrays)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+def restore_session_snapshot(session, path, telemetry=True, lazy=False):
+    """
+    Populates an unloaded FastF1 session from a snapshot written by
+    write_session_snapshot. Returns False, leaving the session untouched, when
+    no usable snapshot exists (missing, outdated, or lacking telemetry). With
+    lazy, each driver's car/position data is decoded on first access.
+    """
+    if not os.path.exists(path):
+        return False
+
+    import fastf1
+    from fastf1.core import Laps, SessionResults, Telemetry
+
+    try:
+        with np.load(path) as data:
+            meta = json.loads(str(data["__meta__"]), object_hook=_json_object)
+            if (
+                meta.get("format") != SNAPSHOT_FORMAT_VERSION
+                or meta.get("fastf1") != fastf1.__version__
+                or (telemetry and not meta.get("has_telemetry"))
+            ):
+                return False
+
+            frames = {
+                name: _decode_frame(spec, data)
+                for name, spec in meta["frames"].items()
+            }
+            car_data = {}
+            pos_data = {}
+            if telemetry and lazy:
+                car_data, pos_data = (
+                    LazyTelemetry(
+                        list(meta["telemetry"][source]),
+                        lambda driver, source=source: _read_driver_telemetry(session, path, meta, source, driver),
+                    )
+                    for source in ("car", "pos")
+                )
+            elif telemetry:
+                for source, target in (("car", car_data), ("pos", pos_data)):
+                    for driver, spec in meta["telemetry"][source].items():
+                        target[driver] = Telemetry(
+                            _decode_frame(spec, data),
+                            session=session,
+                            driver=driver,
+                        )
+    except Exception as exc:
+        _logger.warning("Ignoring unreadable session snapshot %s: %s", path, exc)
+        return False
+
+    session._results = SessionResults(frames.pop("results"))
+    session._laps = Laps(frames.pop("laps"), session=session)
+    for name, frame in frames.items():
+        setattr(session, _AUX_FRAMES[name], frame)
+
+    session._session_start_time = _timedelta_value(meta.get("session_start_time"))
+    session._total_laps = meta.get("total_laps")
+    if meta.get("session_info") is not None:
+        session._session_info = meta["session_info"]
+
+    if telemetry:
+        session._t0_date = pd.Timestamp(meta["t0_date"]) if meta.get("t0_date") else None
+        session._car_data = car_data
+        session._pos_data = pos_data
+    return True
+
+
+def snapshot_has_telemetry(path):
+    """
+    Returns True when the snapshot at path is readable in this format and
+    holds car/position data.
+    """
+    try:
+        with np.load(path) as data:
+            meta = json.loads(str(data["__meta__"]), object_hook=_json_object)
+    except Exception:
+        return False
+    return meta.get("format") == SNAPSHOT_FORMAT_VERSION and bool(meta.get("has_telemetry"))
+
+
+def _read_driver_telemetry(session, path, meta, source, driver):
+    from fastf1.core import Telemetry
+
+    # NpzFile reads members on access: only this driver's columns.
+    with np.load(path) as data:
+        frame = _decode_frame(meta["telemetry"][source][driver], data)
+    return Telemetry(frame, session=session, driver=driver)
+
+
+def _encode_frame(frame, prefix, arrays):
+    columns = []
+    for position, column in enumerate(frame.columns):
+        key = f"{prefix}/{position}"
+        spec = _encode_column(frame[column], key, arrays)
+        spec["name"] = column
+        columns.append(spec)
+
+    index = _encode_column(frame.index.to_series(), f"{prefix}/index", arrays)
+    index["name"] = frame.index.name
+    return {"columns": columns, "index": index, "rows": int(len(frame))}
+
+
+def _encode_column(values, key, arrays):
+    dtype = values.dtype
+    spec = {"key": key, "dtype": str(dtype)}
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        spec["kind"] = "numeric"
+        arrays[key] = values.to_numpy()
+    elif isinstance(dtype, np.dtype) and dtype.kind in "mM":
+        spec["kind"] = "datetime"
+        arrays[key] = values.to_numpy().view(np.int64)
+    else:
+        present = values.dropna()
+        if present.map(type).eq(str).all():
+            # Repeated labels (driver, compound, status) -> codes + categories.
+            codes, categories = pd.factorize(values, use_na_sentinel=True)
+            spec["kind"] = "labels"
+            arrays[key] = codes.astype(np.int32)
+            arrays[f"{key}/categories"] = np.asarray(categories, dtype=str)
+        else:
+            # Mixed values (flags with gaps, timestamps among None) -> codes +
+            # JSON categories kept in the spec, so loading needs no pickle.
+            lookup = {}
+            codes = np.empty(len(values), dtype=np.int32)
+            for position, value in enumerate(values.to_numpy(dtype=object)):
+                token = json.dumps(value, default=_json_default)
+                codes[position] = lookup.setdefault(token, (len(lookup), value))[0]
+            spec["kind"] = "values"
+            spec["categories"] = [value for _, value in lookup.values()]
+            arrays[key] = codes
+    return spec
+
+
+def _decode_frame(spec, data):
+    columns = {}
+    for column in spec["columns"]:
+        columns[column["name"]] = _decode_column(column, data)
+    index = pd.Index(_decode_column(spec["index"], data), name=spec["index"]["name"])
+    return pd.DataFrame(columns, index=index)
+
+
+def _decode_column(spec, data):
+    values = data[spec["key"]]
+    kind = spec["kind"]
+
+    if kind == "numeric":
+        return values
+    if kind == "datetime":
+        return values.view(spec["dtype"])
+    if kind == "labels":
+        categories = data[f"{spec['key']}/categories"].astype(object)
+        decoded = np.empty(values.shape, dtype=object)
+        present = values >= 0
+        decoded[present] = categories[values[present]]
+        decoded[~present] = None
+        return decoded
+
+    categories = np.empty(len(spec["categories"]), dtype=object)
+    for position, value in enumerate(spec["categories"]):
+        categories[position] = value
+    values = categories[values]
+    if spec["dtype"] != "object":
+        try:
+            return pd.array(values, dtype=spec["dtype"])
+        except (TypeError, ValueError):
+            pass
+    return values
+
+
+def _timestamp_text(value):
+    if value is None or pd.isna(value):
+        return None
+    return pd.Timestamp(value).isoformat()
+
+
+def _timedelta_ns(value):
+    if value is None or pd.isna(value):
+        return None
+    return int(pd.Timedelta(value).value)
+
+
+def _timedelta_value(value):
+    return None if value is None else pd.Timedelta(value, unit="ns")
+
+
+def _json_default(value):
+    # Tags the values JSON has no type for; _json_object turns them back.
+    if value is None or value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime, np.datetime64)):
+        return {"__datetime__": pd.Timestamp(value).isoformat()}
+    if isinstance(value, (pd.Timedelta, timedelta, np.timedelta64)):
+        return {"__timedelta__": int(pd.Timedelta(value).value)}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot store {type(value).__name__} values in a snapshot")
+
+
+def _json_object(obj):
+    if len(obj) == 1 and "__datetime__" in obj:
+        return pd.Timestamp(obj["__datetime__"])
+    if len(obj) == 1 and "__timedelta__" in obj:
+        return pd.Timedelta(obj["__timedelta__"], unit="ns")
+    return obj
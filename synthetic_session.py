@@ -0,0 +1,510 @@
+# synthetic_session.py
+"""
+Deterministic synthetic sessions for benchmarks and offline runs.
+
+make_synthetic_session returns a real FastF1 Session populated with generated
+laps, results and car/position telemetry, so services and figure builders run
+on it unchanged (pick_drivers, pick_fastest, get_telemetry, get_driver, ...)
+without touching the live timing API. The same arguments always produce the
+same session.
+"""
+import numpy as np
+import pandas as pd
+
+
+# (number, abbreviation, first name, last name, team index)
+SYNTHETIC_DRIVERS = [
+    ("1", "VER", "Max", "Verstappen", 0),
+    ("11", "PER", "Sergio", "Perez", 0),
+    ("16", "LEC", "Charles", "Leclerc", 1),
+    ("55", "SAI", "Carlos", "Sainz", 1),
+    ("4", "NOR", "Lando", "Norris", 2),
+    ("81", "PIA", "Oscar", "Piastri", 2),
+    ("44", "HAM", "Lewis", "Hamilton", 3),
+    ("63", "RUS", "George", "Russell", 3),
+    ("14", "ALO", "Fernando", "Alonso", 4),
+    ("18", "STR", "Lance", "Stroll", 4),
+    ("10", "GAS", "Pierre", "Gasly", 5),
+    ("31", "OCO", "Esteban", "Ocon", 5),
+    ("23", "ALB", "Alexander", "Albon", 6),
+    ("2", "SAR", "Logan", "Sargeant", 6),
+    ("22", "TSU", "Yuki", "Tsunoda", 7),
+    ("3", "RIC", "Daniel", "Ricciardo", 7),
+    ("77", "BOT", "Valtteri", "Bottas", 8),
+    ("24", "ZHO", "Guanyu", "Zhou", 8),
+    ("27", "HUL", "Nico", "Hulkenberg", 9),
+    ("20", "MAG", "Kevin", "Magnussen", 9),
+]
+
+# (name, team colour without '#')
+SYNTHETIC_TEAMS = [
+    ("Red Bull Racing", "3671c6"),
+    ("Ferrari", "e8002d"),
+    ("McLaren", "ff8000"),
+    ("Mercedes", "27f4d2"),
+    ("Aston Martin", "229971"),
+    ("Alpine", "ff87bc"),
+    ("Williams", "64c4ff"),
+    ("RB", "6692ff"),
+    ("Kick Sauber", "52e252"),
+    ("Haas F1 Team", "b6babd"),
+]
+
+SYNTHETIC_SESSIONS = ["Practice 1", "Sprint Qualifying", "Sprint", "Qualifying", "Race"]
+
+# Typical laps per driver in each session, used when generating whole
+# weekends (F1D_SYNTHETIC, see data_engine).
+SYNTHETIC_SESSION_LAPS = {
+    "Practice 1": 25,
+    "Sprint Qualifying": 12,
+    "Sprint": 19,
+    "Qualifying": 15,
+    "Race": 57,
+}
+
+RACE_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+
+# Vehicle model used to turn track curvature into a speed trace.
+_TOP_SPEED = 330 / 3.6
+_LATERAL_ACCEL = 38.0
+_DRIVE_ACCEL = 12.0
+_BRAKE_DECEL = 42.0
+_GEAR_SPEEDS = np.array([0, 95, 130, 160, 190, 220, 255, 290]) / 3.6
+_TRACK_POINTS = 4000
+_TRACK_CORNERS = 12
+
+
+def make_synthetic_session(
+    drivers=2,
+    laps=20,
+    car_hz=4.0,
+    pos_hz=4.0,
+    seed=0,
+    session_name="Race",
+    year=2024,
+    track_length=5000.0,
+):
+    """
+    Builds a loaded FastF1 session from generated data.
+
+    :param drivers: Number of drivers (1-20), or a list of driver numbers
+        taken from SYNTHETIC_DRIVERS
+    :param laps: Laps per driver
+    :param car_hz: Mean car data sample rate (real feed: ~4 Hz)
+    :param pos_hz: Mean position data sample rate (real feed: ~4 Hz)
+    :param seed: Random seed; equal arguments give identical sessions
+    :param session_name: One of SYNTHETIC_SESSIONS
+    :param year: Season reported by the event
+    :param track_length: Approximate lap length in metres
+    """
+    from fastf1.core import Laps, Session, SessionResults, Telemetry
+
+    if session_name not in SYNTHETIC_SESSIONS:
+        raise ValueError(f"session_name must be one of {SYNTHETIC_SESSIONS}")
+
+    rng = np.random.default_rng(seed)
+    entries = _pick_drivers(drivers)
+    track = _build_track(rng, track_length)
+
+    event = _build_event(year)
+    session = Session(event, session_name, f1_api_support=True)
+    session._t0_date = pd.Timestamp(session.date).tz_localize(None) - pd.Timedelta(minutes=5)
+    session._session_start_time = pd.Timedelta(minutes=5)
+    race_like = session_name in ("Race", "Sprint")
+    session._total_laps = laps if race_like else None
+
+    driver_laps = [
+        _build_laps(rng, entry, grid_slot, laps, track, session, race_like)
+        for grid_slot, entry in enumerate(entries)
+    ]
+
+    # The live feed timestamps every car in one message, so all drivers share
+    # the sample times of each source (FastF1 relies on this when it lines up
+    # drivers, e.g. for DriverAhead).
+    session_end = max(frame["Time"].max() for frame, _ in driver_laps).total_seconds() + 5.0
+    car_times = _sample_times(rng, session_end, car_hz)
+    pos_times = _sample_times(rng, session_end, pos_hz)
+
+    car_data = {}
+    pos_data = {}
+    for entry, (lap_frame, lap_factors) in zip(entries, driver_laps):
+        number = entry[0]
+        car_frame, pos_frame = _build_telemetry(
+            rng, track, lap_frame, lap_factors, session, car_times, pos_times
+        )
+        car_data[number] = Telemetry(car_frame, session=session, driver=number)
+        pos_data[number] = Telemetry(pos_frame, session=session, driver=number)
+
+    lap_frame = pd.concat([frame for frame, _ in driver_laps], ignore_index=True)
+    if race_like:
+        _assign_race_positions(lap_frame)
+
+    session._results = SessionResults(
+        _build_results(entries, lap_frame, race_like),
+        _force_default_cols=True,
+    )
+    session._laps = Laps(lap_frame, session=session, _force_default_cols=True)
+    session._car_data = car_data
+    session._pos_data = pos_data
+    session._session_status = pd.DataFrame(
+        {"Time": [pd.Timedelta(0), session._session_start_time], "Status": ["Inactive", "Started"]}
+    )
+    session._track_status = pd.DataFrame(
+        {"Time": [pd.Timedelta(0)], "Status": ["1"], "Message": ["AllClear"]}
+    )
+
+    # Same markers load_session sets; synthetic sessions are never persisted.
+    session._f1d_has_telemetry = True
+    session._f1d_slim = False
+    session._f1d_synthetic = True
+    return session
+
+
+def _pick_drivers(drivers):
+    if isinstance(drivers, int):
+        if not 1 <= drivers <= len(SYNTHETIC_DRIVERS):
+            raise ValueError(f"drivers must be between 1 and {len(SYNTHETIC_DRIVERS)}")
+        return SYNTHETIC_DRIVERS[:drivers]
+
+    by_number = {entry[0]: entry for entry in SYNTHETIC_DRIVERS}
+    return [by_number[str(number)] for number in drivers]
+
+
+def synthetic_event_schedule(year=2024):
+    """
+    Returns a one-event schedule (the event every synthetic session belongs
+    to) with the columns of FastF1's event schedule that the dashboard reads.
+    """
+    return pd.DataFrame([_event_data(year)])
+
+
+def _build_event(year):
+    from fastf1.events import Event
+
+    return Event(pd.Series(_event_data(year)), year=year)
+
+
+def _event_data(year):
+    event_date = pd.Timestamp(f"{year}-06-02")
+    data = {
+        "RoundNumber": 1,
+        "Country": "Nowhere",
+        "Location": "Synthetic Circuit",
+        "OfficialEventName": f"FORMULA 1 SYNTHETIC GRAND PRIX {year}",
+        "EventDate": event_date,
+        "EventName": "Synthetic Grand Prix",
+        "EventFormat": "sprint_qualifying",
+        "F1ApiSupport": True,
+    }
+    for offset, name in enumerate(SYNTHETIC_SESSIONS, start=1):
+        start = event_date - pd.Timedelta(days=2) + pd.Timedelta(hours=6 * offset)
+        data[f"Session{offset}"] = name
+        data[f"Session{offset}Date"] = start.tz_localize("UTC")
+        data[f"Session{offset}DateUtc"] = start
+    return data
+
+
+def _build_track(rng, track_length):
+    """
+    A closed, non-self-intersecting circuit with a mix of slow and fast
+    corners, plus the ideal speed trace along it.
+    """
+    # Star-shaped polygon (one vertex per angle, so it cannot cross itself)
+    # whose corners are rounded off by periodic smoothing.
+    angles = np.linspace(0.0, 2.0 * np.pi, _TRACK_CORNERS, endpoint=False)
+    angles += rng.uniform(-0.2, 0.2, _TRACK_CORNERS)
+    radii = rng.uniform(0.45, 1.0, _TRACK_CORNERS)
+    corner_x = radii * np.cos(angles)
+    corner_y = radii * np.sin(angles)
+    fraction = np.linspace(0.0, 1.0, 200, endpoint=False)
+    outline_x = np.concatenate(
+        [a + (b - a) * fraction for a, b in zip(corner_x, np.roll(corner_x, -1))]
+    )
+    outline_y = np.concatenate(
+        [a + (b - a) * fraction for a, b in zip(corner_y, np.roll(corner_y, -1))]
+    )
+    outline_x = _smooth_closed(outline_x, 12)
+    outline_y = _smooth_closed(outline_y, 12)
+
+    # Resample evenly by arc length and scale to the requested lap length.
+    outline_step = np.hypot(
+        np.diff(outline_x, append=outline_x[0]),
+        np.diff(outline_y, append=outline_y[0]),
+    )
+    outline_distance = np.concatenate([[0.0], np.cumsum(outline_step)])
+    even = np.linspace(0.0, outline_distance[-1], _TRACK_POINTS, endpoint=False)
+    scale = track_length / outline_distance[-1]
+    x = np.interp(even, outline_distance, np.append(outline_x, outline_x[0])) * scale
+    y = np.interp(even, outline_distance, np.append(outline_y, outline_y[0])) * scale
+
+    step = np.hypot(np.diff(x, append=x[0]), np.diff(y, append=y[0]))
+    distance = np.concatenate([[0.0], np.cumsum(step)[:-1]])
+    length = float(step.sum())
+
+    # Curvature of the closed curve from periodic central differences.
+    dx = (np.roll(x, -1) - np.roll(x, 1)) / 2.0
+    dy = (np.roll(y, -1) - np.roll(y, 1)) / 2.0
+    ddx = np.roll(x, -1) - 2.0 * x + np.roll(x, 1)
+    ddy = np.roll(y, -1) - 2.0 * y + np.roll(y, 1)
+    curvature = np.abs(dx * ddy - dy * ddx) / np.power(dx * dx + dy * dy, 1.5)
+
+    corner_limit = np.sqrt(_LATERAL_ACCEL / np.maximum(curvature, 1e-6))
+    speed = _speed_profile(np.minimum(corner_limit, _TOP_SPEED), step)
+
+    # Time to reach each point from the line, for one ideal lap.
+    seconds = np.concatenate([[0.0], np.cumsum(step / speed)])
+    return {
+        "x": x,
+        "y": y,
+        "distance": distance,
+        "length": length,
+        "speed": speed,
+        "accel": np.gradient(speed, distance) * speed,
+        "seconds": seconds[:-1],
+        "lap_seconds": float(seconds[-1]),
+    }
+
+
+def _smooth_closed(values, width):
+    kernel = np.exp(-0.5 * (np.arange(-4 * width, 4 * width + 1) / width) ** 2)
+    kernel /= kernel.sum()
+    padded = np.concatenate([values[-4 * width:], values, values[:4 * width]])
+    return np.convolve(padded, kernel, mode="valid")
+
+
+def _speed_profile(limit, step):
+    # Forward pass applies traction (fading with drag towards top speed),
+    # backward pass braking; run each twice so the profile is consistent
+    # across the start/finish line.
+    speed = limit.copy()
+    count = len(speed)
+    for _ in range(2):
+        for idx in range(1, count + 1):
+            prev = speed[idx - 1]
+            accel = _DRIVE_ACCEL * max(0.05, 1.0 - (prev / _TOP_SPEED) ** 2)
+            cap = np.sqrt(prev * prev + 2.0 * accel * step[idx - 1])
+            speed[idx % count] = min(speed[idx % count], cap)
+        for idx in range(count - 1, -1, -1):
+            nxt = speed[(idx + 1) % count]
+            cap = np.sqrt(nxt * nxt + 2.0 * _BRAKE_DECEL * step[idx])
+            speed[idx] = min(speed[idx], cap)
+    return speed
+
+
+def _build_laps(rng, entry, grid_slot, lap_count, track, session, race_like):
+    number, abbreviation, _, _, team_index = entry
+    team_name = SYNTHETIC_TEAMS[team_index][0]
+
+    # Pace: team and driver offsets, tyre wear, fuel burn and lap noise as
+    # multiplicative factors on the ideal lap.
+    base = 1.0 + 0.0022 * team_index + 0.0012 * (grid_slot % 2) + rng.normal(0.0, 0.0008)
+    lap_numbers = np.arange(1, lap_count + 1)
+    pit_lap = lap_count // 2 if race_like and lap_count >= 6 else None
+    stint = np.ones(lap_count, dtype=int)
+    tyre_life = lap_numbers.astype(float)
+    if pit_lap is not None:
+        stint[pit_lap:] = 2
+        tyre_life[pit_lap:] -= pit_lap
+    fuel = 0.0009 * (lap_count - lap_numbers) if race_like else np.zeros(lap_count)
+    factors = base * (1.0 + 0.0006 * tyre_life + fuel + rng.normal(0.0, 0.0015, lap_count))
+
+    lap_seconds = track["lap_seconds"] * factors
+    if race_like:
+        lap_seconds[0] += 2.5 + 0.35 * grid_slot
+    if pit_lap is not None:
+        lap_seconds[pit_lap - 1] += 9.0
+        lap_seconds[pit_lap] += 12.0
+
+    end_seconds = session._session_start_time.total_seconds() + np.cumsum(lap_seconds)
+    start_seconds = end_seconds - lap_seconds
+    thirds = [track["length"] / 3.0, 2.0 * track["length"] / 3.0]
+    split = np.interp(thirds, track["distance"], track["seconds"]) / track["lap_seconds"]
+    sector_1 = lap_seconds * split[0]
+    sector_2 = lap_seconds * (split[1] - split[0])
+    sector_3 = lap_seconds - sector_1 - sector_2
+
+    deleted = rng.random(lap_count) < 0.03
+    pit_in = np.full(lap_count, np.nan)
+    pit_out = np.full(lap_count, np.nan)
+    if pit_lap is not None:
+        pit_in[pit_lap - 1] = end_seconds[pit_lap - 1] - 1.0
+        pit_out[pit_lap] = start_seconds[pit_lap] + 4.0
+
+    clean = ~deleted & np.isnan(pit_in) & np.isnan(pit_out)
+    if race_like:
+        clean[0] = False
+    personal_best = np.zeros(lap_count, dtype=bool)
+    best = np.inf
+    for idx in np.flatnonzero(clean):
+        if lap_seconds[idx] < best:
+            best = lap_seconds[idx]
+            personal_best[idx] = True
+
+    speed_trap = float(np.max(track["speed"]) * 3.6)
+    compounds = np.where(stint == 1, "MEDIUM", "HARD") if race_like else np.full(lap_count, "SOFT")
+
+    frame = pd.DataFrame(
+        {
+            "Time": _seconds(end_seconds),
+            "Driver": abbreviation,
+            "DriverNumber": number,
+            "LapTime": _seconds(lap_seconds),
+            "LapNumber": lap_numbers.astype(float),
+            "Stint": stint.astype(float),
+            "PitOutTime": _seconds(pit_out),
+            "PitInTime": _seconds(pit_in),
+            "Sector1Time": _seconds(sector_1),
+            "Sector2Time": _seconds(sector_2),
+            "Sector3Time": _seconds(sector_3),
+            "Sector1SessionTime": _seconds(start_seconds + sector_1),
+            "Sector2SessionTime": _seconds(start_seconds + sector_1 + sector_2),
+            "Sector3SessionTime": _seconds(end_seconds),
+            "SpeedI1": np.round(speed_trap * 0.9 / factors, 1),
+            "SpeedI2": np.round(speed_trap * 0.85 / factors, 1),
+            "SpeedFL": np.round(speed_trap * 0.95 / factors, 1),
+            "SpeedST": np.round(speed_trap / factors, 1),
+            "IsPersonalBest": personal_best,
+            "Compound": compounds,
+            "TyreLife": tyre_life,
+            "FreshTyre": True,
+            "Team": team_name,
+            "LapStartTime": _seconds(start_seconds),
+            "LapStartDate": session._t0_date + _seconds(start_seconds),
+            "TrackStatus": "1",
+            "Position": np.nan,
+            "Deleted": deleted,
+            "DeletedReason": np.where(deleted, "TRACK LIMITS", ""),
+            "FastF1Generated": False,
+            "IsAccurate": clean,
+        }
+    )
+    return frame, lap_seconds / track["lap_seconds"]
+
+
+def _sample_times(rng, end, hz):
+    # Jittered timestamps like the live feed, from session time 0 until a
+    # little after the last lap.
+    count = int(end * hz)
+    times = (np.arange(count) + rng.uniform(-0.3, 0.3, count)) / hz
+    return np.unique(np.round(np.clip(times, 0.0, None), 3))
+
+
+def _build_telemetry(rng, track, lap_frame, lap_factors, session, car_times, pos_times):
+    lap_start = lap_frame["LapStartTime"].dt.total_seconds().to_numpy()
+    lap_end = lap_frame["Time"].dt.total_seconds().to_numpy()
+
+    def _track_state(times):
+        lap_idx = np.clip(np.searchsorted(lap_end, times, side="right"), 0, len(lap_end) - 1)
+        elapsed = np.clip(times - lap_start[lap_idx], 0.0, None) / lap_factors[lap_idx]
+        elapsed = np.mod(elapsed, track["lap_seconds"])
+        point = np.interp(elapsed, track["seconds"], np.arange(_TRACK_POINTS))
+        return np.mod(np.rint(point).astype(int), _TRACK_POINTS), lap_factors[lap_idx]
+
+    point, factor = _track_state(car_times)
+    speed = track["speed"][point] / factor
+    accel = track["accel"][point]
+    braking = accel < -8.0
+    throttle = np.where(
+        braking,
+        0.0,
+        np.where(accel > 1.0, 100.0, np.clip(55.0 + 45.0 * speed / _TOP_SPEED, 0.0, 100.0)),
+    )
+    throttle = np.clip(np.round(throttle + rng.normal(0.0, 1.5, len(throttle))), 0, 100)
+    throttle[braking] = 0
+    gear = np.clip(np.searchsorted(_GEAR_SPEEDS, speed, side="right"), 1, 8)
+    lower = _GEAR_SPEEDS[gear - 1]
+    upper = np.append(_GEAR_SPEEDS[1:], _TOP_SPEED * 1.05)[gear - 1]
+    rpm = 9500.0 + 2300.0 * (speed - lower) / (upper - lower) + rng.normal(0.0, 60.0, len(speed))
+    drs = np.where((speed > 0.92 * _TOP_SPEED) & (accel >= 0.0), 12, 0)
+
+    car_time = _seconds(car_times)
+    car = pd.DataFrame(
+        {
+            "Date": session._t0_date + car_time,
+            "RPM": np.round(rpm),
+            "Speed": np.round(speed * 3.6),
+            "nGear": gear.astype(np.int64),
+            "Throttle": throttle,
+            "Brake": braking,
+            "DRS": drs.astype(np.int64),
+            "Source": "car",
+            "Time": car_time,
+            "SessionTime": car_time,
+        }
+    )
+
+    point, _ = _track_state(pos_times)
+    pos_time = _seconds(pos_times)
+    pos = pd.DataFrame(
+        {
+            "Date": session._t0_date + pos_time,
+            "Status": "OnTrack",
+            # Position feed units are 1/10 m.
+            "X": np.round(track["x"][point] * 10.0),
+            "Y": np.round(track["y"][point] * 10.0),
+            "Z": np.round(rng.normal(0.0, 5.0, len(point))),
+            "Source": "pos",
+            "Time": pos_time,
+            "SessionTime": pos_time,
+        }
+    )
+    return car, pos
+
+
+def _assign_race_positions(lap_frame):
+    # Running order after each lap is the order of crossing the line.
+    order = lap_frame.groupby("LapNumber")["Time"].rank(method="first")
+    lap_frame["Position"] = order.astype(float)
+
+
+def _build_results(entries, lap_frame, race_like):
+    finish = lap_frame.groupby("DriverNumber")["Time"].max()
+    best = lap_frame[lap_frame["IsAccurate"]].groupby("DriverNumber")["LapTime"].min()
+    ranking = (finish if race_like else best.reindex(finish.index)).sort_values()
+    position = {number: float(rank) for rank, number in enumerate(ranking.index, start=1)}
+    leader_time = finish.min()
+
+    rows = []
+    for grid_slot, (number, abbreviation, first_name, last_name, team_index) in enumerate(entries, start=1):
+        team_name, team_color = SYNTHETIC_TEAMS[team_index]
+        place = position.get(number, np.nan)
+        if race_like:
+            race_time = finish[number] - (pd.Timedelta(0) if place == 1 else leader_time)
+            points = float(RACE_POINTS[int(place) - 1]) if place <= len(RACE_POINTS) else 0.0
+        else:
+            race_time = pd.NaT
+            points = np.nan
+        rows.append(
+            {
+                "DriverNumber": number,
+                "BroadcastName": f"{first_name[0]} {last_name.upper()}",
+                "Abbreviation": abbreviation,
+                "DriverId": last_name.lower(),
+                "TeamName": team_name,
+                "TeamColor": team_color,
+                "TeamId": team_name.lower().replace(" ", "_"),
+                "FirstName": first_name,
+                "LastName": last_name,
+                "FullName": f"{first_name} {last_name}",
+                "HeadshotUrl": "",
+                "CountryCode": "",
+                "Position": place,
+                "ClassifiedPosition": str(int(place)) if pd.notna(place) else "",
+                "GridPosition": float(grid_slot) if race_like else np.nan,
+                "Q1": pd.NaT,
+                "Q2": pd.NaT,
+                "Q3": pd.NaT,
+                "Time": race_time,
+                "Status": "Finished" if race_like else "",
+                "Points": points,
+                "Laps": float((lap_frame["DriverNumber"] == number).sum()),
+            }
+        )
+
+    results = pd.DataFrame(rows)
+    results.index = results["DriverNumber"].to_numpy()
+    return results.sort_values("Position")
+
+
+def _seconds(values):
+    return pd.to_timedelta(np.asarray(values, dtype=float), unit="s").round("ms")
@@ -0,0 +1,253 @@
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+# Bump when the on-disk layout changes; older stores are rewritten.
+TELEMETRY_STORE_FORMAT_VERSION = 1
+
+_SOURCES = ("car", "pos")
+_META_FILE = "meta.json"
+
+
+def has_session_telemetry(directory):
+    """
+    Returns True when directory holds a complete store of the current format.
+    """
+    meta = _read_meta(directory)
+    return meta is not None
+
+
+def write_session_telemetry(session, directory):
+    """
+    Writes each driver's car and position channels as one contiguous .npy
+    file per channel. The store is assembled in a temporary directory and
+    renamed into place, so readers never see a partial store.
+    """
+    tmp_dir = f"{directory}.{os.getpid()}.{threading.get_ident()}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    t0_date = getattr(session, "_t0_date", None)
+    meta = {
+        "format": TELEMETRY_STORE_FORMAT_VERSION,
+        "t0_date": pd.Timestamp(t0_date).isoformat() if t0_date is not None else None,
+        "car": {},
+        "pos": {},
+    }
+    try:
+        os.makedirs(tmp_dir)
+        for source in _SOURCES:
+            for driver, frame in getattr(session, f"_{source}_data", {}).items():
+                driver_dir = os.path.join(tmp_dir, source, str(driver))
+                os.makedirs(driver_dir, exist_ok=True)
+                meta[source][str(driver)] = {
+                    "rows": int(len(frame)),
+                    "columns": [
+                        _write_channel(driver_dir, position, frame[column])
+                        for position, column in enumerate(frame.columns)
+                    ],
+                }
+
+        with open(os.path.join(tmp_dir, _META_FILE), "w", encoding="utf-8") as handle:
+            json.dump(meta, handle)
+
+        if os.path.isdir(directory) and not has_session_telemetry(directory):
+            # Store left behind by an older format.
+            shutil.rmtree(directory, ignore_errors=True)
+        try:
+            os.replace(tmp_dir, directory)
+        except OSError:
+            # Another worker published the same store first.
+            if not has_session_telemetry(directory):
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return directory
+
+
+class LazyTelemetry(dict):
+    """
+    Per-driver car or position data, keyed by driver number, whose frames
+    are produced by loader(driver) on first access and kept. Lookups, get()
+    and `in` load a single driver; iterating, len() and items() load all.
+    Drivers the loader returns None for are treated as absent.
+
+    A loader may fill several drivers at once through put(); it runs under
+    the lock, which LazyTelemetry objects of one session can share.
+    """
+
+    def __init__(self, drivers, loader, lock=None):
+        super().__init__()
+        self._drivers = [str(driver) for driver in drivers]
+        self._loader = loader
+        self._lock = lock if lock is not None else threading.RLock()
+        self._absent = set()
+        self._transforms = []
+
+    def __missing__(self, driver):
+        with self._lock:
+            if dict.__contains__(self, driver):
+                return dict.__getitem__(self, driver)
+            if driver not in self._drivers or driver in self._absent:
+                raise KeyError(driver)
+            frame = self._loader(driver)
+            if not dict.__contains__(self, driver):
+                if frame is None:
+                    self._absent.add(driver)
+                    raise KeyError(driver)
+                self.put(driver, frame)
+            return dict.__getitem__(self, driver)
+
+    def get(self, driver, default=None):
+        try:
+            return self[driver]
+        except KeyError:
+            return default
+
+    def __contains__(self, driver):
+        return self.get(driver) is not None
+
+    def __bool__(self):
+        return bool(self._drivers)
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        self._load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._load_all()
+        return dict.values(self)
+
+    def items(self):
+        self._load_all()
+        return dict.items(self)
+
+    def loaded_drivers(self):
+        return list(dict.keys(self))
+
+    def put(self, driver, frame):
+        for transform in self._transforms:
+            frame = transform(frame)
+        dict.__setitem__(self, str(driver), frame)
+
+    def add_transform(self, transform):
+        """
+        Applies transform to the frames loaded so far and to every frame
+        loaded later.
+        """
+        with self._lock:
+            self._transforms.append(transform)
+            for driver, frame in list(dict.items(self)):
+                dict.__setitem__(self, driver, transform(frame))
+
+    def _load_all(self):
+        for driver in self._drivers:
+            self.get(driver)
+
+
+def map_session_telemetry(session, directory, lazy=False):
+    """
+    Replaces the session's car and position data with Telemetry frames whose
+    numeric and time channels are read-only memory-mapped views of the store,
+    so every process mapping the same session shares the same pages. With
+    lazy, each driver's frames are only built on first access (see
+    LazyTelemetry). Returns False when no usable store exists.
+    """
+    meta = _read_meta(directory)
+    if meta is None:
+        return False
+
+    mapped = {}
+    for source in _SOURCES:
+        specs = meta[source]
+        if lazy:
+            mapped[source] = LazyTelemetry(
+                list(specs),
+                lambda driver, source=source, specs=specs: _map_driver(session, directory, source, driver, specs[driver]),
+            )
+        else:
+            mapped[source] = {
+                driver: _map_driver(session, directory, source, driver, spec)
+                for driver, spec in specs.items()
+            }
+
+    session._t0_date = pd.Timestamp(meta["t0_date"]) if meta.get("t0_date") else None
+    session._car_data = mapped["car"]
+    session._pos_data = mapped["pos"]
+    return True
+
+
+def _map_driver(session, directory, source, driver, spec):
+    from fastf1.core import Telemetry
+
+    driver_dir = os.path.join(directory, source, driver)
+    columns = {
+        column["name"]: _read_channel(driver_dir, column)
+        for column in spec["columns"]
+    }
+    frame = pd.DataFrame(columns, copy=False)
+    return Telemetry(frame, session=session, driver=driver)
+
+
+def channel_view(frame, channel, dtype=None):
+    """
+    Returns a channel as a NumPy array without copying when dtype is None or
+    matches the stored dtype; memory-mapped channels stay shared between
+    processes. Any other dtype copies the whole channel. Only the lap feature
+    table reads channels this way: figure builders slice laps through FastF1,
+    whose Telemetry merges copy the samples they return.
+    """
+    values = frame[channel].to_numpy()
+    if dtype is not None and values.dtype != dtype:
+        values = values.astype(dtype)
+    return values
+
+
+def _write_channel(driver_dir, position, values):
+    filename = f"{position}.npy"
+    spec = {"name": values.name, "file": filename, "dtype": str(values.dtype)}
+
+    dtype = values.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+        spec["kind"] = "array"
+        np.save(os.path.join(driver_dir, filename), np.ascontiguousarray(values.to_numpy()))
+    else:
+        # Status/Source labels cannot be mapped; store codes + categories.
+        codes, categories = pd.factorize(values, use_na_sentinel=True)
+        spec["kind"] = "labels"
+        spec["categories"] = [str(category) for category in categories]
+        np.save(os.path.join(driver_dir, filename), codes.astype(np.int32))
+    return spec
+
+
+def _read_channel(driver_dir, spec):
+    values = np.load(os.path.join(driver_dir, spec["file"]), mmap_mode="r")
+    if spec["kind"] == "array":
+        # Plain ndarray view over the mapping, so pandas results don't
+        # inherit the memmap subclass.
+        return values.view(np.ndarray)
+
+    categories = np.array(spec["categories"] + [None], dtype=object)
+    # Code -1 (missing) indexes the trailing None.
+    return categories[np.asarray(values)]
+
+
+def _read_meta(directory):
+    try:
+        with open(os.path.join(directory, _META_FILE), "r", encoding="utf-8") as handle:
+            meta = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format") != TELEMETRY_STORE_FORMAT_VERSION:
+        return None
+    return meta
@@ -0,0 +1,29 @@
+import pandas as pd
+
+import data_engine
+from data_engine import _defer_fastf1_telemetry, _telemetry_path, wait_for_session_writes
+from synthetic_session import make_synthetic_session
+from telemetry_store import has_session_telemetry
+
+
+def test_lazy_parse_leaves_a_telemetry_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_engine, "TELEMETRY_DIR", str(tmp_path / "_telemetry"))
+    monkeypatch.setattr(data_engine, "TELEMETRY_MMAP_ENABLED", True)
+
+    key, slim = (2024, 0, 5), True
+    session = make_synthetic_session(drivers=3, laps=3, seed=1, session_name="Race", year=2024)
+    car_data, pos_data = dict(session._car_data), dict(session._pos_data)
+
+    def _load_telemetry(parsed):
+        # Stands in for FastF1's all-driver parse, which needs the live API.
+        parsed._car_data = dict(car_data)
+        parsed._pos_data = dict(pos_data)
+        parsed._t0_date = pd.Timestamp("2024-03-02 12:00")
+
+    monkeypatch.setattr(type(session), "_load_telemetry", _load_telemetry)
+    _defer_fastf1_telemetry(session, key, slim)
+
+    assert not session.car_data[session.drivers[0]].empty
+    wait_for_session_writes()
+
+    assert has_session_telemetry(_telemetry_path(key, slim))
@@ -0,0 +1,332 @@
+# tracing.py
+"""
+Lightweight per-request span tracing.
+
+Each instrumented callback runs inside a trace; code anywhere below it (data
+engine, services, figures) opens nested spans with
+
+    with span("prepare_telemetry", driver=drv) as current:
+        ...
+        current.set(rows=len(tel))
+
+Spans opened outside a trace cost one context-variable lookup and record
+nothing. Work handed to services.parallel_service.map_drivers keeps its
+parent span, since the caller's context is copied into the pool thread.
+Finished traces are kept in memory and served as Chrome trace-event JSON
+(chrome://tracing, Perfetto) on /_f1d/traces/<trace id>.
+"""
+import contextvars
+import functools
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+TRACING_ENABLED = os.environ.get("F1D_TRACING", "1") != "0"
+
+# Finished traces kept for export, oldest dropped first.
+TRACE_HISTORY = int(os.environ.get("F1D_TRACE_HISTORY", "50"))
+
+TRACE_ROUTE = "/_f1d/traces"
+
+_CURRENT_TRACE = contextvars.ContextVar("f1d_trace", default=None)
+_CURRENT_SPAN = contextvars.ContextVar("f1d_span", default=None)
+
+_RECENT_TRACES = OrderedDict()
+_RECENT_LOCK = threading.Lock()
+
+
+class Span:
+    """
+    One timed section. start/end are seconds since the trace started.
+    """
+
+    __slots__ = ("name", "start", "end", "depth", "thread", "attrs")
+
+    def __init__(self, name, start, depth, thread, attrs):
+        self.name = name
+        self.start = start
+        self.end = None
+        self.depth = depth
+        self.thread = thread
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+        return self
+
+    @property
+    def duration(self):
+        return None if self.end is None else self.end - self.start
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def set(self, **attrs):
+        return self
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Trace:
+    """
+    The spans recorded while handling one request.
+    """
+
+    def __init__(self, name):
+        self.id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.started_at = time.time()
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self.spans = []
+
+    def now(self):
+        return time.perf_counter() - self._origin
+
+    def add_span(self, name, start, end, depth=1, **attrs):
+        """
+        Records an already-finished span, e.g. work measured after the
+        callback returned.
+        """
+        recorded = Span(name, start, depth, threading.get_ident(), attrs)
+        recorded.end = end
+        with self._lock:
+            self.spans.append(recorded)
+        return recorded
+
+    def _open(self, name, depth, attrs):
+        opened = Span(name, self.now(), depth, threading.get_ident(), attrs)
+        with self._lock:
+            self.spans.append(opened)
+        return opened
+
+    def ordered_spans(self):
+        with self._lock:
+            return sorted(self.spans, key=lambda item: (item.start, item.depth))
+
+    def waterfall(self, width=32):
+        """
+        Returns the spans as text lines: start offset, duration, a bar placed
+        on the trace timeline, and the indented span name with attributes.
+        Spans still running are drawn up to now.
+        """
+        spans = self.ordered_spans()
+        if not spans:
+            return []
+        now = self.now()
+        total = max((item.end if item.end is not None else now) for item in spans) or 1e-9
+
+        lines = [f"{'start':>9} {'ms':>9}  {'timeline':<{width}}  span"]
+        for item in spans:
+            end = item.end if item.end is not None else now
+            first = min(width - 1, int(item.start / total * width))
+            last = max(first + 1, int(round(end / total * width)))
+            bar = " " * first + "#" * (last - first)
+            attrs = " ".join(f"{key}={value}" for key, value in item.attrs.items())
+            label = "  " * item.depth + item.name + (f" [{attrs}]" if attrs else "")
+            running = "" if item.end is not None else " (running)"
+            lines.append(
+                f"{item.start * 1000:>9.1f} {(end - item.start) * 1000:>9.1f}  {bar:<{width}}  {label}{running}"
+            )
+        return lines
+
+    def to_chrome(self):
+        """
+        Returns the trace as Chrome trace-event JSON (complete "X" events).
+        """
+        pid = os.getpid()
+        spans = self.ordered_spans()
+        thread_ids = {}
+        for item in spans:
+            thread_ids.setdefault(item.thread, len(thread_ids) + 1)
+
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": f"thread-{tid}"}}
+            for tid in thread_ids.values()
+        ]
+        now = self.now()
+        for item in spans:
+            end = item.end if item.end is not None else now
+            events.append(
+                {
+                    "name": item.name,
+                    "cat": self.name,
+                    "ph": "X",
+                    "ts": round(item.start * 1e6, 1),
+                    "dur": round((end - item.start) * 1e6, 1),
+                    "pid": pid,
+                    "tid": thread_ids[item.thread],
+                    "args": {key: _json_value(value) for key, value in item.attrs.items()},
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": self.id, "name": self.name, "started_at": self.started_at},
+        }
+
+
+@contextmanager
+def span(name, **attrs):
+    """
+    Times the enclosed block as a child of the current span. Yields the span
+    so attributes such as row counts can be added once known.
+    """
+    trace = _CURRENT_TRACE.get()
+    if trace is None:
+        yield _NULL_SPAN
+        return
+
+    parent = _CURRENT_SPAN.get()
+    opened = trace._open(name, 0 if parent is None else parent.depth + 1, attrs)
+    token = _CURRENT_SPAN.set(opened)
+    try:
+        yield opened
+    finally:
+        opened.end = trace.now()
+        _CURRENT_SPAN.reset(token)
+
+
+def traced(name=None):
+    """
+    Decorator form of span, named after the function by default.
+    """
+
+    def decorate(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+@contextmanager
+def start_trace(name):
+    """
+    Runs the enclosed block as a new trace whose root span is name. The
+    trace is kept for export once the block exits.
+    """
+    if not TRACING_ENABLED:
+        yield None
+        return
+
+    trace = Trace(name)
+    trace_token = _CURRENT_TRACE.set(trace)
+    try:
+        with span(name):
+            yield trace
+    finally:
+        _CURRENT_TRACE.reset(trace_token)
+        _remember_trace(trace)
+
+
+def current_trace():
+    return _CURRENT_TRACE.get()
+
+
+def get_trace(trace_id):
+    with _RECENT_LOCK:
+        return _RECENT_TRACES.get(trace_id)
+
+
+def latest_trace(name=None):
+    with _RECENT_LOCK:
+        for trace in reversed(_RECENT_TRACES.values()):
+            if name is None or trace.name == name:
+                return trace
+    return None
+
+
+def trace_url(trace):
+    return f"{TRACE_ROUTE}/{trace.id}"
+
+
+def install_tracing(app):
+    """
+    Runs callbacks registered on app from now on inside a trace, records the
+    time Dash spends serialising each response, and serves traces as Chrome
+    trace-event JSON on TRACE_ROUTE/<trace id> (or TRACE_ROUTE/latest).
+    """
+    if not TRACING_ENABLED:
+        return app
+
+    register = app.callback
+
+    def callback(*args, **kwargs):
+        decorator = register(*args, **kwargs)
+
+        def wrap(fn):
+            return decorator(_traced_callback(fn))
+
+        return wrap
+
+    app.callback = callback
+    app.server.after_request(_record_serialisation)
+    app.server.add_url_rule(f"{TRACE_ROUTE}/<trace_id>", "f1d_trace", _trace_view)
+    return app
+
+
+def _traced_callback(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with start_trace(fn.__name__) as trace:
+            _remember_request_trace(trace)
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _remember_request_trace(trace):
+    from flask import g, has_request_context
+
+    if trace is not None and has_request_context():
+        g.f1d_trace = trace
+
+
+def _record_serialisation(response):
+    from flask import g
+
+    trace = g.pop("f1d_trace", None)
+    if trace is None:
+        return response
+
+    spans = trace.ordered_spans()
+    returned = max((item.end for item in spans if item.end is not None), default=0.0)
+    size = None if response.direct_passthrough else len(response.get_data())
+    trace.add_span("dash.serialize_response", returned, trace.now(), depth=0, bytes=size)
+    return response
+
+
+def _trace_view(trace_id):
+    from flask import abort, jsonify
+
+    trace = latest_trace() if trace_id == "latest" else get_trace(trace_id)
+    if trace is None:
+        abort(404)
+    response = jsonify(trace.to_chrome())
+    response.headers["Content-Disposition"] = f'attachment; filename="trace-{trace.id}.json"'
+    return response
+
+
+def _remember_trace(trace):
+    with _RECENT_LOCK:
+        _RECENT_TRACES[trace.id] = trace
+        while len(_RECENT_TRACES) > max(1, TRACE_HISTORY):
+            _RECENT_TRACES.popitem(last=False)
+
+
+def _json_value(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
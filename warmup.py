@@ -0,0 +1,191 @@
+# warmup.py
+"""
+Pre-populates the session caches so the first dashboard user of the day does
+not pay cold-load latency.
+
+    python warmup.py --years 2024 2025
+    python warmup.py --years 2025 --events 0 3 --sessions 4 5 --workers 3
+
+Events are indices into the supported schedule and sessions are session
+numbers, matching the dashboard dropdown values.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+
+WARMUP_STAGES = [
+    "load",
+    "telemetry_parse",
+    "track_geometry",
+    "lap_features",
+    "lap_telemetry",
+    "snapshot",
+    "telemetry_store",
+]
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Warm F1 dashboard session caches.")
+    parser.add_argument("--years", type=int, nargs="+", required=True)
+    parser.add_argument(
+        "--events",
+        type=int,
+        nargs="+",
+        help="Supported-schedule event indices (default: every event)",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        nargs="+",
+        help="Session numbers 1-5 (default: every session of the event)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("F1D_WARMUP_WORKERS", "2")),
+        help="Number of worker processes",
+    )
+    parser.add_argument(
+        "--no-telemetry",
+        action="store_true",
+        help="Load timing data only and skip telemetry-derived data",
+    )
+    return parser.parse_args(argv)
+
+
+def _plan_sessions(years, events=None, sessions=None):
+    from data_engine import write_schedule_index
+
+    plan = []
+    for year in years:
+        schedule = write_schedule_index(year)
+        for event_index, event in schedule.iterrows():
+            if events is not None and event_index not in events:
+                continue
+            for session_number in range(1, 6):
+                if sessions is not None and session_number not in sessions:
+                    continue
+                session_name = event.get(f"Session{session_number}")
+                if session_name is None or pd.isna(session_name) or not str(session_name):
+                    continue
+                plan.append((year, int(event_index), session_number, str(event["EventName"]), str(session_name)))
+    return plan
+
+
+def _warm_session(year, event_index, session_number, telemetry):
+    # Runs in a worker process: imports stay local so the parent only pays
+    # for what planning needs.
+    from data_engine import load_session, parse_deferred_telemetry, wait_for_session_writes
+
+    timings = {}
+
+    started = time.perf_counter()
+    session = load_session(year, event_index, session_number, telemetry=telemetry)
+    timings["load"] = time.perf_counter() - started
+
+    if telemetry:
+        # A lazy FastF1 load defers the telemetry parse, and with it the
+        # channel store write; run it now so the store is always written.
+        started = time.perf_counter()
+        parse_deferred_telemetry(session)
+        timings["telemetry_parse"] = time.perf_counter() - started
+        _warm_derived(session, timings)
+
+    # Snapshots and the channel store are written by background tasks;
+    # finish them before the worker process can be torn down.
+    started = time.perf_counter()
+    wait_for_session_writes(kinds=("snapshot",))
+    timings["snapshot"] = time.perf_counter() - started
+    started = time.perf_counter()
+    wait_for_session_writes(kinds=("telemetry",))
+    timings["telemetry_store"] = time.perf_counter() - started
+    return timings
+
+
+def _warm_derived(session, timings):
+    from services.lap_feature_service import get_lap_feature_table
+    from services.lap_index_service import get_lap_index
+    from services.telemetry_service import get_fastest_laps, get_prepared_telemetry
+    from services.track_geometry_service import get_track_geometry
+
+    started = time.perf_counter()
+    get_track_geometry(session)
+    timings["track_geometry"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    get_lap_feature_table(session)
+    timings["lap_features"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for driver, lap in get_fastest_laps(session, list(session.drivers)).items():
+        tel = get_prepared_telemetry(session, driver, lap)
+        get_lap_index(session, driver, lap["LapNumber"], telemetry=tel)
+    timings["lap_telemetry"] = time.perf_counter() - started
+
+
+def _print_summary(stage_totals, completed, failed, elapsed):
+    rate = completed / (elapsed / 60.0) if elapsed > 0 else 0.0
+    print()
+    print(f"Warmed {completed} session(s), {failed} failed, in {elapsed:.1f}s ({rate:.2f} sessions/min)")
+    if not completed:
+        return
+    print(f"{'stage':<16}{'total s':>10}{'mean s':>10}")
+    for stage in WARMUP_STAGES:
+        values = stage_totals.get(stage)
+        if not values:
+            continue
+        print(f"{stage:<16}{sum(values):>10.2f}{sum(values) / len(values):>10.2f}")
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    plan = _plan_sessions(args.years, args.events, args.sessions)
+    if not plan:
+        print("Nothing to warm for the given selection.")
+        return 0
+
+    telemetry = not args.no_telemetry
+    workers = max(1, args.workers)
+    print(f"Warming {len(plan)} session(s) with {workers} worker(s)")
+
+    stage_totals = {}
+    completed = 0
+    failed = 0
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_warm_session, year, event_index, session_number, telemetry): (
+                year,
+                event_name,
+                session_name,
+            )
+            for year, event_index, session_number, event_name, session_name in plan
+        }
+        for future in as_completed(futures):
+            year, event_name, session_name = futures[future]
+            label = f"{year} {event_name} - {session_name}"
+            try:
+                timings = future.result()
+            except Exception as exc:
+                failed += 1
+                print(f"  FAILED {label}: {exc}")
+                continue
+
+            completed += 1
+            for stage, seconds in timings.items():
+                stage_totals.setdefault(stage, []).append(seconds)
+            detail = ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in timings.items())
+            print(f"  {label}: {detail}")
+
+    _print_summary(stage_totals, completed, failed, time.perf_counter() - started)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())